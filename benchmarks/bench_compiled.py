@@ -0,0 +1,101 @@
+"""
+generated serializers against the attribute walk of `Model.serialize`
+
+    python -m benchmarks.bench_compiled
+
+`serialize` and `from_raw_data` time the model layer alone, `batch_write` an
+ingest through the in-memory backend.
+"""
+import timeit
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+
+from pynamodb.attributes import BooleanAttribute, NumberAttribute, UnicodeAttribute
+from ulid import ULID
+
+from pynamodb_templates.attributes import (
+    EnumNameAttribute,
+    IndexableBooleanAttribute,
+    UnicodeEnumAttribute,
+    UnicodeULIDAttribute,
+    UnicodeUTCDatetimeAttribute,
+)
+from pynamodb_templates.memory import MemoryDynamoDB
+from pynamodb_templates.models import TimeTrackedModel
+
+ITEMS = 2000
+NUMBER = 5
+
+
+class Status(Enum):
+    active = "active"
+    closed = "closed"
+
+
+class BenchModel(TimeTrackedModel):
+    class Meta:
+        table_name = "bench"
+
+    hash = UnicodeAttribute(hash_key=True)
+    range = NumberAttribute(range_key=True)
+    name = UnicodeAttribute(null=True)
+    description = UnicodeAttribute(null=True)
+    count = NumberAttribute(null=True)
+    enabled = BooleanAttribute(null=True)
+    status = UnicodeEnumAttribute(Status, null=True)
+    kind = EnumNameAttribute(Status, null=True)
+    flagged = IndexableBooleanAttribute(null=True)
+    ulid = UnicodeULIDAttribute(null=True)
+    closed_at = UnicodeUTCDatetimeAttribute(null=True)
+
+
+class CompiledModel(BenchModel):
+    compiled = True
+
+
+def items(model):
+    at = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    return [
+        model(
+            "a",
+            i,
+            name=f"name {i}",
+            description="x" * 50,
+            count=i,
+            enabled=i % 2 == 0,
+            status=Status.active,
+            kind=Status.closed,
+            flagged=True,
+            ulid=ULID(),
+            closed_at=at + timedelta(seconds=i),
+        )
+        for i in range(ITEMS)
+    ]
+
+
+def bench(name, fn):
+    elapsed = timeit.timeit(fn, number=NUMBER) / NUMBER
+    print(f"{name:<32} {elapsed / ITEMS * 1e6:8.2f} us/item")
+
+
+def main():
+    dynamodb = MemoryDynamoDB()
+    with dynamodb.connect(BenchModel, CompiledModel):
+        BenchModel.create_table(billing_mode="PAY_PER_REQUEST")
+        for model in (BenchModel, CompiledModel):
+            name = "compiled" if model.compiled else "attribute walk"
+            written = items(model)
+            page = [item.serialize() for item in written]
+
+            def batch_write():
+                with model.batch_write() as batch:
+                    for item in written:
+                        batch.save(item)
+
+            bench(f"{name} serialize", lambda: [i.serialize() for i in written])
+            bench(f"{name} from_raw_data", lambda: list(map(model.from_raw_data, page)))
+            bench(f"{name} batch_write", batch_write)
+
+
+if __name__ == "__main__":
+    main()
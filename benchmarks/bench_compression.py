@@ -0,0 +1,90 @@
+"""
+item size against CPU cost of CompressedJSONAttribute, DynamicMapAttribute as baseline
+
+    python -m benchmarks.bench_compression
+
+Sizes are the billed item sizes (attribute names plus values), write capacity
+units are counted per started KB.
+"""
+import json
+import random
+import timeit
+
+from pynamodb.attributes import DynamicMapAttribute, UnicodeAttribute
+from pynamodb.models import Model
+
+from pynamodb_templates.attributes import CompressedJSONAttribute
+from pynamodb_templates._size import item_size
+
+NUMBER = 200
+CODECS = [("zlib", 1), ("zlib", None), ("zlib", 9), ("lzma", None)]
+
+
+def payload(records):
+    random.seed(records)
+    return {
+        "records": [
+            {
+                "id": i,
+                "name": f"record {i}",
+                "score": round(random.random(), 4),
+                "tags": random.sample(["red", "green", "blue", "large", "small"], 2),
+                "active": i % 3 == 0,
+            }
+            for i in range(records)
+        ]
+    }
+
+
+class MapModel(Model):
+    class Meta:
+        table_name = "map"
+
+    id = UnicodeAttribute(hash_key=True)
+    payload = DynamicMapAttribute()
+
+
+def model(codec, level):
+    class CompressedModel(Model):
+        class Meta:
+            table_name = "compressed"
+
+        id = UnicodeAttribute(hash_key=True)
+        payload = CompressedJSONAttribute(codec=codec, level=level, threshold=0)
+
+    return CompressedModel
+
+
+def row(name, cls, value):
+    item = cls("id", payload=value)
+    serialized = item.serialize()
+    size = item_size(serialized)
+    # a serialized item as read back from DynamoDB
+    raw = {
+        key: {"B": v["B"].encode()} if "B" in v else v for key, v in serialized.items()
+    }
+
+    def read():
+        cls.from_raw_data(raw).payload
+
+    write = timeit.timeit(item.serialize, number=NUMBER) / NUMBER
+    load = timeit.timeit(read, number=NUMBER) / NUMBER
+    units = -(-size // 1024)
+    print(
+        f"{name:<20} {size:>9} B {units:>4} WCU "
+        f"{write * 1e6:>10.1f} us write {load * 1e6:>10.1f} us read"
+    )
+
+
+def main():
+    for records in (10, 200, 2000):
+        value = payload(records)
+        print(f"{records} records, {len(json.dumps(value))} bytes of JSON")
+        row("DynamicMapAttribute", MapModel, value)
+        for codec, level in CODECS:
+            row(f"{codec}(level={level})", model(codec, level), value)
+        print()
+
+
+if __name__ == "__main__":
+    main()
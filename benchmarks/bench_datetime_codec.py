@@ -0,0 +1,94 @@
+"""
+micro-benchmarks of UnicodeUTCDatetimeAttribute against UnicodeDatetimeAttribute
+
+    python -m benchmarks.bench_datetime_codec
+"""
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from pynamodb.attributes import UnicodeAttribute
+
+from pynamodb_templates.attributes import (
+    UnicodeDatetimeAttribute,
+    UnicodeUTCDatetimeAttribute,
+)
+from pynamodb_templates.models import TimeTrackedModel
+from pynamodb_templates.models.time_tracked import utcnow
+
+NUMBER = 200_000
+PAGE = 1000
+PAGES = 50
+
+
+class LegacyModel(TimeTrackedModel):
+    class Meta:
+        table_name = "legacy"
+
+    id = UnicodeAttribute(hash_key=True)
+    created_at = UnicodeDatetimeAttribute(default_for_new=utcnow, force_utc=True)
+    modified_at = UnicodeDatetimeAttribute(default_for_new=utcnow, force_utc=True)
+    deleted_at = UnicodeDatetimeAttribute(null=True, force_utc=True)
+
+
+class FastModel(TimeTrackedModel):
+    class Meta:
+        table_name = "fast"
+
+    id = UnicodeAttribute(hash_key=True)
+
+
+def bench(name, fn, number):
+    elapsed = timeit.timeit(fn, number=number)
+    print(f"{name:<48} {elapsed / number * 1e9:10.1f} ns/op")
+    return elapsed
+
+
+def compare(name, old, new, number=NUMBER):
+    a = bench(f"{name} (legacy)", old, number)
+    b = bench(f"{name} (utc)", new, number)
+    print(f"{'':<48} x{a / b:.2f}")
+
+
+def main():
+    legacy = UnicodeDatetimeAttribute(force_utc=True)
+    fast = UnicodeUTCDatetimeAttribute()
+    now = datetime.now(timezone.utc)
+    serialized = legacy.serialize(now)
+
+    compare("serialize", lambda: legacy.serialize(now), lambda: fast.serialize(now))
+    compare(
+        "deserialize",
+        lambda: legacy.deserialize(serialized),
+        lambda: fast.deserialize(serialized),
+    )
+
+    print()
+    values = [legacy.serialize(now + timedelta(seconds=i)) for i in range(PAGE)]
+    compare(
+        f"deserialize page of {PAGE}",
+        lambda: [legacy.deserialize(v) for v in values],
+        lambda: fast.deserialize_many(values),
+        number=PAGES * 10,
+    )
+
+    print()
+    items = []
+    for i in range(PAGE):
+        modified_at = legacy.serialize(now + timedelta(seconds=i))
+        items.append(
+            {
+                "id": {"S": str(i)},
+                "created_at": {"S": serialized},
+                "modified_at": {"S": modified_at},
+            }
+        )
+    compare(
+        f"from_raw_data page of {PAGE}",
+        lambda: [LegacyModel.from_raw_data(item) for item in items],
+        lambda: [FastModel.from_raw_data(item) for item in items],
+        number=PAGES,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+cold start import time of the packages, each import in a fresh interpreter
+
+    python -m benchmarks.bench_import
+
+`-X importtime` cumulative times of the imports are reported, the median of
+the runs is taken as interpreter start up time is noisy.
+"""
+import statistics
+import subprocess
+import sys
+
+NUMBER = 15
+
+IMPORTS = [
+    "pynamodb.attributes",
+    "pynamodb_templates.attributes",
+    "pynamodb_templates.attributes.UnicodeUTCDatetimeAttribute",
+    "pynamodb_templates.attributes.UnicodeULIDAttribute",
+    "pynamodb_templates.attributes.UnicodeDelimitedTupleAttribute",
+    "pynamodb_templates.models",
+]
+
+
+def import_time(code: str) -> int:
+    """
+    Import time in microseconds of the top level imports done by `code`
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative, imported = line.split("|")
+        # nested imports are indented past the single leading space
+        if not imported.startswith("  "):
+            total += int(cumulative)
+    return total
+
+
+def statement(target: str) -> str:
+    module, _, name = target.rpartition(".")
+    if name[:1].isupper():
+        return f"from {module} import {name}"
+    return f"import {target}"
+
+
+def main():
+    # interpreter start up imports (site, encodings) are measured once and removed
+    baseline = statistics.median(import_time("pass") for _ in range(NUMBER))
+    for target in IMPORTS:
+        code = statement(target)
+        times = [import_time(code) - baseline for _ in range(NUMBER)]
+        print(f"{target:<64} {statistics.median(times) / 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
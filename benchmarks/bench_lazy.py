@@ -0,0 +1,104 @@
+"""
+eager against lazy deserialization of a wide TimeTrackedModel
+
+    python -m benchmarks.bench_lazy
+
+`from_raw_data` times the deserialization of a page alone, `query` a whole query
+on the in-memory backend, both reading two attributes or all of them.
+"""
+import timeit
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+
+from pynamodb.attributes import NumberAttribute, UnicodeAttribute
+from ulid import ULID
+
+from pynamodb_templates.attributes import (
+    UnicodeEnumAttribute,
+    UnicodeULIDAttribute,
+    UnicodeUTCDatetimeAttribute,
+)
+from pynamodb_templates.memory import MemoryDynamoDB
+from pynamodb_templates.models import TimeTrackedModel
+
+ITEMS = 1000
+NUMBER = 5
+FIELDS = 6
+
+
+class Status(Enum):
+    active = "active"
+    closed = "closed"
+
+
+def wide_attributes():
+    attributes = {}
+    for i in range(FIELDS):
+        attributes[f"ulid_{i}"] = UnicodeULIDAttribute(null=True)
+        attributes[f"status_{i}"] = UnicodeEnumAttribute(Status, null=True)
+        attributes[f"at_{i}"] = UnicodeUTCDatetimeAttribute(null=True)
+        attributes[f"name_{i}"] = UnicodeAttribute(null=True)
+    return attributes
+
+
+class EagerModel(TimeTrackedModel):
+    class Meta:
+        table_name = "wide"
+
+    hash = UnicodeAttribute(hash_key=True)
+    range = NumberAttribute(range_key=True)
+    locals().update(wide_attributes())
+
+
+class LazyModel(EagerModel):
+    lazy = True
+
+
+def two(items):
+    for item in items:
+        item.range, item.status_0
+
+
+def every(items):
+    names = list(EagerModel.get_attributes())
+    for item in items:
+        for name in names:
+            getattr(item, name)
+
+
+def bench(name, fn):
+    elapsed = timeit.timeit(fn, number=NUMBER) / NUMBER
+    print(f"{name:<40} {elapsed / ITEMS * 1e6:8.1f} us/item")
+
+
+def main():
+    dynamodb = MemoryDynamoDB()
+    with dynamodb.connect(EagerModel, LazyModel):
+        EagerModel.create_table(billing_mode="PAY_PER_REQUEST")
+        at = datetime(2021, 1, 1, tzinfo=timezone.utc)
+        with EagerModel.batch_write() as batch:
+            for n in range(ITEMS):
+                item = EagerModel("a", n)
+                for i in range(FIELDS):
+                    setattr(item, f"ulid_{i}", ULID())
+                    setattr(item, f"status_{i}", Status.active)
+                    setattr(item, f"at_{i}", at + timedelta(seconds=n * i))
+                    setattr(item, f"name_{i}", f"name {n} {i}")
+                batch.save(item)
+        page = [item.serialize() for item in EagerModel.query("a")]
+        print(f"{ITEMS} items of {len(EagerModel.get_attributes())} attributes")
+        for model in (EagerModel, LazyModel):
+            name = "lazy" if model.lazy else "eager"
+            bench(
+                f"{name} from_raw_data, two attributes",
+                lambda: two(map(model.from_raw_data, page)),
+            )
+            bench(
+                f"{name} from_raw_data, every attribute",
+                lambda: every(map(model.from_raw_data, page)),
+            )
+            bench(f"{name} query, two attributes", lambda: two(model.query("a")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+model level benchmarks of TimeTrackedModel on the in-memory backend
+
+    python -m benchmarks.bench_models
+
+Requests are served in-process, timings are those of the model layer
+(serialization, expressions, pagination) plus the backend itself.
+"""
+import timeit
+
+from pynamodb.attributes import NumberAttribute, UnicodeAttribute
+
+from pynamodb_templates.memory import MemoryDynamoDB
+from pynamodb_templates.models import TimeTrackedModel
+
+ITEMS = 1000
+NUMBER = 5
+
+
+class BenchModel(TimeTrackedModel):
+    class Meta:
+        table_name = "bench"
+
+    hash = UnicodeAttribute(hash_key=True)
+    range = NumberAttribute(range_key=True)
+    value = NumberAttribute(null=True)
+    data = UnicodeAttribute(null=True)
+
+
+def bench(name, fn, items=ITEMS, number=NUMBER):
+    elapsed = timeit.timeit(fn, number=number)
+    print(f"{name:<48} {elapsed / number / items * 1e6:8.1f} us/item")
+    return elapsed
+
+
+def main():
+    dynamodb = MemoryDynamoDB()
+    with dynamodb.connect(BenchModel):
+        BenchModel.create_table(billing_mode="PAY_PER_REQUEST")
+        items = [BenchModel("a", i, value=i, data="x" * 100) for i in range(ITEMS)]
+        keys = [(item.hash, item.range) for item in items]
+
+        def save():
+            for item in items:
+                item.save()
+
+        def batch_write():
+            with BenchModel.batch_write() as batch:
+                for item in items:
+                    batch.save(item)
+
+        def update():
+            for item in items:
+                item.update(actions=[BenchModel.value.add(1)])
+
+        bench("save", save)
+        bench("batch_write", batch_write)
+        bench("update", update)
+        bench("get", lambda: [BenchModel.get(*key) for key in keys])
+        bench("batch_get", lambda: list(BenchModel.batch_get(keys)))
+        bench("query", lambda: list(BenchModel.query("a")))
+        bench("query(pages of 100)", lambda: list(BenchModel.query("a", page_size=100)))
+        bench(
+            "query(filter)",
+            lambda: list(BenchModel.query("a", filter_condition=BenchModel.value > 0)),
+        )
+        bench("scan", lambda: list(BenchModel.scan()))
+        bench("count", lambda: BenchModel.count("a"), items=1)
+        bench("soft delete", lambda: [item.delete() for item in items])
+        print()
+        print(dict(dynamodb.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+micro-benchmarks of the number codec against the former json based mixin
+
+    python -m benchmarks.bench_number_codec
+"""
+import json
+import timeit
+from enum import IntEnum
+
+from ulid import ULID
+
+from pynamodb_templates.attributes import (
+    IndexableBooleanAttribute,
+    InteagerEnumAttribute,
+    NumberULIDAttribute,
+)
+from pynamodb_templates.attributes.serializer import (
+    serialize_number,
+    deserialize_number,
+)
+
+NUMBER = 200_000
+
+
+class Level(IntEnum):
+    low = 0
+    high = 1
+
+
+def _json_serialize(value):
+    return json.dumps(value)
+
+
+def _json_deserialize(value):
+    return json.loads(value)
+
+
+def bench(name, fn, arg, number=NUMBER):
+    elapsed = timeit.timeit(lambda: fn(arg), number=number)
+    print(f"{name:<48} {elapsed / number * 1e9:8.1f} ns/op")
+    return elapsed
+
+
+def compare(name, old, new, arg):
+    a = bench(f"{name} (json)", old, arg)
+    b = bench(f"{name} (codec)", new, arg)
+    print(f"{'':<48} x{a / b:.2f}")
+
+
+def main():
+    ulid = int(ULID())
+
+    compare("serialize int", _json_serialize, serialize_number, 123456)
+    compare("serialize float", _json_serialize, serialize_number, 3.14159)
+    compare("serialize ulid int", _json_serialize, serialize_number, ulid)
+    compare("deserialize int", _json_deserialize, deserialize_number, "123456")
+    compare("deserialize float", _json_deserialize, deserialize_number, "3.14159")
+    compare("deserialize ulid int", _json_deserialize, deserialize_number, str(ulid))
+
+    print()
+    boolean = IndexableBooleanAttribute()
+    enum = InteagerEnumAttribute(enum_type=Level)
+    number_ulid = NumberULIDAttribute()
+    bench("IndexableBooleanAttribute.deserialize", boolean.deserialize, "1")
+    bench("InteagerEnumAttribute.deserialize", enum.deserialize, "1")
+    bench("NumberULIDAttribute.deserialize", number_ulid.deserialize, str(ulid))
+
+
+if __name__ == "__main__":
+    main()
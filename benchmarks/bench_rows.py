@@ -0,0 +1,108 @@
+"""
+memory and speed of `rows` against full TimeTrackedModel instances
+
+    python -m benchmarks.bench_rows
+
+`build` times and `memory` measures (with tracemalloc) building the objects of
+raw items already in memory, `scan` is a whole scan on the in-memory backend,
+where applying the projection of `rows` is a cost of the backend itself.
+"""
+import timeit
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+
+from pynamodb.attributes import NumberAttribute, UnicodeAttribute
+
+from pynamodb_templates.attributes import (
+    UnicodeEnumAttribute,
+    UnicodeUTCDatetimeAttribute,
+)
+from pynamodb_templates.memory import MemoryDynamoDB
+from pynamodb_templates.models import TimeTrackedModel, row_reader
+
+ITEMS = 10_000
+NUMBER = 3
+COLUMNS = ["id", "status", "modified_at"]
+
+
+class Status(Enum):
+    active = "active"
+    closed = "closed"
+
+
+class BenchModel(TimeTrackedModel):
+    class Meta:
+        table_name = "rows"
+
+    id = UnicodeAttribute(hash_key=True)
+    number = NumberAttribute(null=True)
+    name = UnicodeAttribute(null=True)
+    status = UnicodeEnumAttribute(Status, null=True)
+    closed_at = UnicodeUTCDatetimeAttribute(null=True)
+
+
+def allocated(build, page):
+    tracemalloc.start()
+    objects = build(page)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size / len(page)
+
+
+def bench(name, scan, build, page):
+    scanned = timeit.timeit(scan, number=NUMBER) / NUMBER
+    built = timeit.timeit(lambda: build(page), number=NUMBER) / NUMBER
+    print(
+        f"{name:<24} {scanned / ITEMS * 1e6:8.2f} us/item scan "
+        f"{built / ITEMS * 1e6:8.2f} us/item build "
+        f"{allocated(build, page):6.0f} B/item memory"
+    )
+
+
+def main():
+    dynamodb = MemoryDynamoDB()
+    with dynamodb.connect(BenchModel):
+        BenchModel.create_table(billing_mode="PAY_PER_REQUEST")
+        at = datetime(2021, 1, 1, tzinfo=timezone.utc)
+        with BenchModel.batch_write() as batch:
+            for i in range(ITEMS):
+                batch.save(
+                    BenchModel(
+                        f"{i:08d}",
+                        number=i,
+                        name=f"name {i}",
+                        status=Status.active,
+                        closed_at=at + timedelta(seconds=i),
+                    )
+                )
+        page = [item.serialize() for item in BenchModel.scan()]
+        every = list(BenchModel.get_attributes())
+
+        def read(names):
+            return lambda page: list(map(row_reader(BenchModel, names), page))
+
+        print(f"{ITEMS} items of {len(every)} attributes")
+        bench(
+            "models",
+            lambda: list(BenchModel.scan()),
+            lambda page: list(map(BenchModel.from_raw_data, page)),
+            page,
+        )
+        bench(
+            f"rows, {len(COLUMNS)} attributes",
+            lambda: list(BenchModel.rows(COLUMNS)),
+            read(COLUMNS),
+            page,
+        )
+        bench(
+            f"rows, all {len(every)} attributes",
+            lambda: list(BenchModel.rows(every)),
+            read(every),
+            page,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+per item against batch deserialization of ULID attributes
+
+    python -m benchmarks.bench_ulid_batch
+"""
+import timeit
+
+from ulid import ULID
+
+from pynamodb_templates.attributes import (
+    UnicodeULIDAttribute,
+    NumberULIDAttribute,
+    BinaryULIDAttribute,
+)
+
+PAGE = 10_000
+NUMBER = 20
+
+
+def bench(name, fn, number=NUMBER):
+    elapsed = timeit.timeit(fn, number=number)
+    print(f"{name:<48} {elapsed / number / PAGE * 1e9:8.1f} ns/item")
+    return elapsed
+
+
+def main():
+    ulids = [ULID() for _ in range(PAGE)]
+    for attr in (UnicodeULIDAttribute(), NumberULIDAttribute(), BinaryULIDAttribute()):
+        name = type(attr).__name__
+        page = [attr.serialize(u) for u in ulids]
+        bench(f"{name}.serialize", lambda: [attr.serialize(u) for u in ulids])
+        bench(f"{name}.serialize_many", lambda: attr.serialize_many(ulids))
+        bench(f"{name}.deserialize", lambda: [attr.deserialize(v) for v in page])
+        bench(f"{name}.deserialize_many", lambda: attr.deserialize_many(page))
+        bench(
+            f"{name}.deserialize_many(raw)",
+            lambda: attr.deserialize_many(page, raw=True),
+        )
+        print()
+
+
+if __name__ == "__main__":
+    main()
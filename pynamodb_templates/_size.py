@@ -0,0 +1,34 @@
+from base64 import b64decode
+from typing import Any, Dict
+
+__all__ = ["item_size"]
+
+
+def _value_size(value: Dict[str, Any]) -> int:
+    attr_type, data = next(iter(value.items()))
+    if attr_type == "S":
+        return len(data.encode())
+    if attr_type == "N":
+        return len(data.lstrip("-").replace(".", "")) // 2 + 1
+    if attr_type == "B":
+        return len(b64decode(data)) if isinstance(data, str) else len(data)
+    if attr_type in ("BOOL", "NULL"):
+        return 1
+    if attr_type == "SS":
+        return sum(len(v.encode()) for v in data)
+    if attr_type == "NS":
+        return sum(len(v.lstrip("-").replace(".", "")) // 2 + 1 for v in data)
+    if attr_type == "BS":
+        return sum(len(b64decode(v)) if isinstance(v, str) else len(v) for v in data)
+    if attr_type == "L":
+        return 3 + sum(_value_size(v) + 1 for v in data)
+    if attr_type == "M":
+        return 3 + sum(len(k.encode()) + _value_size(v) + 1 for k, v in data.items())
+    raise ValueError(f"unknown attribute type `{attr_type}`")
+
+
+def item_size(attributes: Dict[str, Dict[str, Any]]) -> int:
+    """
+    Approximate DynamoDB size in bytes of a serialized item, as billed and limited
+    """
+    return sum(len(k.encode()) + _value_size(v) for k, v in attributes.items())
@@ -1,7 +1,19 @@
-from ._bool import *
-from ._enum import *
-from ._ulid import *
-from .lyft import *
+"""
+attributes are resolved lazily, a submodule (and what it imports, `ulid` or
+`pynamodb_attributes`) is only imported when one of its attributes is first used
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._bool import *
+    from ._claim_check import *
+    from ._codecs import *
+    from ._compressed import *
+    from ._datetime import *
+    from ._enum import *
+    from ._ulid import *
+    from .lyft import *
 
 __lyft__ = [
     "FloatAttribute",
@@ -23,8 +35,56 @@ __all__ = [
     "EnumNameAttribute",
     "InteagerEnumAttribute",
     "UnicodeEnumAttribute",
+    "EnumFlagsAttribute",
     "UnicodeULIDAttribute",
     "NumberULIDAttribute",
     "BinaryULIDAttribute",
+    "UnicodeUTCDatetimeAttribute",
+    "CompressedJSONAttribute",
+    "ClaimCheckAttribute",
+    "BlobStore",
+    "LocalBlobStore",
+    "S3BlobStore",
+    "FieldCodec",
+    "IntCodec",
+    "DatetimeCodec",
+    "ULIDCodec",
     *__lyft__,
 ]
+
+_submodules = {
+    "IndexableBooleanAttribute": "._bool",
+    "EnumNameAttribute": "._enum",
+    "InteagerEnumAttribute": "._enum",
+    "UnicodeEnumAttribute": "._enum",
+    "EnumFlagsAttribute": "._enum",
+    "UnicodeULIDAttribute": "._ulid",
+    "NumberULIDAttribute": "._ulid",
+    "BinaryULIDAttribute": "._ulid",
+    "UnicodeUTCDatetimeAttribute": "._datetime",
+    "CompressedJSONAttribute": "._compressed",
+    "ClaimCheckAttribute": "._claim_check",
+    "BlobStore": "._claim_check",
+    "LocalBlobStore": "._claim_check",
+    "S3BlobStore": "._claim_check",
+    "FieldCodec": "._codecs",
+    "IntCodec": "._codecs",
+    "DatetimeCodec": "._codecs",
+    "ULIDCodec": "._codecs",
+    **dict.fromkeys(__lyft__, ".lyft"),
+}
+
+
+def __getattr__(name):
+    try:
+        submodule = _submodules[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(submodule, __name__), name)
+    # cached, later lookups do not go through `__getattr__` again
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
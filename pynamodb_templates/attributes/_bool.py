@@ -1,6 +1,9 @@
-from typing import TypeVar
+from typing import Any, Callable, Optional, TypeVar, Union
 
 from pynamodb.attributes import Attribute
+from pynamodb.expressions.update import Action
+from pynamodb.indexes import Index
+from pynamodb.pagination import ResultIterator
 
 from pynamodb_templates.attributes.serializer import NumberSerializeMixin
 
@@ -12,10 +15,40 @@ __all__ = ["IndexableBooleanAttribute"]
 class IndexableBooleanAttribute(NumberSerializeMixin, Attribute[bool]):
     """
     Indexable Boolean Attribute using Number Field
+
+    With `sparse=True` only True is written, False removes the attribute and an
+    absent attribute reads as False, so an index on it only holds the flagged
+    items. Items saved before with 0 still read as False.
     """
 
+    def __init__(
+        self,
+        hash_key: bool = False,
+        range_key: bool = False,
+        null: Optional[bool] = None,
+        default: Optional[Union[_T, Callable[..., _T]]] = None,
+        default_for_new: Optional[Union[Any, Callable[..., _T]]] = None,
+        attr_name: Optional[str] = None,
+        sparse: bool = False,
+    ) -> None:
+        if sparse:
+            null = True
+            if default is None:
+                default = False
+        super().__init__(
+            hash_key=hash_key,
+            range_key=range_key,
+            null=null,
+            default=default,
+            default_for_new=default_for_new,
+            attr_name=attr_name,
+        )
+        self.sparse = sparse
+
     def serialize(self, value):
         if value is not None:
+            if self.sparse and not value:
+                return None
             value = int(value)
         return super().serialize(value)
 
@@ -25,3 +58,28 @@ class IndexableBooleanAttribute(NumberSerializeMixin, Attribute[bool]):
             return
         else:
             return bool(value)
+
+    def set(self, value: Any) -> Action:  # type: ignore[override]
+        if self.sparse and not value:
+            return self.remove()
+        return super().set(value)
+
+    def flagged(self, index: Index, **kwargs: Any) -> ResultIterator:
+        """
+        Items flagged True, read from a sparse `index` holding this attribute
+
+        Queried when the attribute is the index hash key, scanned otherwise with a
+        filter for the items written with 0 before the index became sparse.
+        """
+        attributes = index.Meta.attributes.values()
+        key_names = {attr.attr_name: attr.is_hash_key for attr in attributes}
+        if self.attr_name not in key_names:
+            index_name = type(index).__name__
+            raise ValueError(f"`{self.attr_name}` is not a key of `{index_name}`")
+        if key_names[self.attr_name]:
+            return index.query(1, **kwargs)
+        condition = self == True  # noqa: E712
+        if kwargs.get("filter_condition") is not None:
+            condition &= kwargs["filter_condition"]
+        kwargs["filter_condition"] = condition
+        return index.scan(**kwargs)
@@ -0,0 +1,252 @@
+import hashlib
+import os
+from abc import ABCMeta, abstractmethod
+from base64 import b64decode, b64encode
+from collections import OrderedDict
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import Any, Callable, Optional, TypeVar, Union
+
+from pynamodb import constants
+from pynamodb.attributes import Attribute
+
+from pynamodb_templates.attributes.serializer import BinarySerializeMixin
+
+_T = TypeVar("_T")
+
+__all__ = ["BlobStore", "LocalBlobStore", "S3BlobStore", "ClaimCheckAttribute"]
+
+# first byte of the stored value, the payload follows inline or is a pointer
+_INLINE = 0
+_POINTER = 1
+
+
+class BlobStore(metaclass=ABCMeta):
+    """
+    Storage of claim checked values, keyed by the hex SHA-256 of their content
+
+    `get` raises `KeyError` for missing keys. As keys are content addressed, a key
+    never changes its content, stores need no consistency beyond read after write.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> bytes:
+        ...
+
+    @abstractmethod
+    def put(self, key: str, data: bytes) -> None:
+        ...
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        ...
+
+
+class LocalBlobStore(BlobStore):
+    """
+    Blobs as files in `directory`, fanned out in subdirectories by key prefix
+    """
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def get(self, key: str) -> bytes:
+        try:
+            return self._path(key).read_bytes()
+        except FileNotFoundError:
+            raise KeyError(key) from None
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # written aside then renamed, readers never see a partial blob
+        with NamedTemporaryFile(dir=path.parent, delete=False) as file:
+            file.write(data)
+        os.replace(file.name, path)
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).exists()
+
+
+class S3BlobStore(BlobStore):
+    """
+    Blobs as objects of an S3 `bucket`, named `prefix` then key
+
+    `client` is a botocore S3 client, one is created from the default session
+    when not given.
+    """
+
+    def __init__(self, bucket: str, prefix: str = "", client: Any = None) -> None:
+        self.bucket = bucket
+        self.prefix = prefix
+        self._client = client
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            import botocore.session
+
+            self._client = botocore.session.get_session().create_client("s3")
+        return self._client
+
+    def get(self, key: str) -> bytes:
+        from botocore.exceptions import ClientError
+
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=self.prefix + key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                raise KeyError(key) from None
+            raise
+        return response["Body"].read()
+
+    def put(self, key: str, data: bytes) -> None:
+        self.client.put_object(Bucket=self.bucket, Key=self.prefix + key, Body=data)
+
+    def exists(self, key: str) -> bool:
+        from botocore.exceptions import ClientError
+
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self.prefix + key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                return False
+            raise
+        return True
+
+
+class _Claim:
+    """
+    Stored value of a `ClaimCheckAttribute` not read yet
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Union[str, bytes]) -> None:
+        self.value = value
+
+
+class ClaimCheckAttribute(BinarySerializeMixin, Attribute[Any]):
+    """
+    Wraps `attribute`, its values of `threshold` bytes or more are kept in `store`
+
+    The item only holds a pointer to such values, the SHA-256 of their content.
+    Pointed values are fetched on first access and kept in a LRU of `cache_size`
+    bytes, values already known to the cache or the store are not written again.
+    `attribute` serializes to a string, number or binary value.
+    """
+
+    attr_type = constants.BINARY
+
+    def __init__(
+        self,
+        attribute: Attribute,
+        store: BlobStore,
+        threshold: int = 64 * 1024,
+        cache_size: int = 32 * 1024 * 1024,
+        null: Optional[bool] = None,
+        default: Optional[Union[_T, Callable[..., _T]]] = None,
+        default_for_new: Optional[Union[Any, Callable[..., _T]]] = None,
+        attr_name: Optional[str] = None,
+    ) -> None:
+        if attribute.attr_type not in (
+            constants.STRING,
+            constants.NUMBER,
+            constants.BINARY,
+        ):
+            raise ValueError(
+                f"`{type(attribute).__name__}` does not serialize to a scalar value"
+            )
+        super().__init__(
+            null=null,
+            default=default,
+            default_for_new=default_for_new,
+            attr_name=attr_name,
+        )
+        self.attribute = attribute
+        self.store = store
+        self.threshold = threshold
+        self.cache_size = cache_size
+        self._binary = attribute.attr_type == constants.BINARY
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._cached = 0
+        self._lock = Lock()
+        if attr_name is not None:
+            attribute.attr_name = attr_name
+
+    def __set_name__(self, owner: Any, name: str) -> None:
+        super().__set_name__(owner, name)
+        # the wrapped attribute reads and writes the same value
+        self.attribute.attr_name = self.attr_name
+
+    def __get__(self, instance: Any, owner: Any) -> Any:
+        value = super().__get__(instance, owner)
+        if value is self:
+            return self
+        if type(value) is _Claim:
+            self.__set__(instance, self._load(value.value))
+        return self.attribute.__get__(instance, owner)
+
+    def serialize(self, value: Any) -> Optional[str]:
+        if type(value) is _Claim:
+            # never read, written back as it is
+            stored = value.value
+            return stored if isinstance(stored, str) else stored.decode()
+        serialized = self.attribute.serialize(value)
+        if serialized is None:
+            return None
+        data = b64decode(serialized) if self._binary else serialized.encode()
+        if len(data) < self.threshold:
+            return super().serialize(bytes([_INLINE]) + data)
+        digest = hashlib.sha256(data).digest()
+        self._put(digest.hex(), data)
+        return super().serialize(bytes([_POINTER]) + digest)
+
+    def deserialize(self, value: Union[str, bytes]) -> Any:
+        return _Claim(value)
+
+    def _load(self, value: Union[str, bytes]) -> Any:
+        data = super().deserialize(value)
+        marker, payload = data[0], data[1:]
+        if marker == _POINTER:
+            payload = self._get(payload.hex())
+        elif marker != _INLINE:
+            raise ValueError(f"unknown claim check marker {marker}")
+        if self._binary:
+            return self.attribute.deserialize(b64encode(payload))
+        return self.attribute.deserialize(payload.decode())
+
+    def _get(self, key: str) -> bytes:
+        with self._lock:
+            data = self._cache.get(key)
+            if data is not None:
+                self._cache.move_to_end(key)
+                return data
+        data = self.store.get(key)
+        self._remember(key, data)
+        return data
+
+    def _put(self, key: str, data: bytes) -> None:
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return
+        if not self.store.exists(key):
+            self.store.put(key, data)
+        self._remember(key, data)
+
+    def _remember(self, key: str, data: bytes) -> None:
+        if len(data) > self.cache_size:
+            return
+        with self._lock:
+            if key in self._cache:
+                return
+            self._cache[key] = data
+            self._cached += len(data)
+            while self._cached > self.cache_size:
+                _, evicted = self._cache.popitem(last=False)
+                self._cached -= len(evicted)
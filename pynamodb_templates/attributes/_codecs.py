@@ -0,0 +1,89 @@
+from abc import ABCMeta, abstractmethod
+from datetime import datetime
+from typing import Any, Callable, Generic, TypeVar
+
+from pynamodb_templates.attributes._datetime import _to_utc
+
+_T = TypeVar("_T")
+
+__all__ = ["FieldCodec", "IntCodec", "DatetimeCodec", "ULIDCodec"]
+
+
+class FieldCodec(Generic[_T], metaclass=ABCMeta):
+    """
+    Encoder of a `UnicodeDelimitedTupleAttribute` field
+
+    Encoded strings of codecs below sort in the same order as their values, so a
+    range of tuples sharing a prefix is a single key condition.
+    """
+
+    @abstractmethod
+    def encode(self, value: _T) -> str:
+        ...
+
+    @abstractmethod
+    def decode(self, value: str) -> _T:
+        ...
+
+
+class _TypeCodec(FieldCodec[Any]):
+    """
+    `str` then the field type, the encoding of fields without a codec
+    """
+
+    def __init__(self, field_type: Callable[[str], Any]) -> None:
+        self.field_type = field_type
+
+    encode = staticmethod(str)  # type: ignore[assignment]
+
+    def decode(self, value: str) -> Any:
+        return self.field_type(value)
+
+
+class IntCodec(FieldCodec[int]):
+    """
+    Zero padded non negative integers of at most `width` digits
+    """
+
+    def __init__(self, width: int) -> None:
+        self.width = width
+        self._bound = 10**width
+
+    def encode(self, value: int) -> str:
+        if not 0 <= value < self._bound:
+            raise ValueError(f"`{value}` does not fit in {self.width} digits")
+        return f"{value:0{self.width}d}"
+
+    def decode(self, value: str) -> int:
+        return int(value)
+
+
+class DatetimeCodec(FieldCodec[datetime]):
+    """
+    ISO 8601 UTC datetimes, always with microseconds to stay fixed width
+
+    Naive datetimes are taken as UTC, as in `UnicodeUTCDatetimeAttribute`.
+    """
+
+    def encode(self, value: datetime) -> str:
+        return _to_utc(value).isoformat(timespec="microseconds")
+
+    def decode(self, value: str) -> datetime:
+        return datetime.fromisoformat(value)
+
+
+class ULIDCodec(FieldCodec[Any]):
+    """
+    ULIDs in their canonical base32 form, which sorts by creation time
+    """
+
+    def __init__(self) -> None:
+        from ulid import ULID
+
+        self._from_str = ULID.from_str
+
+    def encode(self, value: Any) -> str:
+        return str(value)
+
+    def decode(self, value: str) -> Any:
+        return self._from_str(value)
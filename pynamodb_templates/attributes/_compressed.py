@@ -0,0 +1,134 @@
+import json
+from functools import lru_cache
+from typing import Any, Callable, NamedTuple, Optional, TypeVar, Union
+
+from pynamodb import constants
+from pynamodb.attributes import Attribute
+
+from pynamodb_templates.attributes.serializer import BinarySerializeMixin
+
+_T = TypeVar("_T")
+
+__all__ = ["CompressedJSONAttribute"]
+
+# first byte of the stored value, the codec its payload is compressed with
+_RAW = 0
+_MARKERS = {"zlib": 1, "lzma": 2, "zstd": 3}
+_NAMES = {marker: name for name, marker in _MARKERS.items()}
+
+
+class _Codec(NamedTuple):
+    compress: Callable[[bytes, Optional[int]], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+@lru_cache(maxsize=None)
+def _codec(name: str) -> _Codec:
+    # imported on first use, `lzma` is slow to import and `zstandard` optional
+    if name == "zlib":
+        import zlib
+
+        return _Codec(
+            lambda data, level: zlib.compress(data, -1 if level is None else level),
+            zlib.decompress,
+        )
+    if name == "lzma":
+        import lzma
+
+        return _Codec(
+            lambda data, level: lzma.compress(data, preset=level), lzma.decompress
+        )
+    if name == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("the `zstd` codec needs `zstandard` installed") from None
+        decompressor = zstandard.ZstdDecompressor()
+        return _Codec(
+            lambda data, level: zstandard.ZstdCompressor(
+                level=3 if level is None else level
+            ).compress(data),
+            lambda data: decompressor.decompress(data),
+        )
+    raise ValueError(f"unknown codec `{name}`, expected one of {sorted(_MARKERS)}")
+
+
+class _Packed:
+    """
+    Stored value of a `CompressedJSONAttribute` not read yet
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Union[str, bytes]) -> None:
+        self.value = value
+
+
+class CompressedJSONAttribute(BinarySerializeMixin, Attribute[Any]):
+    """
+    JSON value stored as binary, compressed when its JSON is `threshold` bytes or more
+
+    The stored value starts with a marker byte of its codec (`zlib`, `lzma`, or
+    `zstd` with `zstandard` installed), so the codec can be changed without
+    rewriting existing items. Values are only decompressed when first accessed.
+    """
+
+    attr_type = constants.BINARY
+
+    def __init__(
+        self,
+        codec: str = "zlib",
+        threshold: int = 1024,
+        level: Optional[int] = None,
+        hash_key: bool = False,
+        range_key: bool = False,
+        null: Optional[bool] = None,
+        default: Optional[Union[_T, Callable[..., _T]]] = None,
+        default_for_new: Optional[Union[Any, Callable[..., _T]]] = None,
+        attr_name: Optional[str] = None,
+    ) -> None:
+        super().__init__(
+            hash_key=hash_key,
+            range_key=range_key,
+            null=null,
+            default=default,
+            default_for_new=default_for_new,
+            attr_name=attr_name,
+        )
+        _codec(codec)
+        self.codec = codec
+        self.threshold = threshold
+        self.level = level
+        self._marker = bytes([_MARKERS[codec]])
+
+    def __get__(self, instance: Any, owner: Any) -> Any:
+        value = super().__get__(instance, owner)
+        if type(value) is _Packed:
+            value = self._load(value.value)
+            self.__set__(instance, value)
+        return value
+
+    def serialize(self, value: Any) -> str:
+        if type(value) is _Packed:
+            value = self._load(value.value)
+        data = json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+        if len(data) >= self.threshold:
+            compressed = _codec(self.codec).compress(data, self.level)
+            # incompressible values are kept as they are
+            if len(compressed) < len(data):
+                return super().serialize(self._marker + compressed)
+        return super().serialize(bytes([_RAW]) + data)
+
+    def deserialize(self, value: Union[str, bytes]) -> Any:
+        return _Packed(value)
+
+    def _load(self, value: Union[str, bytes]) -> Any:
+        data = super().deserialize(value)
+        marker, payload = data[0], data[1:]
+        if marker != _RAW:
+            try:
+                name = _NAMES[marker]
+            except KeyError:
+                raise ValueError(f"unknown codec marker {marker}") from None
+            payload = _codec(name).decompress(payload)
+        return json.loads(payload)
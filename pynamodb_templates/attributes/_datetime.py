@@ -0,0 +1,51 @@
+from datetime import datetime, timezone
+from typing import Iterable, List
+
+from pynamodb import constants
+from pynamodb.attributes import Attribute
+
+__all__ = ["UnicodeUTCDatetimeAttribute"]
+
+_UTC = timezone.utc
+_fromisoformat = datetime.fromisoformat
+
+
+def _to_utc(value: datetime) -> datetime:
+    tzinfo = value.tzinfo
+    if tzinfo is _UTC:
+        return value
+    if tzinfo is None:
+        return value.replace(tzinfo=_UTC)
+    return value.astimezone(_UTC)
+
+
+class UnicodeUTCDatetimeAttribute(Attribute[datetime]):
+    """
+    ISO 8601 formatted UTC datetime attribute
+
+    Wire compatible with `UnicodeDatetimeAttribute(force_utc=True)`, naive datetimes
+    are taken as UTC and aware ones converted to UTC, values already in UTC are
+    formatted as they are.
+    """
+
+    attr_type = constants.STRING
+
+    def serialize(self, value: datetime) -> str:
+        if value.tzinfo is not _UTC:
+            value = _to_utc(value)
+        return value.isoformat()
+
+    def deserialize(self, value: str) -> datetime:
+        return _fromisoformat(value)
+
+    def serialize_many(self, values: Iterable[datetime]) -> List[str]:
+        """
+        Serialize a page of datetimes at once
+        """
+        return [_to_utc(v).isoformat() for v in values]
+
+    def deserialize_many(self, values: Iterable[str]) -> List[datetime]:
+        """
+        Deserialize a page of ISO 8601 strings at once
+        """
+        return list(map(_fromisoformat, values))
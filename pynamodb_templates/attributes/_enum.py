@@ -1,16 +1,29 @@
 from abc import ABCMeta
-from enum import Enum
-from typing import Type, TypeVar, AnyStr, Optional, Callable, Union, Any
+from enum import Enum, IntFlag
+from typing import Type, TypeVar, AnyStr, Optional, Callable, Union, Any, Dict
+from typing import FrozenSet, Iterable, Iterator
 
 from pynamodb import constants
 from pynamodb.attributes import Attribute
+from pynamodb.expressions.condition import Condition
 
 from pynamodb_templates.attributes.serializer import NumberSerializeMixin
 
-__all__ = ["EnumNameAttribute", "InteagerEnumAttribute", "UnicodeEnumAttribute"]
+__all__ = [
+    "EnumNameAttribute",
+    "InteagerEnumAttribute",
+    "UnicodeEnumAttribute",
+    "EnumFlagsAttribute",
+]
 
 _T = TypeVar("_T")
 
+# DynamoDB numbers carry 38 significant digits, 2 ** 125 is the largest bit to fit
+_MAX_FLAG_BITS = 126
+# an IN operand list holds 100 values, a few of them are joined with OR
+_IN_VALUES = 100
+_MAX_CONDITION_VALUES = 4 * _IN_VALUES
+
 
 def is_unique(obj: Type[Enum]):
     v = [e.value for e in obj]
@@ -20,6 +33,14 @@ def is_unique(obj: Type[Enum]):
 
 
 class EnumAttributeBase(Attribute[Enum], metaclass=ABCMeta):
+    """
+    Base of enum attributes
+
+    Lookup tables between members and their serialized values are built once
+    at construction, so `serialize` and `deserialize` are a single dict lookup.
+    Unknown serialized values raise `ValueError` unless `fallback` member is given.
+    """
+
     attr_type: str
     attr_type_check_by: Optional[Any] = None
     _enum_save_name: bool
@@ -33,6 +54,7 @@ class EnumAttributeBase(Attribute[Enum], metaclass=ABCMeta):
         default: Optional[Union[_T, Callable[..., _T]]] = None,
         default_for_new: Optional[Union[Any, Callable[..., _T]]] = None,
         attr_name: Optional[str] = None,
+        fallback: Optional[Enum] = None,
     ) -> None:
         super().__init__(
             hash_key=hash_key,
@@ -53,31 +75,71 @@ class EnumAttributeBase(Attribute[Enum], metaclass=ABCMeta):
                         f"`{str(self.attr_type_check_by)}` type expected, "
                         f"but `type({type(e.value)})` type from name `{e.name}`"
                     )
+        if fallback is not None and not isinstance(fallback, enum_type):
+            raise TypeError(f"fallback `{fallback}` is not a member of `{enum_type}`")
+        self.fallback = fallback
+
+        # lookup tables, never mutated after construction
+        self._names = tuple(e.name for e in enum_type)
+        self._values = tuple(e.value for e in enum_type)
+        self._serialized: Dict[Enum, Any] = {
+            e: self._encode(e.name if self._enum_save_name else e.value)
+            for e in enum_type
+        }
+        self._deserialized: Dict[Any, Enum] = {
+            v: e for e, v in self._serialized.items()
+        }
 
     def __getattr__(self, item):
-        if item in self.enum_type.__members__:
-            return self.enum_type[item]
-        raise AttributeError(item)
+        # bypass `__getattr__` itself while the lookup tables are not built yet
+        try:
+            enum_type = object.__getattribute__(self, "enum_type")
+        except AttributeError:
+            raise AttributeError(item) from None
+        try:
+            return enum_type.__members__[item]
+        except KeyError:
+            raise AttributeError(item) from None
+
+    def _encode(self, value: Any) -> Any:
+        return super().serialize(value)
+
+    def _decode(self, value: Any) -> Any:
+        return super().deserialize(value)
 
     def serialize(self, value: Enum):
-        if self._enum_save_name:
-            v = value.name
-        else:
-            v = value.value
-        return super().serialize(v)
+        try:
+            return self._serialized[value]
+        except (KeyError, TypeError):
+            raise ValueError(
+                f"`{value!r}` is not a member of `{self.enum_type.__name__}`"
+            ) from None
 
     def deserialize(self, value: str) -> Enum:
-        if self._enum_save_name:
-            return self.enum_type[super().deserialize(value)]
-        return self.enum_type(super().deserialize(value))
+        try:
+            return self._deserialized[value]
+        except (KeyError, TypeError):
+            pass
+        # non-canonical serialized values (e.g. "1.0" for 1) or `Enum._missing_`
+        try:
+            key = self._decode(value)
+            if self._enum_save_name:
+                return self.enum_type[key]
+            return self.enum_type(key)
+        except (KeyError, TypeError, ValueError):
+            if self.fallback is not None:
+                return self.fallback
+        raise ValueError(
+            f"`{value!r}` is not a valid serialized `{self.enum_type.__name__}`"
+        )
 
     @property
     def enum_names(self):
-        return [e.name for e in self.enum_type]
+        return list(self._names)
 
     @property
     def enum_values(self):
-        return [e.value for e in self.enum_type]
+        return list(self._values)
 
 
 class EnumNameAttribute(EnumAttributeBase):
@@ -110,8 +172,138 @@ class InteagerEnumAttribute(NumberSerializeMixin, EnumAttributeBase):
 
     _enum_save_name = False
 
-    def serialize(self, value: Enum) -> AnyStr:
-        return super().serialize(value.value)
+    serialize = EnumAttributeBase.serialize
+    deserialize = EnumAttributeBase.deserialize
+
+    def _encode(self, value: int) -> AnyStr:
+        return NumberSerializeMixin.serialize(self, value)
+
+    def _decode(self, value: AnyStr) -> int:
+        return NumberSerializeMixin.deserialize(self, value)
+
+
+def _bit_count(bits: int) -> int:
+    return bin(bits).count("1")
+
+
+def _subsets(bits: int) -> Iterator[int]:
+    subset = bits
+    while True:
+        yield subset
+        if not subset:
+            return
+        subset = (subset - 1) & bits
+
+
+class EnumFlagsAttribute(NumberSerializeMixin, Attribute[Any]):
+    """
+    Set of enum members packed in a single number attribute
+
+    An `IntFlag` type is stored as its value and deserialized as a flag, members
+    of any other enum are stored as the bit of their definition order (members may
+    only be appended) and deserialized as a frozenset.
+    """
+
+    attr_type = constants.NUMBER
+
+    def __init__(
+        self,
+        enum_type: Type[Enum],
+        hash_key: bool = False,
+        range_key: bool = False,
+        null: Optional[bool] = None,
+        default: Optional[Union[_T, Callable[..., _T]]] = None,
+        default_for_new: Optional[Union[Any, Callable[..., _T]]] = None,
+        attr_name: Optional[str] = None,
+    ) -> None:
+        super().__init__(
+            hash_key=hash_key,
+            range_key=range_key,
+            null=null,
+            default=default,
+            default_for_new=default_for_new,
+            attr_name=attr_name,
+        )
+        self.enum_type = enum_type
+        self._flag = issubclass(enum_type, IntFlag)
+        if self._flag:
+            self._bits: Dict[Enum, int] = {e: int(e) for e in enum_type}
+        else:
+            self._bits = {e: 1 << i for i, e in enumerate(enum_type)}
+        self._mask = 0
+        for bit in self._bits.values():
+            self._mask |= bit
+        if self._mask >> _MAX_FLAG_BITS:
+            raise ValueError(
+                f"`{enum_type.__name__}` flags do not fit in {_MAX_FLAG_BITS} bits"
+            )
+
+    def _pack(self, value: Union[IntFlag, Iterable[Enum]]) -> int:
+        if self._flag and isinstance(value, int):
+            bits = int(value)
+            if bits & ~self._mask or bits < 0:
+                raise ValueError(f"`{value!r}` is not a `{self.enum_type.__name__}`")
+            return bits
+        bits = 0
+        for member in value:
+            try:
+                bits |= self._bits[member]
+            except (KeyError, TypeError):
+                raise ValueError(
+                    f"`{member!r}` is not a member of `{self.enum_type.__name__}`"
+                ) from None
+        return bits
+
+    def serialize(self, value: Union[IntFlag, Iterable[Enum]]) -> str:
+        return super().serialize(self._pack(value))
+
+    def deserialize(self, value: str) -> Union[IntFlag, FrozenSet[Enum]]:
+        bits = super().deserialize(value)
+        if not isinstance(bits, int) or bits & ~self._mask or bits < 0:
+            raise ValueError(
+                f"`{value!r}` is not a valid serialized `{self.enum_type.__name__}`"
+            )
+        if self._flag:
+            return self.enum_type(bits)
+        return frozenset(e for e, bit in self._bits.items() if bits & bit)
+
+    def _is_in(self, count: int, values: Callable[[], Iterable[int]]) -> Condition:
+        # DynamoDB has no bitwise operators, the condition lists the matching numbers
+        if count > _MAX_CONDITION_VALUES:
+            raise ValueError(
+                f"{count} numbers match, more than the "
+                f"{_MAX_CONDITION_VALUES} a condition can list"
+            )
+        operands = [{constants.NUMBER: str(v)} for v in sorted(values())]
+        condition = None
+        for i in range(0, len(operands), _IN_VALUES):
+            chunk = self.is_in(*operands[i : i + _IN_VALUES])
+            condition = chunk if condition is None else condition | chunk
+        return condition
+
+    def has_all(self, members: Union[IntFlag, Iterable[Enum]]) -> Condition:
+        """
+        Condition on the values having all of `members`
+        """
+        required = self._pack(members)
+        free = self._mask & ~required
+        return self._is_in(
+            1 << _bit_count(free), lambda: (required | bits for bits in _subsets(free))
+        )
+
+    def has_any(self, members: Union[IntFlag, Iterable[Enum]]) -> Condition:
+        """
+        Condition on the values having at least one of `members`
+        """
+        wanted = self._pack(members)
+        if not wanted:
+            raise ValueError("`has_any` needs at least one member")
+        free = self._mask & ~wanted
+        count = (1 << _bit_count(self._mask)) - (1 << _bit_count(free))
+
+        def values():
+            for bits in _subsets(wanted):
+                if bits:
+                    yield from (bits | other for other in _subsets(free))
 
-    def deserialize(self, value: AnyStr) -> Enum:
-        return self.enum_type(super().deserialize(value))
+        return self._is_in(count, values)
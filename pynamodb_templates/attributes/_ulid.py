@@ -1,7 +1,13 @@
-from typing import TypeVar, AnyStr, Optional, Union, Callable, Any
+from binascii import a2b_base64, b2a_base64
+from datetime import datetime, timedelta, timezone
+from string import ascii_letters, whitespace
+from typing import TypeVar, AnyStr, Optional, Union, Callable, Any, Iterable, List
+from typing import Tuple
 
 from pynamodb import constants
 from pynamodb.attributes import Attribute, NumberAttribute, BinaryAttribute
+from pynamodb.attributes import DEFAULT_ENCODING
+from pynamodb.expressions.condition import Condition
 from pynamodb_templates.attributes.serializer import (
     NumberSerializeMixin,
     BinarySerializeMixin,
@@ -12,8 +18,138 @@ _T = TypeVar("_T")
 
 __all__ = ["UnicodeULIDAttribute", "NumberULIDAttribute", "BinaryULIDAttribute"]
 
+_ULID_BYTES_LEN = 16
+_ULID_REPR_LEN = 26
+_ULID_MAX_INT = (1 << 128) - 1
+_ULID_MAX_MILLISECONDS = (1 << 48) - 1
+_ULID_RANDOMNESS_BITS = 80
+_ULID_RANDOMNESS_MAX = (1 << _ULID_RANDOMNESS_BITS) - 1
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MILLISECOND = timedelta(milliseconds=1)
+
+_CROCKFORD = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_PYTHON_BASE32 = "0123456789abcdefghijklmnopqrstuv"
+
+# crockford base32 -> digits of `int(..., 32)`, anything else `int` would accept
+# (other letters, signs, underscores, whitespaces) is mapped to an invalid digit
+_DECODE_TABLE = str.maketrans(
+    {
+        **{c: "#" for c in ascii_letters + whitespace + "+-_"},
+        **dict(zip(_CROCKFORD, _PYTHON_BASE32)),
+        **dict(zip(_CROCKFORD.lower(), _PYTHON_BASE32)),
+    }
+)
+# every 10 bits chunk -> its 2 characters, 13 chunks are the 130 bits of a ULID string
+_ENCODE_PAIRS = tuple(a + b for a in _CROCKFORD for b in _CROCKFORD)
+_ENCODE_SHIFTS = tuple(range(120, -1, -10))
+
+_new_ulid = ULID.__new__
 
-class UnicodeULIDAttribute(Attribute[ULID]):
+
+def _ulid_from_bytes(value: bytes) -> ULID:
+    """
+    Build a ULID without the type checking wrappers of `ULID.from_*`
+    """
+    ulid = _new_ulid(ULID)
+    ulid.bytes = value
+    return ulid
+
+
+def _base32_to_int(value: str) -> int:
+    if len(value) != _ULID_REPR_LEN or not value.isascii():
+        raise ValueError(f"`{value}` is not a valid ULID string")
+    return int(value.translate(_DECODE_TABLE), 32)
+
+
+def _check_int(value: int) -> int:
+    if not 0 <= value <= _ULID_MAX_INT:
+        raise ValueError(f"`{value}` is out of ULID range")
+    return value
+
+
+def _check_bytes(value: bytes) -> bytes:
+    if len(value) != _ULID_BYTES_LEN:
+        raise ValueError("ULID has to be exactly 16 bytes long.")
+    return value
+
+
+def _int_to_bytes(value: int) -> bytes:
+    try:
+        return value.to_bytes(_ULID_BYTES_LEN, "big")
+    except OverflowError:
+        raise ValueError(f"`{value}` is out of ULID range") from None
+
+
+def _bytes_to_base32(value: bytes) -> str:
+    n = int.from_bytes(value, "big")
+    return "".join([_ENCODE_PAIRS[(n >> shift) & 0x3FF] for shift in _ENCODE_SHIFTS])
+
+
+def _datetime_to_milliseconds(value: datetime) -> int:
+    # naive datetimes are taken as UTC, like `UnicodeDatetimeAttribute(force_tz=True)`
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    milliseconds = (value - _EPOCH) // _MILLISECOND
+    if not 0 <= milliseconds <= _ULID_MAX_MILLISECONDS:
+        raise ValueError(f"`{value}` is out of ULID timestamp range")
+    return milliseconds
+
+
+class ULIDTimeRangeMixin:
+    """
+    Key conditions on the timestamp part of ULIDs
+
+    The smallest and the largest ULIDs of a millisecond bound a datetime window,
+    so a ULID range key can be queried by creation time with a key condition
+    instead of a filter expression.
+
+    >>> Model.query(hash_key, range_key_condition=Model.ulid.created_between(a, b))
+    """
+
+    @staticmethod
+    def min_ulid(value: datetime) -> ULID:
+        """
+        The smallest ULID of the millisecond of `value`
+        """
+        milliseconds = _datetime_to_milliseconds(value)
+        return _ulid_from_bytes(_int_to_bytes(milliseconds << _ULID_RANDOMNESS_BITS))
+
+    @staticmethod
+    def max_ulid(value: datetime) -> ULID:
+        """
+        The largest ULID of the millisecond of `value`
+        """
+        milliseconds = _datetime_to_milliseconds(value)
+        value = milliseconds << _ULID_RANDOMNESS_BITS | _ULID_RANDOMNESS_MAX
+        return _ulid_from_bytes(_int_to_bytes(value))
+
+    def time_bounds(self, start: datetime, end: datetime) -> Tuple[Any, Any]:
+        """
+        Serialized lower and upper ULIDs of the window `start` ~ `end` (both inclusive)
+        """
+        return self.serialize(self.min_ulid(start)), self.serialize(self.max_ulid(end))
+
+    def created_between(self, start: datetime, end: datetime) -> Condition:
+        """
+        ULIDs created from `start` to `end`, both inclusive
+        """
+        return self.between(self.min_ulid(start), self.max_ulid(end))
+
+    def created_since(self, start: datetime) -> Condition:
+        """
+        ULIDs created at or after `start`
+        """
+        return self >= self.min_ulid(start)
+
+    def created_before(self, end: datetime) -> Condition:
+        """
+        ULIDs created before `end`
+        """
+        return self < self.min_ulid(end)
+
+
+class UnicodeULIDAttribute(ULIDTimeRangeMixin, Attribute[ULID]):
     """
     Unicode formatted ULID attribute
     """
@@ -26,8 +162,28 @@ class UnicodeULIDAttribute(Attribute[ULID]):
     def deserialize(self, value: AnyStr) -> ULID:
         return ULID.from_str(super().deserialize(value))
 
-
-class NumberULIDAttribute(NumberSerializeMixin, Attribute[ULID]):
+    def serialize_many(
+        self, values: Iterable[Union[ULID, bytes]], raw: bool = False
+    ) -> List[str]:
+        """
+        Serialize a page of ULIDs (or 16 bytes values with `raw`) at once
+        """
+        if raw:
+            return [_bytes_to_base32(_check_bytes(v)) for v in values]
+        return [_bytes_to_base32(v.bytes) for v in values]
+
+    def deserialize_many(
+        self, values: Iterable[str], raw: bool = False
+    ) -> List[Union[ULID, bytes]]:
+        """
+        Deserialize a page of ULID strings at once, `raw` returns 16 bytes values
+        """
+        if raw:
+            return [_int_to_bytes(_base32_to_int(v)) for v in values]
+        return [_ulid_from_bytes(_int_to_bytes(_base32_to_int(v))) for v in values]
+
+
+class NumberULIDAttribute(ULIDTimeRangeMixin, NumberSerializeMixin, Attribute[ULID]):
     """
     Number formatted ULID attribute
     """
@@ -40,8 +196,28 @@ class NumberULIDAttribute(NumberSerializeMixin, Attribute[ULID]):
     def deserialize(self, value: AnyStr) -> ULID:
         return ULID.from_int(super().deserialize(value))
 
-
-class BinaryULIDAttribute(BinarySerializeMixin, Attribute[ULID]):
+    def serialize_many(
+        self, values: Iterable[Union[ULID, int]], raw: bool = False
+    ) -> List[str]:
+        """
+        Serialize a page of ULIDs (or integers with `raw`) at once
+        """
+        if raw:
+            return [str(_check_int(v)) for v in values]
+        return [str(int.from_bytes(v.bytes, "big")) for v in values]
+
+    def deserialize_many(
+        self, values: Iterable[str], raw: bool = False
+    ) -> List[Union[ULID, int]]:
+        """
+        Deserialize a page of ULID numbers at once, `raw` returns integers
+        """
+        if raw:
+            return [_check_int(int(v)) for v in values]
+        return [_ulid_from_bytes(_int_to_bytes(int(v))) for v in values]
+
+
+class BinaryULIDAttribute(ULIDTimeRangeMixin, BinarySerializeMixin, Attribute[ULID]):
     """
     Binary formatted ULID attribute
     """
@@ -51,3 +227,25 @@ class BinaryULIDAttribute(BinarySerializeMixin, Attribute[ULID]):
 
     def deserialize(self, value: AnyStr) -> ULID:
         return ULID.from_bytes(super().deserialize(value))
+
+    def serialize_many(
+        self, values: Iterable[Union[ULID, bytes]], raw: bool = False
+    ) -> List[str]:
+        """
+        Serialize a page of ULIDs (or 16 bytes values with `raw`) at once
+        """
+        if raw:
+            values = [_check_bytes(v) for v in values]
+        else:
+            values = [v.bytes for v in values]
+        return [b2a_base64(v, newline=False).decode(DEFAULT_ENCODING) for v in values]
+
+    def deserialize_many(
+        self, values: Iterable[AnyStr], raw: bool = False
+    ) -> List[Union[ULID, bytes]]:
+        """
+        Deserialize a page of base64 encoded ULIDs at once, `raw` returns the 16 bytes
+        """
+        if raw:
+            return [_check_bytes(a2b_base64(v)) for v in values]
+        return [_ulid_from_bytes(_check_bytes(a2b_base64(v))) for v in values]
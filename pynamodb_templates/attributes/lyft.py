@@ -4,20 +4,47 @@ attributes from `lyft/pynamodb_attributes` packages
 wrapping some attributes for full keyword arguments suggestion support
 """
 from typing import Type, Tuple, TypeVar, Any, Optional, Union, Callable
+from typing import Iterable, List, Mapping, get_type_hints
+from pynamodb import constants
+from pynamodb.expressions.condition import Condition
 from pynamodb_attributes import *
 from datetime import datetime, timezone, timedelta
 
+from pynamodb_templates.attributes._codecs import FieldCodec, _TypeCodec
+
 _T = TypeVar("_T")
 T = TypeVar("T", bound=Tuple[Any, ...])
 _DEFAULT_FIELD_DELIMITER = "::"
+# sorts after any encoded field, the UTF-8 bytes compared by DynamoDB included
+_MAX_CHARACTER = "\U0010ffff"
 
 
 class UnicodeDelimitedTupleAttribute(UnicodeDelimitedTupleAttribute):
+    """
+    Tuple joined by `delimiter`, typically a hierarchical sort key
+
+    `codecs` maps field names to `FieldCodec`s, fields without one are written with
+    `str` as upstream does. With order preserving codecs a query can select a
+    prefix of the tuple in its key condition:
+
+    >>> class Key(NamedTuple):
+    ...     tenant: str
+    ...     created: datetime
+    ...     sequence: int
+    >>> key = UnicodeDelimitedTupleAttribute(
+    ...     tuple_type=Key,
+    ...     codecs={"created": DatetimeCodec(), "sequence": IntCodec(8)},
+    ...     range_key=True,
+    ... )
+    >>> Model.query(hash_key, Model.key.begins_with(("acme",)))
+    """
+
     def __init__(
         self,
         *,
         tuple_type: Type[T],
         delimiter: str = _DEFAULT_FIELD_DELIMITER,
+        codecs: Optional[Mapping[str, FieldCodec]] = None,
         hash_key: bool = False,
         range_key: bool = False,
         null: Optional[bool] = None,
@@ -36,6 +63,102 @@ class UnicodeDelimitedTupleAttribute(UnicodeDelimitedTupleAttribute):
             default_for_new=default_for_new,
             attr_name=attr_name,
         )
+        self.codecs = dict(codecs or {})
+        # one codec per field, resolved once instead of on every deserialize
+        field_types = get_type_hints(tuple_type)
+        unknown = self.codecs.keys() - field_types.keys()
+        if unknown:
+            raise ValueError(f"codecs of unknown fields: {sorted(unknown)}")
+        self._codecs: List[FieldCodec] = [
+            self.codecs.get(name) or _TypeCodec(field_type)
+            for name, field_type in field_types.items()
+        ]
+
+    def serialize(self, value: T) -> str:
+        if not isinstance(value, self.tuple_type):
+            raise TypeError(
+                f"value has invalid type '{type(value)}'; expected '{self.tuple_type}'",
+            )
+        return self._join(value)
+
+    def deserialize(self, value: str) -> T:
+        codecs = self._codecs
+        if not codecs:
+            return self.tuple_type(value.split(self.delimiter))
+        values = value.split(self.delimiter, maxsplit=len(codecs))
+        return self.tuple_type(*[c.decode(v) for c, v in zip(codecs, values)])
+
+    def _join(self, value: Iterable[Any]) -> str:
+        values = list(value)
+        while values and values[-1] is None:
+            del values[-1]
+        if self._codecs:
+            if len(values) > len(self._codecs):
+                raise ValueError(f"`{value}` has more than {len(self._codecs)} fields")
+            strings = [c.encode(v) for c, v in zip(self._codecs, values)]
+        else:
+            strings = [str(v) for v in values]
+        if any(self.delimiter in s for s in strings):
+            raise ValueError(
+                f"Tuple elements may not contain delimiter '{self.delimiter}'",
+            )
+        return self.delimiter.join(strings)
+
+    def serialize_prefix(self, values: Iterable[Any]) -> str:
+        """
+        Serialize the leading fields of a tuple
+
+        Unless all the fields are given the prefix ends with the delimiter, so that
+        `("a",)` does not match the tuples starting with `"ab"`.
+        """
+        values = list(values)
+        while values and values[-1] is None:
+            del values[-1]
+        if not values or None in values:
+            raise ValueError(f"`{values}` is not a prefix of leading fields")
+        prefix = self._join(values)
+        if len(values) < len(self._codecs) or not self._codecs:
+            prefix += self.delimiter
+        return prefix
+
+    def _is_complete(self, values: Iterable[Any]) -> bool:
+        values = [v for v in values if v is not None]
+        return bool(self._codecs) and len(values) == len(self._codecs)
+
+    def begins_with(self, values: Iterable[Any]) -> Condition:
+        """
+        Condition on the tuples starting with the fields `values`
+        """
+        values = list(values)
+        prefix = {constants.STRING: self.serialize_prefix(values)}
+        if self._is_complete(values):
+            return self == prefix
+        return self.startswith(prefix)  # type: ignore[arg-type]
+
+    def prefix_between(self, low: Iterable[Any], high: Iterable[Any]) -> Condition:
+        """
+        Condition on the tuples from prefix `low` up to prefix `high`, inclusive
+        """
+        high = list(high)
+        upper = self.serialize_prefix(high)
+        if not self._is_complete(high):
+            upper += _MAX_CHARACTER
+        return self.between(
+            {constants.STRING: self.serialize_prefix(low)},
+            {constants.STRING: upper},
+        )
+
+    def prefix_after(self, low: Iterable[Any]) -> Condition:
+        """
+        Condition on the tuples from prefix `low`, inclusive
+        """
+        return self >= {constants.STRING: self.serialize_prefix(low)}
+
+    def prefix_before(self, high: Iterable[Any]) -> Condition:
+        """
+        Condition on the tuples before prefix `high`, exclusive
+        """
+        return self < {constants.STRING: self.serialize_prefix(high)}
 
 
 class UUIDAttribute(UUIDAttribute):
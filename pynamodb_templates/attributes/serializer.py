@@ -1,24 +1,128 @@
-import json
 from base64 import b64encode, b64decode
+from decimal import Decimal
+from math import isfinite
+from typing import Any, Union
 
 import pynamodb.constants
 from pynamodb.attributes import DEFAULT_ENCODING
 
+__all__ = [
+    "serialize_number",
+    "deserialize_number",
+    "NumberSerializeMixin",
+    "BinarySerializeMixin",
+]
+
+# DynamoDB numbers carry up to 38 significant digits
+# within the magnitude range 1E-130 ~ 9.99..9E+125
+NUMBER_PRECISION = 38
+NUMBER_MAX_EXPONENT = 125
+NUMBER_MIN_EXPONENT = -130
+
+_PRECISION_BOUND = 10**NUMBER_PRECISION
+
+_int_repr = int.__repr__
+_float_repr = float.__repr__
+
+
+def _check_int(value: int) -> None:
+    if -_PRECISION_BOUND < value < _PRECISION_BOUND:
+        return
+    digits = _int_repr(abs(value))
+    if len(digits.rstrip("0")) > NUMBER_PRECISION:
+        raise ValueError(
+            f"`{value}` exceeds {NUMBER_PRECISION} digits of number precision"
+        )
+    if len(digits) - 1 > NUMBER_MAX_EXPONENT:
+        raise ValueError(f"`{value}` is out of number range")
+
+
+def _check_decimal(value: Decimal) -> None:
+    if not value.is_finite():
+        raise ValueError(f"`{value}` is not a finite number")
+    if not value:
+        return
+    # `Decimal.normalize` rounds to the context precision, strip zeros by hand
+    digits = "".join(map(str, value.as_tuple().digits)).strip("0")
+    if len(digits) > NUMBER_PRECISION:
+        raise ValueError(
+            f"`{value}` exceeds {NUMBER_PRECISION} digits of number precision"
+        )
+    adjusted = value.adjusted()
+    if not NUMBER_MIN_EXPONENT <= adjusted <= NUMBER_MAX_EXPONENT:
+        raise ValueError(f"`{value}` is out of number range")
+
+
+def _check_float(value: float) -> None:
+    if not isfinite(value):
+        raise ValueError(f"`{value}` is not a finite number")
+    if value:
+        _check_decimal(Decimal(_float_repr(value)))
+
+
+def serialize_number(value: Any, strict: bool = False) -> str:
+    """
+    Encode a number into a DynamoDB number string
+
+    `int`, `bool` and `float` values take a fast path, `Decimal` values are encoded
+    exactly. With `strict`, values that DynamoDB can not store (non-finite,
+    more than 38 significant digits, out of range) raise `ValueError`.
+    """
+    cls = type(value)
+    if cls is int:
+        if strict:
+            _check_int(value)
+        return _int_repr(value)
+    if cls is bool:
+        return "1" if value else "0"
+    if cls is float:
+        if strict:
+            _check_float(value)
+        return _float_repr(value)
+    if isinstance(value, int):
+        # int subclasses like `IntEnum` members
+        return serialize_number(int(value), strict=strict)
+    if isinstance(value, float):
+        return serialize_number(float(value), strict=strict)
+    if isinstance(value, Decimal):
+        if strict:
+            _check_decimal(value)
+        return str(value)
+    if strict:
+        raise TypeError(f"`{type(value)}` is not a number type")
+    import json
+
+    return json.dumps(value)
+
+
+def deserialize_number(value: str) -> Union[int, float]:
+    """
+    Decode a DynamoDB number string
+
+    Integral values are returned as exact `int` (128-bit ULIDs included),
+    everything else as `float`.
+    """
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
 
 class NumberSerializeMixin:
     attr_type = pynamodb.constants.NUMBER
+    strict_number: bool = False
 
     def serialize(self, value):
         """
-        Encode numbers as JSON
+        Encode numbers as DynamoDB number strings
         """
-        return json.dumps(value)
+        return serialize_number(value, strict=self.strict_number)
 
     def deserialize(self, value):
         """
-        Decode numbers from JSON
+        Decode numbers from DynamoDB number strings
         """
-        return json.loads(value)
+        return deserialize_number(value)
 
 
 class BinarySerializeMixin:
@@ -0,0 +1,2 @@
+from ._backend import *
+from ._expressions import *
@@ -0,0 +1,831 @@
+import math
+import time
+import zlib
+from base64 import b64encode
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from contextlib import contextmanager
+from decimal import Decimal
+from threading import RLock
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type
+
+from pynamodb.connection import Connection
+from pynamodb.exceptions import VerboseClientError
+from pynamodb.models import Model
+from pynamodb.settings import OperationSettings
+
+from pynamodb_templates._size import item_size
+from pynamodb_templates.memory._expressions import (
+    Context,
+    ExpressionError,
+    apply_update,
+    copy_value,
+    evaluate,
+    key_value,
+    parse_condition,
+    parse_projection,
+    parse_update,
+    project,
+    resolve,
+)
+
+__all__ = ["MemoryDynamoDB", "MemoryConnection", "MemoryBackendError"]
+
+Item = Dict[str, Dict[str, Any]]
+_Key = Tuple[Any, Any]
+
+MAX_ITEM_SIZE = 400 * 1024
+MAX_PAGE_SIZE = 1024 * 1024
+BATCH_WRITE_LIMIT = 25
+BATCH_GET_LIMIT = 100
+_READ_UNIT = 4096
+_WRITE_UNIT = 1024
+
+
+class MemoryBackendError(Exception):
+    """
+    Error response of `MemoryDynamoDB`, `code` is the DynamoDB error code
+    """
+
+    def __init__(self, code: str, message: str) -> None:
+        super().__init__(f"{code}: {message}")
+        self.code = code
+        self.message = message
+
+
+def _validation(message: str) -> MemoryBackendError:
+    return MemoryBackendError("ValidationException", message)
+
+
+def _read_units(size: int, consistent: bool) -> float:
+    units = max(math.ceil(size / _READ_UNIT), 1)
+    return float(units) if consistent else units / 2
+
+
+def _write_units(size: int) -> float:
+    return float(max(math.ceil(size / _WRITE_UNIT), 1))
+
+
+# requests carry blobs as bytes or str like botocore parameters, responses are
+# the JSON of DynamoDB with base64 blobs, items are stored with bytes blobs
+
+
+def _stored(value: Dict[str, Any]) -> Dict[str, Any]:
+    attr_type, data = next(iter(value.items()))
+    if attr_type == "B":
+        return {"B": data.encode() if isinstance(data, str) else bytes(data)}
+    if attr_type == "BS":
+        return {"BS": [v.encode() if isinstance(v, str) else bytes(v) for v in data]}
+    if attr_type == "L":
+        return {"L": [_stored(v) for v in data]}
+    if attr_type == "M":
+        return {"M": {k: _stored(v) for k, v in data.items()}}
+    return copy_value(value)
+
+
+def _stored_item(item: Item) -> Item:
+    return {name: _stored(value) for name, value in item.items()}
+
+
+def _wire(value: Dict[str, Any]) -> Dict[str, Any]:
+    attr_type, data = next(iter(value.items()))
+    if attr_type == "B":
+        return {"B": b64encode(data).decode()}
+    if attr_type == "BS":
+        return {"BS": [b64encode(v).decode() for v in data]}
+    if attr_type == "L":
+        return {"L": [_wire(v) for v in data]}
+    if attr_type == "M":
+        return {"M": {k: _wire(v) for k, v in data.items()}}
+    return copy_value(value)
+
+
+def _wire_item(item: Item) -> Item:
+    return {name: _wire(value) for name, value in item.items()}
+
+
+def _spread(hash_value: Any) -> int:
+    """
+    Stable stand-in for the partition hash, orders scans and assigns segments
+    """
+    if isinstance(hash_value, Decimal):
+        hash_value = hash_value.normalize()
+    return zlib.crc32(repr(hash_value).encode())
+
+
+class _KeySchema:
+    __slots__ = ("hash_name", "range_name", "names")
+
+    def __init__(self, key_schema: List[Dict[str, str]]) -> None:
+        self.hash_name = next(
+            k["AttributeName"] for k in key_schema if k["KeyType"] == "HASH"
+        )
+        self.range_name = next(
+            (k["AttributeName"] for k in key_schema if k["KeyType"] == "RANGE"), None
+        )
+        if self.range_name is None:
+            self.names: Tuple[str, ...] = (self.hash_name,)
+        else:
+            self.names = (self.hash_name, self.range_name)
+
+    def key_of(self, item: Item) -> Optional[_Key]:
+        """
+        Ordered key of `item`, None if it lacks one of the key attributes
+        """
+        hash_value = item.get(self.hash_name)
+        if hash_value is None:
+            return None
+        if self.range_name is None:
+            return key_value(hash_value), None
+        range_value = item.get(self.range_name)
+        if range_value is None:
+            return None
+        return key_value(hash_value), key_value(range_value)
+
+
+class _Index:
+    def __init__(self, description: Dict[str, Any], local: bool) -> None:
+        self.name = description["IndexName"]
+        self.local = local
+        self.schema = _KeySchema(description["KeySchema"])
+        projection = description.get("Projection", {})
+        self.projection_type = projection.get("ProjectionType", "ALL")
+        self.non_key_attributes = tuple(projection.get("NonKeyAttributes", ()))
+        # index hash value -> {(index range value, table key): table key}, sparse
+        self.partitions: Dict[Any, Dict[Tuple[Any, _Key], _Key]] = {}
+
+    def position(self, item: Item, key: _Key) -> Optional[Tuple[Any, Tuple]]:
+        index_key = self.schema.key_of(item)
+        if index_key is None:
+            return None
+        return index_key[0], (index_key[1], key)
+
+    def add(self, item: Item, key: _Key) -> None:
+        position = self.position(item, key)
+        if position is not None:
+            self.partitions.setdefault(position[0], {})[position[1]] = key
+
+    def discard(self, item: Item, key: _Key) -> None:
+        position = self.position(item, key)
+        if position is not None:
+            partition = self.partitions[position[0]]
+            del partition[position[1]]
+            if not partition:
+                del self.partitions[position[0]]
+
+    def project(self, item: Item, table_names: Tuple[str, ...]) -> Item:
+        if self.projection_type == "ALL":
+            return item
+        names = set(table_names + self.schema.names)
+        if self.projection_type == "INCLUDE":
+            names.update(self.non_key_attributes)
+        return {name: value for name, value in item.items() if name in names}
+
+
+class _Table:
+    def __init__(self, description: Dict[str, Any]) -> None:
+        self.name = description["TableName"]
+        self.schema = _KeySchema(description["KeySchema"])
+        self.attribute_types = {
+            d["AttributeName"]: d["AttributeType"]
+            for d in description["AttributeDefinitions"]
+        }
+        self.indexes: Dict[str, _Index] = {}
+        for index in description.get("GlobalSecondaryIndexes") or ():
+            self.indexes[index["IndexName"]] = _Index(index, local=False)
+        for index in description.get("LocalSecondaryIndexes") or ():
+            self.indexes[index["IndexName"]] = _Index(index, local=True)
+        self.key_names = set(self.schema.names)
+        for index in self.indexes.values():
+            self.key_names.update(index.schema.names)
+        # hash value -> {range value: item}
+        self.partitions: Dict[Any, Dict[Any, Item]] = {}
+        self.ttl_attribute: Optional[str] = None
+        self.description = {
+            key: copy_value(description[key])
+            for key in (
+                "TableName",
+                "KeySchema",
+                "AttributeDefinitions",
+                "GlobalSecondaryIndexes",
+                "LocalSecondaryIndexes",
+                "BillingMode",
+                "ProvisionedThroughput",
+                "StreamSpecification",
+            )
+            if description.get(key)
+        }
+
+    def describe(self) -> Dict[str, Any]:
+        description = copy_value(self.description)
+        description["TableStatus"] = "ACTIVE"
+        description["ItemCount"] = sum(len(p) for p in self.partitions.values())
+        for key in ("GlobalSecondaryIndexes", "LocalSecondaryIndexes"):
+            for index in description.get(key, ()):
+                index["IndexStatus"] = "ACTIVE"
+        return description
+
+    def check_keys(self, item: Item) -> None:
+        for name in self.key_names:
+            value = item.get(name)
+            if value is None:
+                continue
+            attr_type, data = next(iter(value.items()))
+            expected = self.attribute_types.get(name, attr_type)
+            if attr_type != expected:
+                raise _validation(
+                    f"Type mismatch for key `{name}`, expected {expected}, "
+                    f"got {attr_type}"
+                )
+            if attr_type in ("S", "B") and not data:
+                raise _validation(f"The key attribute `{name}` is empty")
+
+    def key(self, key: Item) -> _Key:
+        if set(key) != set(self.schema.names):
+            raise _validation(
+                f"The provided key element does not match the schema of `{self.name}`"
+            )
+        self.check_keys(key)
+        return self.schema.key_of(key)
+
+    def item_key(self, item: Item) -> _Key:
+        key = self.schema.key_of(item)
+        if key is None:
+            raise _validation(f"Missing the key attributes {list(self.schema.names)}")
+        self.check_keys(item)
+        return key
+
+    def get(self, key: _Key) -> Optional[Item]:
+        partition = self.partitions.get(key[0])
+        return None if partition is None else partition.get(key[1])
+
+    def put(self, key: _Key, item: Item) -> None:
+        if item_size(item) > MAX_ITEM_SIZE:
+            raise _validation("Item size has exceeded the maximum size")
+        self.delete(key)
+        self.partitions.setdefault(key[0], {})[key[1]] = item
+        for index in self.indexes.values():
+            index.add(item, key)
+
+    def delete(self, key: _Key) -> Optional[Item]:
+        partition = self.partitions.get(key[0])
+        if partition is None:
+            return None
+        old = partition.pop(key[1], None)
+        if not partition:
+            del self.partitions[key[0]]
+        if old is not None:
+            for index in self.indexes.values():
+                index.discard(old, key)
+        return old
+
+    def index(self, index_name: Optional[str]) -> Optional[_Index]:
+        if index_name is None:
+            return None
+        try:
+            return self.indexes[index_name]
+        except KeyError:
+            raise _validation(
+                f"The table `{self.name}` has no index `{index_name}`"
+            ) from None
+
+    def key_attributes(self, item: Item, index: Optional[_Index]) -> Item:
+        names = self.schema.names + (index.schema.names if index else ())
+        return {name: _wire(item[name]) for name in names}
+
+
+class MemoryDynamoDB:
+    """
+    In-process DynamoDB serving the low level API, for tests and benchmarks
+
+    Tables, items and secondary indexes live in dictionaries and requests are
+    served one at a time under a lock. Conditions, filters, projections,
+    pagination, batch limits and consumed capacity follow DynamoDB, indexes
+    are updated synchronously and items only expire on `expire`, so a run
+    always gives the same results. `latency` adds a fixed delay to every
+    request, outside the lock, to model round trips in benchmarks.
+
+    >>> dynamodb = MemoryDynamoDB()
+    >>> with dynamodb.connect(Model):
+    >>>     Model.create_table()
+    >>>     Model(hash_key).save()
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.tables: Dict[str, _Table] = {}
+        self.requests: Counter = Counter()
+        self._lock = RLock()
+        self._operations: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            "CreateTable": self._create_table,
+            "DeleteTable": self._delete_table,
+            "DescribeTable": self._describe_table,
+            "ListTables": self._list_tables,
+            "UpdateTimeToLive": self._update_time_to_live,
+            "DescribeTimeToLive": self._describe_time_to_live,
+            "GetItem": self._get_item,
+            "PutItem": self._put_item,
+            "UpdateItem": self._update_item,
+            "DeleteItem": self._delete_item,
+            "Query": self._query,
+            "Scan": self._scan,
+            "BatchWriteItem": self._batch_write_item,
+            "BatchGetItem": self._batch_get_item,
+        }
+
+    def __call__(self, operation_name: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Serves a request, raises `MemoryBackendError` with the DynamoDB error code
+        """
+        operation = self._operations.get(operation_name)
+        if operation is None:
+            raise _validation(f"{operation_name} is not supported")
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.requests[operation_name] += 1
+            try:
+                return operation(kwargs)
+            except ExpressionError as e:
+                raise _validation(str(e)) from e
+
+    def connection(self, **kwargs) -> "MemoryConnection":
+        return MemoryConnection(self, **kwargs)
+
+    def bind(self, *models: Type[Model]) -> None:
+        """
+        Sends the requests of `models` to this backend instead of `Meta.host`
+        """
+        for model in models:
+            table_connection = model._get_connection()
+            # the meta table was built from the model schema, no request is made
+            meta_table = table_connection.get_meta_table()
+            table_connection.connection = self.connection(region=model.Meta.region)
+            table_connection.connection.add_meta_table(meta_table)
+
+    @staticmethod
+    def unbind(*models: Type[Model]) -> None:
+        for model in models:
+            model._connection = None
+
+    @contextmanager
+    def connect(self, *models: Type[Model]) -> Iterator["MemoryDynamoDB"]:
+        self.bind(*models)
+        try:
+            yield self
+        finally:
+            self.unbind(*models)
+
+    def clear(self) -> None:
+        """
+        Drops every item, keeping the tables
+        """
+        with self._lock:
+            for table in self.tables.values():
+                table.partitions.clear()
+                for index in table.indexes.values():
+                    index.partitions.clear()
+
+    def expire(self, table_name: str, now: Optional[float] = None) -> int:
+        """
+        Deletes the items past their time to live, returns how many
+        """
+        now = Decimal(time.time() if now is None else now)
+        with self._lock:
+            table = self._table(table_name)
+            if table.ttl_attribute is None:
+                return 0
+            expired = []
+            for hash_value, partition in table.partitions.items():
+                for range_value, item in partition.items():
+                    expires = item.get(table.ttl_attribute, {}).get("N")
+                    if expires is not None and Decimal(expires) <= now:
+                        expired.append((hash_value, range_value))
+            for key in expired:
+                table.delete(key)
+            return len(expired)
+
+    def _table(self, name: str) -> _Table:
+        try:
+            return self.tables[name]
+        except KeyError:
+            raise MemoryBackendError(
+                "ResourceNotFoundException", f"Requested resource not found: {name}"
+            ) from None
+
+    @staticmethod
+    def _capacity(kwargs, table: _Table, units: float) -> Dict[str, Any]:
+        if kwargs.get("ReturnConsumedCapacity", "NONE") == "NONE":
+            return {}
+        return {"ConsumedCapacity": {"TableName": table.name, "CapacityUnits": units}}
+
+    @staticmethod
+    def _context(kwargs: Dict[str, Any], *expressions: Optional[str]) -> Context:
+        values = kwargs.get("ExpressionAttributeValues") or {}
+        context = Context(
+            kwargs.get("ExpressionAttributeNames"),
+            {placeholder: _stored(value) for placeholder, value in values.items()},
+        )
+        context.check_unused(*expressions)
+        return context
+
+    @staticmethod
+    def _check_condition(kwargs, item: Optional[Item], context: Context) -> None:
+        expression = kwargs.get("ConditionExpression")
+        if expression is None:
+            return
+        if not evaluate(parse_condition(expression), item or {}, context):
+            raise MemoryBackendError(
+                "ConditionalCheckFailedException", "The conditional request failed"
+            )
+
+    # tables
+
+    def _create_table(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        name = kwargs["TableName"]
+        if name in self.tables:
+            raise MemoryBackendError(
+                "ResourceInUseException", f"Table already exists: {name}"
+            )
+        self.tables[name] = table = _Table(kwargs)
+        return {"TableDescription": table.describe()}
+
+    def _delete_table(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        table = self._table(kwargs["TableName"])
+        del self.tables[table.name]
+        return {"TableDescription": table.describe()}
+
+    def _describe_table(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        return {"Table": self._table(kwargs["TableName"]).describe()}
+
+    def _list_tables(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        return {"TableNames": sorted(self.tables)}
+
+    def _update_time_to_live(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        table = self._table(kwargs["TableName"])
+        specification = kwargs["TimeToLiveSpecification"]
+        if specification["Enabled"]:
+            table.ttl_attribute = specification["AttributeName"]
+        else:
+            table.ttl_attribute = None
+        return {"TimeToLiveSpecification": specification}
+
+    def _describe_time_to_live(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        table = self._table(kwargs["TableName"])
+        if table.ttl_attribute is None:
+            return {"TimeToLiveDescription": {"TimeToLiveStatus": "DISABLED"}}
+        description = {"TimeToLiveStatus": "ENABLED"}
+        description["AttributeName"] = table.ttl_attribute
+        return {"TimeToLiveDescription": description}
+
+    # items
+
+    def _get_item(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        table = self._table(kwargs["TableName"])
+        projection = kwargs.get("ProjectionExpression")
+        context = self._context(kwargs, projection)
+        item = table.get(table.key(_stored_item(kwargs["Key"])))
+        size = item_size(item) if item is not None else 0
+        consistent = bool(kwargs.get("ConsistentRead"))
+        response = self._capacity(kwargs, table, _read_units(size, consistent))
+        if item is not None:
+            if projection:
+                item = project(item, parse_projection(projection), context)
+            response["Item"] = _wire_item(item)
+        return response
+
+    def _written(
+        self,
+        kwargs: Dict[str, Any],
+        table: _Table,
+        old: Optional[Item],
+        new: Optional[Item],
+        updated_names: List[str] = (),
+    ) -> Dict[str, Any]:
+        size = max(item_size(old or {}), item_size(new or {}))
+        response = self._capacity(kwargs, table, _write_units(size))
+        return_values = kwargs.get("ReturnValues", "NONE")
+        if return_values == "ALL_OLD":
+            attributes = old
+        elif return_values == "ALL_NEW":
+            attributes = new
+        elif return_values in ("UPDATED_OLD", "UPDATED_NEW"):
+            source = (old if return_values == "UPDATED_OLD" else new) or {}
+            attributes = {n: source[n] for n in updated_names if n in source}
+        else:
+            attributes = None
+        if attributes:
+            response["Attributes"] = _wire_item(attributes)
+        return response
+
+    def _put_item(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        table = self._table(kwargs["TableName"])
+        context = self._context(kwargs, kwargs.get("ConditionExpression"))
+        item = _stored_item(kwargs["Item"])
+        key = table.item_key(item)
+        old = table.get(key)
+        self._check_condition(kwargs, old, context)
+        table.put(key, item)
+        return self._written(kwargs, table, old, item)
+
+    def _update_item(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        table = self._table(kwargs["TableName"])
+        expression = kwargs.get("UpdateExpression")
+        context = self._context(kwargs, expression, kwargs.get("ConditionExpression"))
+        key_attributes = _stored_item(kwargs["Key"])
+        key = table.key(key_attributes)
+        old = table.get(key)
+        self._check_condition(kwargs, old, context)
+        item, updated_names = old if old is not None else key_attributes, []
+        if expression:
+            item, updated_names = apply_update(item, parse_update(expression), context)
+            for name in table.schema.names:
+                if name in updated_names:
+                    raise _validation(f"Cannot update the key attribute `{name}`")
+            table.check_keys(item)
+        table.put(key, item)
+        return self._written(kwargs, table, old, item, updated_names)
+
+    def _delete_item(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        table = self._table(kwargs["TableName"])
+        context = self._context(kwargs, kwargs.get("ConditionExpression"))
+        key = table.key(_stored_item(kwargs["Key"]))
+        old = table.get(key)
+        self._check_condition(kwargs, old, context)
+        table.delete(key)
+        return self._written(kwargs, table, old, None)
+
+    # reads
+
+    def _page(
+        self,
+        kwargs: Dict[str, Any],
+        table: _Table,
+        index: Optional[_Index],
+        entries: List[Tuple[Any, Item]],
+        start: Optional[Any],
+        key_condition: Optional[Tuple],
+        context: Context,
+    ) -> Dict[str, Any]:
+        """
+        A page of `entries`, the items sorted by their position in the table
+        """
+        forward = kwargs.get("ScanIndexForward", True)
+        if start is not None:
+            positions = [position for position, _ in entries]
+            if forward:
+                entries = entries[bisect_right(positions, start) :]
+            else:
+                entries = entries[: bisect_left(positions, start)]
+        if not forward:
+            entries.reverse()
+        consistent = bool(kwargs.get("ConsistentRead"))
+        if consistent and index is not None and not index.local:
+            raise _validation("Consistent reads are not supported on global indexes")
+        limit = kwargs.get("Limit")
+        if limit is not None and limit < 1:
+            raise _validation("Limit must be greater than zero")
+        filter_expression = kwargs.get("FilterExpression")
+        filter_condition = filter_expression and parse_condition(filter_expression)
+        projection = kwargs.get("ProjectionExpression")
+        projection_paths = projection and parse_projection(projection)
+        count_only = kwargs.get("Select") == "COUNT"
+
+        items: List[Item] = []
+        count = scanned = size = 0
+        last = None
+        more = False
+        for _, item in entries:
+            if key_condition is not None and not evaluate(key_condition, item, context):
+                continue
+            if scanned == limit or size >= MAX_PAGE_SIZE:
+                more = True
+                break
+            if index is not None:
+                item = index.project(item, table.schema.names)
+            scanned += 1
+            size += item_size(item)
+            last = item
+            if filter_condition and not evaluate(filter_condition, item, context):
+                continue
+            count += 1
+            if not count_only:
+                if projection_paths:
+                    item = project(item, projection_paths, context)
+                items.append(_wire_item(item))
+
+        response = self._capacity(kwargs, table, _read_units(size, consistent))
+        response["Count"] = count
+        response["ScannedCount"] = scanned
+        if not count_only:
+            response["Items"] = items
+        if more:
+            response["LastEvaluatedKey"] = table.key_attributes(last, index)
+        return response
+
+    def _read_context(self, kwargs: Dict[str, Any], *expressions) -> Context:
+        return self._context(
+            kwargs,
+            kwargs.get("FilterExpression"),
+            kwargs.get("ProjectionExpression"),
+            *expressions,
+        )
+
+    def _query(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        table = self._table(kwargs["TableName"])
+        index = table.index(kwargs.get("IndexName"))
+        expression = kwargs.get("KeyConditionExpression")
+        if not expression:
+            raise _validation("KeyConditionExpression is required")
+        context = self._read_context(kwargs, expression)
+        key_condition = parse_condition(expression)
+        schema = index.schema if index is not None else table.schema
+        hash_value = self._hash_condition(key_condition, schema, context)
+
+        start_key = kwargs.get("ExclusiveStartKey")
+        start = None
+        if index is None:
+            entries = sorted(table.partitions.get(hash_value, {}).items())
+            if start_key:
+                start = table.item_key(_stored_item(start_key))[1]
+        else:
+            partition = index.partitions.get(hash_value, {})
+            entries = [(pos, table.get(key)) for pos, key in partition.items()]
+            entries.sort(key=lambda entry: entry[0])
+            if start_key:
+                start_item = _stored_item(start_key)
+                start = index.position(start_item, table.item_key(start_item))[1]
+        return self._page(kwargs, table, index, entries, start, key_condition, context)
+
+    @staticmethod
+    def _hash_condition(node: Tuple, schema: _KeySchema, context: Context) -> Any:
+        """
+        Hash key value of a key condition, checking it only refers to the keys
+        """
+        conditions = []
+        pending = [node]
+        while pending:
+            node = pending.pop()
+            if node[0] == "and":
+                pending.extend(node[1:])
+            else:
+                conditions.append(node)
+        hash_value = None
+        key_paths = [(name,) for name in schema.names]
+        for condition in conditions:
+            if condition[0] == "function":
+                operands = condition[2][:1]
+            elif condition[0] == "compare":
+                operands = condition[2:]
+            else:
+                operands = condition[1:2]
+            paths = [
+                resolve(operand, context)
+                for operand in operands
+                if isinstance(operand, tuple) and operand[0] == "path"
+            ]
+            if len(paths) != 1 or paths[0] not in key_paths:
+                raise _validation("Invalid KeyConditionExpression")
+            if paths[0] == (schema.hash_name,):
+                if condition[:2] != ("compare", "=") or hash_value is not None:
+                    raise _validation("The hash key condition must be an equality")
+                value = condition[3] if condition[2][0] == "path" else condition[2]
+                hash_value = key_value(context.value(value[1]))
+        if hash_value is None:
+            raise _validation("Query condition missed key schema element")
+        return hash_value
+
+    def _scan(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        table = self._table(kwargs["TableName"])
+        index = table.index(kwargs.get("IndexName"))
+        context = self._read_context(kwargs)
+        segment = kwargs.get("Segment")
+        total_segments = kwargs.get("TotalSegments")
+        if (segment is None) != (total_segments is None):
+            raise _validation("Segment and TotalSegments go together")
+
+        entries = []
+        partitions = table.partitions if index is None else index.partitions
+        for hash_value, partition in partitions.items():
+            spread = _spread(hash_value)
+            if total_segments and spread % total_segments != segment:
+                continue
+            for position, value in partition.items():
+                item = value if index is None else table.get(value)
+                entries.append(((spread, hash_value, position), item))
+        entries.sort(key=lambda entry: entry[0])
+
+        start_key = kwargs.get("ExclusiveStartKey")
+        start = None
+        if start_key:
+            start_item = _stored_item(start_key)
+            key = table.item_key(start_item)
+            if index is not None:
+                key = index.position(start_item, key)
+            start = (_spread(key[0]), key[0], key[1])
+        return self._page(kwargs, table, index, entries, start, None, context)
+
+    # batches
+
+    def _batch_write_item(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        # the whole batch is checked before any write, like DynamoDB does
+        writes = []
+        for table_name, requests in kwargs["RequestItems"].items():
+            table = self._table(table_name)
+            for request in requests:
+                if "PutRequest" in request:
+                    item = _stored_item(request["PutRequest"]["Item"])
+                    key = table.item_key(item)
+                    if item_size(item) > MAX_ITEM_SIZE:
+                        raise _validation("Item size has exceeded the maximum size")
+                else:
+                    item = None
+                    key = table.key(_stored_item(request["DeleteRequest"]["Key"]))
+                writes.append((table, key, item))
+        if not 0 < len(writes) <= BATCH_WRITE_LIMIT:
+            raise _validation(f"A batch writes 1 to {BATCH_WRITE_LIMIT} items")
+        if len({(table.name, key) for table, key, _ in writes}) != len(writes):
+            raise _validation("Provided list of item keys contains duplicates")
+
+        units: Counter = Counter()
+        for table, key, item in writes:
+            old = table.get(key)
+            size = max(item_size(old or {}), item_size(item or {}))
+            units[table.name] += _write_units(size)
+            if item is None:
+                table.delete(key)
+            else:
+                table.put(key, item)
+        response: Dict[str, Any] = {"UnprocessedItems": {}}
+        if kwargs.get("ReturnConsumedCapacity", "NONE") != "NONE":
+            response["ConsumedCapacity"] = [
+                {"TableName": name, "CapacityUnits": total}
+                for name, total in units.items()
+            ]
+        return response
+
+    def _batch_get_item(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        reads = []
+        for table_name, request in kwargs["RequestItems"].items():
+            table = self._table(table_name)
+            projection = request.get("ProjectionExpression")
+            context = self._context(request, projection)
+            keys = [table.key(_stored_item(key)) for key in request["Keys"]]
+            if len(set(keys)) != len(keys):
+                raise _validation("Provided list of item keys contains duplicates")
+            reads.append((table, keys, projection, context, request))
+        if not 0 < sum(len(read[1]) for read in reads) <= BATCH_GET_LIMIT:
+            raise _validation(f"A batch reads 1 to {BATCH_GET_LIMIT} items")
+
+        responses: Dict[str, List[Item]] = {}
+        capacity = []
+        for table, keys, projection, context, request in reads:
+            consistent = bool(request.get("ConsistentRead"))
+            items = responses[table.name] = []
+            units = 0.0
+            for key in keys:
+                item = table.get(key)
+                units += _read_units(item_size(item or {}), consistent)
+                if item is None:
+                    continue
+                if projection:
+                    item = project(item, parse_projection(projection), context)
+                items.append(_wire_item(item))
+            capacity.append({"TableName": table.name, "CapacityUnits": units})
+        response: Dict[str, Any] = {"Responses": responses, "UnprocessedKeys": {}}
+        if kwargs.get("ReturnConsumedCapacity", "NONE") != "NONE":
+            response["ConsumedCapacity"] = capacity
+        return response
+
+
+class MemoryConnection(Connection):
+    """
+    pynamodb `Connection` sending its requests to a `MemoryDynamoDB`
+
+    Errors are raised as the `VerboseClientError` of the real connection, so
+    models raise `PutError`, `DoesNotExist`, `TableDoesNotExist`... as usual.
+    """
+
+    def __init__(self, backend: MemoryDynamoDB, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.backend = backend
+
+    def _make_api_call(
+        self,
+        operation_name: str,
+        operation_kwargs: Dict,
+        settings: OperationSettings = OperationSettings.default,
+    ) -> Dict:
+        try:
+            data = self.backend(operation_name, operation_kwargs)
+        except MemoryBackendError as e:
+            if "RequestItems" in operation_kwargs:
+                table_name = ",".join(operation_kwargs["RequestItems"])
+            else:
+                table_name = operation_kwargs.get("TableName")
+            raise VerboseClientError(
+                {"Error": {"Message": e.message, "Code": e.code}},
+                operation_name,
+                {"table_name": table_name, "request_id": None},
+            ) from None
+        return self._handle_binary_attributes(data)
@@ -0,0 +1,689 @@
+import re
+from decimal import Decimal, localcontext
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+__all__ = ["ExpressionError"]
+
+AttributeValue = Dict[str, Any]
+Item = Dict[str, AttributeValue]
+Node = Tuple[Any, ...]
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+      (?P<name>\#[A-Za-z0-9_]+)
+    | (?P<value>:[A-Za-z0-9_]+)
+    | (?P<number>\d+)
+    | (?P<word>[A-Za-z_][A-Za-z0-9_]*)
+    | (?P<op><>|<=|>=|[=<>(),.\[\]+-])
+    )""",
+    re.VERBOSE,
+)
+_COMPARATORS = frozenset({"=", "<>", "<", "<=", ">", ">="})
+_CONDITION_FUNCTIONS = frozenset(
+    {"attribute_exists", "attribute_not_exists", "attribute_type"}
+    | {"begins_with", "contains"}
+)
+_KEYWORDS = frozenset({"AND", "OR", "NOT", "BETWEEN", "IN"})
+_CLAUSES = frozenset({"SET", "REMOVE", "ADD", "DELETE"})
+_CACHE_SIZE = 1024
+_REMOVED = object()
+
+
+class ExpressionError(ValueError):
+    """
+    Invalid expression, or one that cannot be applied to the item
+    """
+
+
+def _tokenize(expression: str) -> List[Tuple[str, str]]:
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = _TOKEN.match(expression, position)
+        if match is None or match.end() == position:
+            raise ExpressionError(f"Invalid expression near `{expression[position:]}`")
+        tokens.append((match.lastgroup, match.group(match.lastgroup)))
+        position = match.end()
+    tokens.append(("end", ""))
+    return tokens
+
+
+class _Parser:
+    def __init__(self, expression: str) -> None:
+        self.expression = expression
+        self.tokens = _tokenize(expression)
+        self.position = 0
+
+    def peek(self, offset: int = 0) -> Tuple[str, str]:
+        return self.tokens[min(self.position + offset, len(self.tokens) - 1)]
+
+    def take(self) -> Tuple[str, str]:
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def accept(self, text: str) -> bool:
+        kind, value = self.peek()
+        if kind in ("op", "word") and value.upper() == text:
+            self.position += 1
+            return True
+        return False
+
+    def expect(self, text: str) -> None:
+        if not self.accept(text):
+            raise self.error(f"`{text}` expected")
+
+    def error(self, message: str) -> ExpressionError:
+        return ExpressionError(f"{message} in `{self.expression}`")
+
+    def end(self) -> None:
+        if self.peek()[0] != "end":
+            raise self.error(f"Unexpected `{self.peek()[1]}`")
+
+    # paths and operands
+
+    def path(self) -> Node:
+        kind, value = self.take()
+        if kind not in ("name", "word") or value.upper() in _KEYWORDS:
+            raise self.error(f"Attribute name expected, got `{value}`")
+        elements: List[Union[str, int]] = [value]
+        while True:
+            if self.accept("."):
+                kind, value = self.take()
+                if kind not in ("name", "word"):
+                    raise self.error("Attribute name expected after `.`")
+                elements.append(value)
+            elif self.accept("["):
+                kind, value = self.take()
+                if kind != "number":
+                    raise self.error("List index expected")
+                elements.append(int(value))
+                self.expect("]")
+            else:
+                return ("path", tuple(elements))
+
+    def operand(self) -> Node:
+        kind, value = self.peek()
+        if kind == "value":
+            self.position += 1
+            return ("value", value)
+        if kind == "word" and self.peek(1) == ("op", "("):
+            function = value.lower()
+            self.position += 2
+            if function == "size":
+                node = ("size", self.path())
+            elif function == "if_not_exists":
+                path = self.path()
+                self.expect(",")
+                node = ("if_not_exists", path, self.set_value())
+            elif function == "list_append":
+                first = self.set_value()
+                self.expect(",")
+                node = ("list_append", first, self.set_value())
+            else:
+                raise self.error(f"Unknown function `{value}`")
+            self.expect(")")
+            return node
+        return self.path()
+
+    # conditions
+
+    def condition(self) -> Node:
+        node = self.conjunction()
+        while self.accept("OR"):
+            node = ("or", node, self.conjunction())
+        return node
+
+    def conjunction(self) -> Node:
+        node = self.negation()
+        while self.accept("AND"):
+            node = ("and", node, self.negation())
+        return node
+
+    def negation(self) -> Node:
+        if self.accept("NOT"):
+            return ("not", self.negation())
+        return self.comparison()
+
+    def comparison(self) -> Node:
+        if self.accept("("):
+            node = self.condition()
+            self.expect(")")
+            return node
+        kind, value = self.peek()
+        if (
+            kind == "word"
+            and value.lower() in _CONDITION_FUNCTIONS
+            and self.peek(1) == ("op", "(")
+        ):
+            self.position += 2
+            args = [self.operand()]
+            while self.accept(","):
+                args.append(self.operand())
+            self.expect(")")
+            return ("function", value.lower(), tuple(args))
+
+        left = self.operand()
+        kind, value = self.peek()
+        if kind == "op" and value in _COMPARATORS:
+            self.position += 1
+            return ("compare", value, left, self.operand())
+        if self.accept("BETWEEN"):
+            lower = self.operand()
+            self.expect("AND")
+            return ("between", left, lower, self.operand())
+        if self.accept("IN"):
+            self.expect("(")
+            candidates = [self.operand()]
+            while self.accept(","):
+                candidates.append(self.operand())
+            self.expect(")")
+            return ("in", left, tuple(candidates))
+        raise self.error(f"Comparison expected, got `{value}`")
+
+    # updates
+
+    def set_value(self) -> Node:
+        node = self.operand()
+        if self.accept("+"):
+            return ("+", node, self.operand())
+        if self.accept("-"):
+            return ("-", node, self.operand())
+        return node
+
+    def update(self) -> List[Node]:
+        actions = []
+        seen = set()
+        while self.peek()[0] != "end":
+            kind, clause = self.take()
+            clause = clause.upper()
+            if kind != "word" or clause not in _CLAUSES:
+                raise self.error(f"Update clause expected, got `{clause}`")
+            if clause in seen:
+                raise self.error(f"The `{clause}` clause is given twice")
+            seen.add(clause)
+            while True:
+                path = self.path()
+                if clause == "SET":
+                    self.expect("=")
+                    actions.append(("SET", path, self.set_value()))
+                elif clause == "REMOVE":
+                    actions.append(("REMOVE", path, None))
+                else:
+                    kind, value = self.take()
+                    if kind != "value":
+                        raise self.error(f"Value expected for `{clause}`")
+                    actions.append((clause, path, ("value", value)))
+                if not self.accept(","):
+                    break
+        if not actions:
+            raise self.error("Empty update")
+        return actions
+
+    def projection(self) -> List[Node]:
+        paths = [self.path()]
+        while self.accept(","):
+            paths.append(self.path())
+        return paths
+
+
+_cache: Dict[Tuple[str, str], Any] = {}
+
+
+def _parse(kind: str, expression: str) -> Any:
+    key = (kind, expression)
+    parsed = _cache.get(key)
+    if parsed is None:
+        parser = _Parser(expression)
+        if kind == "condition":
+            parsed = parser.condition()
+        elif kind == "update":
+            parsed = parser.update()
+        else:
+            parsed = parser.projection()
+        parser.end()
+        if len(_cache) >= _CACHE_SIZE:
+            _cache.clear()
+        _cache[key] = parsed
+    return parsed
+
+
+def parse_condition(expression: str) -> Node:
+    return _parse("condition", expression)
+
+
+def parse_update(expression: str) -> List[Node]:
+    return _parse("update", expression)
+
+
+def parse_projection(expression: str) -> List[Node]:
+    return _parse("projection", expression)
+
+
+# values
+
+
+def _number(value: str) -> Decimal:
+    return Decimal(value)
+
+
+def format_number(value: Decimal) -> str:
+    with localcontext() as context:
+        context.prec = 38
+        value = value.normalize()
+    return format(value, "f")
+
+
+def _binary(value: Union[str, bytes]) -> bytes:
+    # a str blob is sent as its UTF-8 bytes, like botocore does
+    return value.encode() if isinstance(value, str) else bytes(value)
+
+
+def plain(value: AttributeValue) -> Tuple[str, Any]:
+    """
+    `(type, comparable python value)` of an attribute value
+    """
+    attr_type, data = next(iter(value.items()))
+    if attr_type == "S":
+        return attr_type, data
+    if attr_type == "N":
+        return attr_type, _number(data)
+    if attr_type == "B":
+        return attr_type, _binary(data)
+    if attr_type == "SS":
+        return attr_type, frozenset(data)
+    if attr_type == "NS":
+        return attr_type, frozenset(map(_number, data))
+    if attr_type == "BS":
+        return attr_type, frozenset(map(_binary, data))
+    if attr_type == "L":
+        return attr_type, [plain(v) for v in data]
+    if attr_type == "M":
+        return attr_type, {k: plain(v) for k, v in data.items()}
+    if attr_type == "NULL":
+        return attr_type, None
+    return attr_type, data
+
+
+def key_value(value: AttributeValue) -> Any:
+    """
+    Python value ordering like DynamoDB orders keys, UTF-8 bytes order is code points
+    """
+    return plain(value)[1]
+
+
+def copy_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: copy_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [copy_value(v) for v in value]
+    return value
+
+
+_PLACEHOLDER = re.compile(r"[#:][A-Za-z0-9_]+")
+
+
+class Context:
+    """
+    Expression attribute names and values of a request
+    """
+
+    __slots__ = ("names", "values")
+
+    def __init__(
+        self,
+        names: Optional[Dict[str, str]] = None,
+        values: Optional[Dict[str, AttributeValue]] = None,
+    ) -> None:
+        self.names = names or {}
+        self.values = values or {}
+
+    def name(self, element: str) -> str:
+        if element.startswith("#"):
+            try:
+                return self.names[element]
+            except KeyError:
+                raise ExpressionError(f"Undefined attribute name `{element}`") from None
+        return element
+
+    def value(self, placeholder: str) -> AttributeValue:
+        try:
+            return self.values[placeholder]
+        except KeyError:
+            message = f"Undefined attribute value `{placeholder}`"
+            raise ExpressionError(message) from None
+
+    def check_unused(self, *expressions: Optional[str]) -> None:
+        """
+        Like DynamoDB, reject names and values none of the `expressions` refer to
+        """
+        used = set()
+        for expression in expressions:
+            if expression:
+                used.update(_PLACEHOLDER.findall(expression))
+        unused = (set(self.names) | set(self.values)) - used
+        if unused:
+            raise ExpressionError(
+                f"Expression attribute names or values unused: {sorted(unused)}"
+            )
+
+
+def resolve(path: Node, context: Context) -> Tuple[Union[str, int], ...]:
+    return tuple(
+        context.name(element) if isinstance(element, str) else element
+        for element in path[1]
+    )
+
+
+def get_path(item: Item, elements: Tuple[Union[str, int], ...]) -> Optional[Any]:
+    value = item.get(elements[0])
+    for element in elements[1:]:
+        if value is None:
+            return None
+        if isinstance(element, int):
+            values = value.get("L")
+            if values is None or element >= len(values):
+                return None
+            value = values[element]
+        else:
+            values = value.get("M")
+            if values is None:
+                return None
+            value = values.get(element)
+    return value
+
+
+# evaluation
+
+
+def _operand(node: Node, item: Item, context: Context) -> Optional[AttributeValue]:
+    kind = node[0]
+    if kind == "path":
+        return get_path(item, resolve(node, context))
+    if kind == "value":
+        return context.value(node[1])
+    if kind == "size":
+        value = get_path(item, resolve(node[1], context))
+        if value is None:
+            return None
+        attr_type, data = plain(value)
+        if attr_type in ("N", "BOOL", "NULL"):
+            raise ExpressionError(f"size() is not defined for `{attr_type}`")
+        return {"N": str(len(data))}
+    if kind == "if_not_exists":
+        value = get_path(item, resolve(node[1], context))
+        return value if value is not None else _operand(node[2], item, context)
+    if kind == "list_append":
+        first = _operand(node[1], item, context)
+        second = _operand(node[2], item, context)
+        if first is None or second is None or "L" not in first or "L" not in second:
+            raise ExpressionError("list_append() takes two lists")
+        return {"L": first["L"] + second["L"]}
+    if kind in ("+", "-"):
+        first = _operand(node[1], item, context)
+        second = _operand(node[2], item, context)
+        if first is None or second is None:
+            raise ExpressionError("An operand of an arithmetic expression is missing")
+        if "N" not in first or "N" not in second:
+            raise ExpressionError("Arithmetic is only defined for numbers")
+        a, b = _number(first["N"]), _number(second["N"])
+        return {"N": format_number(a + b if kind == "+" else a - b)}
+    raise ExpressionError(f"Unexpected `{kind}`")
+
+
+def _equal(a: Optional[AttributeValue], b: Optional[AttributeValue]) -> bool:
+    return a is not None and b is not None and plain(a) == plain(b)
+
+
+def _compare(operator: str, a, b) -> bool:
+    if operator == "=":
+        return _equal(a, b)
+    if operator == "<>":
+        return not _equal(a, b)
+    if a is None or b is None:
+        return False
+    (a_type, a_value), (b_type, b_value) = plain(a), plain(b)
+    if a_type != b_type or a_type not in ("S", "N", "B"):
+        return False
+    if operator == "<":
+        return a_value < b_value
+    if operator == "<=":
+        return a_value <= b_value
+    if operator == ">":
+        return a_value > b_value
+    return a_value >= b_value
+
+
+def _function(name: str, args: Tuple[Node, ...], item: Item, context: Context):
+    if args[0][0] != "path":
+        raise ExpressionError(f"The first argument of {name}() must be a path")
+    value = _operand(args[0], item, context)
+    if name == "attribute_exists":
+        return value is not None
+    if name == "attribute_not_exists":
+        return value is None
+    other = _operand(args[1], item, context) if len(args) > 1 else None
+    if other is None:
+        raise ExpressionError(f"{name}() takes two arguments")
+    if value is None:
+        return False
+    if name == "attribute_type":
+        return next(iter(value)) == other.get("S")
+    attr_type, data = plain(value)
+    other_type, other_data = plain(other)
+    if name == "begins_with":
+        return attr_type == other_type and attr_type in ("S", "B") and (
+            data.startswith(other_data)
+        )
+    # contains
+    if attr_type in ("S", "B"):
+        return other_type == attr_type and other_data in data
+    if attr_type in ("SS", "NS", "BS"):
+        return other_type == attr_type[0] and other_data in data
+    if attr_type == "L":
+        return (other_type, other_data) in data
+    return False
+
+
+def evaluate(node: Node, item: Item, context: Context) -> bool:
+    kind = node[0]
+    if kind == "and":
+        # every placeholder is read, to report the unused ones consistently
+        first = evaluate(node[1], item, context)
+        second = evaluate(node[2], item, context)
+        return first and second
+    if kind == "or":
+        first = evaluate(node[1], item, context)
+        second = evaluate(node[2], item, context)
+        return first or second
+    if kind == "not":
+        return not evaluate(node[1], item, context)
+    if kind == "compare":
+        left = _operand(node[2], item, context)
+        return _compare(node[1], left, _operand(node[3], item, context))
+    if kind == "between":
+        value = _operand(node[1], item, context)
+        lower = _operand(node[2], item, context)
+        upper = _operand(node[3], item, context)
+        return _compare(">=", value, lower) and _compare("<=", value, upper)
+    if kind == "in":
+        value = _operand(node[1], item, context)
+        candidates = [_operand(c, item, context) for c in node[2]]
+        return any(_equal(value, candidate) for candidate in candidates)
+    if kind == "function":
+        return _function(node[1], node[2], item, context)
+    raise ExpressionError(f"`{kind}` is not a condition")
+
+
+# updates
+
+
+def _container(item: Item, elements: Tuple[Union[str, int], ...]) -> Any:
+    """
+    The map or list holding the last element of a path
+    """
+    if len(elements) == 1:
+        return item
+    parent = get_path(item, elements[:-1])
+    if parent is None:
+        raise ExpressionError("The document path provided in the update is invalid")
+    if isinstance(elements[-1], int):
+        if "L" not in parent:
+            raise ExpressionError("A list index is used on a value that is not a list")
+        return parent["L"]
+    if "M" not in parent:
+        raise ExpressionError("A map key is used on a value that is not a map")
+    return parent["M"]
+
+
+def _set(item: Item, elements, value: AttributeValue) -> None:
+    container = _container(item, elements)
+    last = elements[-1]
+    if isinstance(last, int):
+        if last < len(container):
+            container[last] = value
+        else:
+            container.append(value)
+    else:
+        container[last] = value
+
+
+def _remove(item: Item, elements) -> None:
+    container = _container(item, elements)
+    last = elements[-1]
+    if isinstance(last, int):
+        if last < len(container):
+            # compacted once all the removals are done, indexes refer to the old list
+            container[last] = _REMOVED
+    else:
+        container.pop(last, None)
+
+
+def _compact(value: Any) -> Any:
+    if isinstance(value, dict):
+        for v in value.values():
+            _compact(v)
+        if "L" in value:
+            value["L"] = [v for v in value["L"] if v is not _REMOVED]
+    elif isinstance(value, list):
+        for v in value:
+            _compact(v)
+    return value
+
+
+def _set_element(attr_type: str, value: Any) -> Any:
+    if attr_type == "NS":
+        return _number(value)
+    if attr_type == "BS":
+        return _binary(value)
+    return value
+
+
+def _set_type(value: AttributeValue) -> str:
+    attr_type = next(iter(value))
+    if attr_type not in ("SS", "NS", "BS"):
+        raise ExpressionError(f"`{attr_type}` is not a set")
+    return attr_type
+
+
+def apply_update(
+    item: Item, actions: List[Node], context: Context
+) -> Tuple[Item, List[str]]:
+    """
+    Updated copy of `item`, and the top level names of the updated attributes
+    """
+    # every value is computed from the item before the update
+    values = []
+    for action, path, operand in actions:
+        elements = resolve(path, context)
+        value = _operand(operand, item, context) if operand is not None else None
+        values.append((action, elements, value))
+
+    paths = [elements for _, elements, _ in values]
+    for i, first in enumerate(paths):
+        for second in paths[i + 1 :]:
+            shorter = min(len(first), len(second))
+            if first[:shorter] == second[:shorter]:
+                raise ExpressionError("Two document paths overlap with each other")
+
+    updated = copy_value(item)
+    for action, elements, value in values:
+        if action == "SET":
+            _set(updated, elements, copy_value(value))
+        elif action == "REMOVE":
+            _remove(updated, elements)
+        elif action == "ADD":
+            current = get_path(updated, elements)
+            if "N" in value:
+                if current is not None and "N" not in current:
+                    raise ExpressionError("ADD of a number to a value that is not one")
+                total = _number(value["N"])
+                if current is not None:
+                    total += _number(current["N"])
+                _set(updated, elements, {"N": format_number(total)})
+            else:
+                attr_type = _set_type(value)
+                if current is None:
+                    _set(updated, elements, copy_value(value))
+                else:
+                    if next(iter(current)) != attr_type:
+                        raise ExpressionError("ADD of a set to a mismatching type")
+                    merged = list(current[attr_type])
+                    present = {_set_element(attr_type, v) for v in merged}
+                    for v in value[attr_type]:
+                        if _set_element(attr_type, v) not in present:
+                            present.add(_set_element(attr_type, v))
+                            merged.append(v)
+                    _set(updated, elements, {attr_type: merged})
+        else:  # DELETE
+            attr_type = _set_type(value)
+            current = get_path(updated, elements)
+            if current is None:
+                continue
+            if next(iter(current)) != attr_type:
+                raise ExpressionError("DELETE of a set from a mismatching type")
+            removed = plain(value)[1]
+            left = [
+                v
+                for v in current[attr_type]
+                if _set_element(attr_type, v) not in removed
+            ]
+            if left:
+                _set(updated, elements, {attr_type: left})
+            else:
+                _remove(updated, elements)
+    return _compact(updated), sorted({str(elements[0]) for elements in paths})
+
+
+def _build_lists(value: AttributeValue) -> AttributeValue:
+    if isinstance(value.get("L"), dict):
+        value["L"] = [_build_lists(v) for _, v in sorted(value["L"].items())]
+    elif "M" in value:
+        for v in value["M"].values():
+            _build_lists(v)
+    return value
+
+
+def project(item: Item, paths: List[Node], context: Context) -> Item:
+    """
+    Attributes of `item` at `paths`, nested ones in their enclosing maps and lists
+    """
+    projected: Item = {}
+    for path in paths:
+        elements = resolve(path, context)
+        value = get_path(item, elements)
+        if value is None:
+            continue
+        # lists are built as {index: value} first, so that they keep their order
+        container: Dict[Any, Any] = projected
+        for element, following in zip(elements, elements[1:]):
+            attr_type = "L" if isinstance(following, int) else "M"
+            node = container.get(element)
+            if node is None:
+                node = container[element] = {attr_type: {}}
+            container = node[attr_type]
+        container[elements[-1]] = copy_value(value)
+    for value in projected.values():
+        _build_lists(value)
+    return projected
@@ -1 +1,12 @@
+from ._async import *
+from ._bulk import *
+from ._cache import *
+from ._changes import *
+from ._compiled import *
+from ._export import *
+from ._instrumentation import *
+from ._lazy import *
+from ._parallel import *
+from ._rows import *
+from ._writer import *
 from .time_tracked import *
@@ -0,0 +1,163 @@
+import asyncio
+from collections import deque
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Awaitable, Callable, Deque, Dict, Generic, Iterator, List
+from typing import Optional, Type, TypeVar
+
+from pynamodb.constants import ITEMS
+from pynamodb.models import Model
+from pynamodb.pagination import PageIterator, ResultIterator
+
+_T = TypeVar("_T")
+_M = TypeVar("_M", bound=Model)
+
+__all__ = ["AsyncModelMixin", "AsyncResultIterator", "gather_limited"]
+
+
+async def _run(executor: Optional[Executor], fn: Callable[..., _T], *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(fn, *args, **kwargs))
+
+
+class _Pages(Iterator[Dict[str, Any]]):
+    """
+    `PageIterator` counting the items left in the last page it returned
+    """
+
+    def __init__(self, pages: PageIterator) -> None:
+        self.pages = pages
+        self.left = 0
+
+    def __next__(self) -> Dict[str, Any]:
+        page = next(self.pages)
+        self.left = len(page.get(ITEMS) or ())
+        return page
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.pages, name)
+
+
+def _next_page(results: ResultIterator[_T], pages: _Pages) -> List[_T]:
+    """
+    Items left in the current page of `results`, fetching the next page if none
+    """
+    items = []
+    for item in results:
+        items.append(item)
+        pages.left -= 1
+        if pages.left <= 0:
+            break
+    return items
+
+
+class AsyncResultIterator(Generic[_T]):
+    """
+    Async iterator over a `ResultIterator`, fetching a page per executor call
+
+    `results` is the underlying iterator, for `total_count` and `read_counts`.
+    """
+
+    def __init__(
+        self, results: ResultIterator[_T], executor: Optional[Executor] = None
+    ) -> None:
+        self.results = results
+        self._executor = executor
+        # page boundaries are counted on the pages `results` reads
+        self._pages = _Pages(results.page_iter)
+        results.page_iter = self._pages  # type: ignore[assignment]
+        self._items: Deque[_T] = deque()
+        self._exhausted = False
+
+    def __aiter__(self) -> "AsyncResultIterator[_T]":
+        return self
+
+    async def __anext__(self) -> _T:
+        if not self._items:
+            if not self._exhausted:
+                page = await _run(
+                    self._executor, _next_page, self.results, self._pages
+                )
+                self._items.extend(page)
+            if not self._items:
+                self._exhausted = True
+                raise StopAsyncIteration
+        return self._items.popleft()
+
+    async def all(self) -> List[_T]:
+        return [item async for item in self]
+
+
+async def gather_limited(
+    *aws: Awaitable[_T], limit: int = 16, return_exceptions: bool = False
+) -> List[_T]:
+    """
+    `asyncio.gather` running at most `limit` awaitables at once
+    """
+    if limit < 1:
+        raise ValueError("limit must be greater than zero")
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[_T]) -> _T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(
+        *(run(aw) for aw in aws), return_exceptions=return_exceptions
+    )
+
+
+class AsyncModelMixin(Model):
+    """
+    Async counterparts of the model operations
+
+    A thread-pool convenience layer, not non-blocking I/O: calls run the
+    synchronous operations of the model on `async_executor` (the default
+    executor of the loop if not set), so overrides of the other mixins,
+    timestamps and soft deletes apply as they do for synchronous calls.
+
+    Every call, and every page of `async_query` and `async_scan`, holds an
+    executor thread until its request returns, so size `async_executor` for
+    the expected concurrency: awaiting more calls than it has threads queues
+    them rather than running them at once.
+
+    >>> item = await Model.async_get(hash_key)
+    >>> async for item in Model.async_query(hash_key):
+    >>>     ...
+    >>> await gather_limited(*(item.async_save() for item in items), limit=8)
+    """
+
+    async_executor: Optional[Executor] = None
+
+    @classmethod
+    async def async_get(cls: Type[_M], *args, **kwargs) -> _M:
+        # build the connection once, before the executor threads race for it
+        cls._get_connection()
+        return await _run(cls.async_executor, cls.get, *args, **kwargs)
+
+    @classmethod
+    def async_query(cls: Type[_M], *args, **kwargs) -> AsyncResultIterator[_M]:
+        # building the iterator does no request, pages are read on iteration
+        results = cls.query(*args, **kwargs)
+        return AsyncResultIterator(results, cls.async_executor)
+
+    @classmethod
+    def async_scan(cls: Type[_M], *args, **kwargs) -> AsyncResultIterator[_M]:
+        results = cls.scan(*args, **kwargs)
+        return AsyncResultIterator(results, cls.async_executor)
+
+    async def async_save(self, *args, **kwargs) -> Any:
+        self._get_connection()
+        return await _run(self.async_executor, self.save, *args, **kwargs)
+
+    async def async_update(self, *args, **kwargs) -> Any:
+        self._get_connection()
+        return await _run(self.async_executor, self.update, *args, **kwargs)
+
+    async def async_delete(self, *args, **kwargs) -> Any:
+        self._get_connection()
+        return await _run(self.async_executor, self.delete, *args, **kwargs)
+
+    async def async_refresh(self, *args, **kwargs) -> None:
+        self._get_connection()
+        return await _run(self.async_executor, self.refresh, *args, **kwargs)
@@ -0,0 +1,104 @@
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence, Tuple, TypeVar
+
+from pynamodb.exceptions import PynamoDBException
+
+from pynamodb_templates.models._instrumentation import record_retry
+
+_R = TypeVar("_R")
+
+__all__ = ["BulkReport"]
+
+THROTTLING_ERRORS = frozenset(
+    {
+        "ProvisionedThroughputExceededException",
+        "ThrottlingException",
+        "RequestLimitExceeded",
+    }
+)
+MAX_BACKOFF = 10.0
+
+
+class BulkReport:
+    """
+    Per key outcome of a bulk operation
+    """
+
+    def __init__(self) -> None:
+        self.succeeded: List[Any] = []
+        self.failed: List[Tuple[Any, Exception]] = []
+
+    def add(self, key: Any, error: Optional[Exception] = None) -> None:
+        if error is None:
+            self.succeeded.append(key)
+        else:
+            self.failed.append((key, error))
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}"
+            f"(succeeded={len(self.succeeded)}, failed={len(self.failed)})"
+        )
+
+
+def is_throttled(error: Exception) -> bool:
+    return (
+        isinstance(error, PynamoDBException)
+        and error.cause_response_code in THROTTLING_ERRORS
+    )
+
+
+def backoff(attempt: int, base_delay: float, max_delay: float = MAX_BACKOFF) -> float:
+    """
+    Full jitter exponential backoff in seconds
+    """
+    return random.uniform(0, min(max_delay, base_delay * 2**attempt))
+
+
+def call_with_retry(
+    fn: Callable[[], _R],
+    max_retries: int,
+    base_delay: float,
+    max_delay: float = MAX_BACKOFF,
+) -> _R:
+    """
+    Call `fn`, retrying throttled requests with backoff
+    """
+    attempt = 0
+    while True:
+        try:
+            return fn()
+        except PynamoDBException as e:
+            if attempt >= max_retries or not is_throttled(e):
+                raise
+        record_retry()
+        time.sleep(backoff(attempt, base_delay, max_delay))
+        attempt += 1
+
+
+def run_bulk(
+    operation: Callable[[Sequence[Any]], List[Tuple[Any, Optional[Exception]]]],
+    keys: Sequence[Any],
+    workers: int,
+    chunk_size: int = 1,
+) -> BulkReport:
+    """
+    Run `operation` over chunks of `keys` on at most `workers` threads
+
+    `operation` returns the `(key, error or None)` outcome of every key in its chunk.
+    """
+    if workers < 1:
+        raise ValueError("workers must be greater than zero")
+    chunks = [keys[i : i + chunk_size] for i in range(0, len(keys), chunk_size)]
+    report = BulkReport()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bulk") as pool:
+        for outcomes in pool.map(operation, chunks):
+            for key, error in outcomes:
+                report.add(key, error)
+    return report
@@ -0,0 +1,152 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional
+
+from pynamodb_templates._size import item_size
+
+__all__ = ["ModelCache", "CacheStats", "item_size"]
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    revalidations: int
+    items: int
+    size: int
+
+
+class _Entry:
+    __slots__ = ("data", "modified_at", "size", "expires")
+
+    def __init__(self, data, modified_at, size, expires):
+        self.data = data
+        self.modified_at = modified_at
+        self.size = size
+        self.expires = expires
+
+
+class ModelCache:
+    """
+    In-process LRU cache of serialized items, keyed by serialized keys
+
+    Entries live for `ttl` seconds. With `revalidate`, a stale entry is served
+    again if its `modified_at` still matches the table (a cheap projection read),
+    instead of reading the whole item again. `max_items` and `max_size` (bytes, as
+    `item_size`) bound the cache, least recently used entries are evicted first.
+    """
+
+    def __init__(
+        self,
+        max_items: int = 1024,
+        ttl: float = 60.0,
+        max_size: Optional[int] = None,
+        revalidate: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_items = max_items
+        self.ttl = ttl
+        self.max_size = max_size
+        self.revalidate = revalidate
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._revalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        key: Hashable,
+        modified_at: Optional[Callable[[], Optional[str]]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Cached item of `key`, `modified_at` fetches the current value to revalidate
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if self._clock() < entry.expires:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.data
+            if not (self.revalidate and modified_at is not None):
+                self._expire(key)
+                return None
+
+        current = modified_at()
+        with self._lock:
+            if current is not None and current == entry.modified_at:
+                if self._entries.get(key) is entry:
+                    entry.expires = self._clock() + self.ttl
+                    self._entries.move_to_end(key)
+                self._revalidations += 1
+                self._hits += 1
+                return entry.data
+            if self._entries.get(key) is entry:
+                self._expire(key)
+            else:
+                self._misses += 1
+            return None
+
+    def put(
+        self,
+        key: Hashable,
+        data: Dict[str, Any],
+        modified_at: Optional[str] = None,
+    ) -> None:
+        size = item_size(data)
+        with self._lock:
+            self._discard(key)
+            if self.max_size is not None and size > self.max_size:
+                return
+            expires = self._clock() + self.ttl
+            self._entries[key] = _Entry(data, modified_at, size, expires)
+            self._size += size
+            while len(self._entries) > self.max_items or (
+                self.max_size is not None and self._size > self.max_size
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+                self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._discard(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                revalidations=self._revalidations,
+                items=len(self._entries),
+                size=self._size,
+            )
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+
+    def _expire(self, key: Hashable) -> None:
+        self._discard(key)
+        self._expirations += 1
+        self._misses += 1
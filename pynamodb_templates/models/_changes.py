@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+__all__ = ["ChangeCheckpoint"]
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def bucket_start(value: datetime, size: timedelta) -> datetime:
+    """
+    Start of the `size` long time bucket holding `value`, buckets align to the epoch
+    """
+    return _EPOCH + (_utc(value) - _EPOCH) // size * size
+
+
+class ChangeCheckpoint:
+    """
+    Position of a change feed
+
+    Items modified at or after `since` are still to be read, `last_evaluated_key`
+    skips the ones of the same bucket already read. `to_dict`/`from_dict`
+    round-trip through JSON for persistence.
+    """
+
+    def __init__(
+        self,
+        since: datetime,
+        last_evaluated_key: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.since = _utc(since)
+        self.last_evaluated_key = last_evaluated_key
+
+    def update(
+        self, since: datetime, last_evaluated_key: Optional[Dict[str, Any]]
+    ) -> None:
+        self.since = _utc(since)
+        self.last_evaluated_key = last_evaluated_key
+
+    def advance(self, until: datetime) -> None:
+        """
+        Everything up to `until` (inclusive) is read
+        """
+        self.update(until + _MICROSECOND, None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "since": self.since.isoformat(),
+            "last_evaluated_key": self.last_evaluated_key,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ChangeCheckpoint":
+        return cls(
+            since=datetime.fromisoformat(data["since"]),
+            last_evaluated_key=data.get("last_evaluated_key"),
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(since={self.since.isoformat()!r})"
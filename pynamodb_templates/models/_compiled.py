@@ -0,0 +1,232 @@
+import json
+from base64 import b64decode, b64encode
+from typing import Any, Callable, Dict, List, Tuple, Type, TypeVar
+
+from pynamodb.attributes import (
+    DEFAULT_ENCODING,
+    Attribute,
+    BinaryAttribute,
+    BooleanAttribute,
+    ListAttribute,
+    MapAttribute,
+    NumberAttribute,
+)
+from pynamodb.constants import NULL
+from pynamodb.exceptions import AttributeDeserializationError, AttributeNullError
+from pynamodb.models import Model
+
+_T = TypeVar("_T", bound=Model)
+
+__all__ = ["CompiledModelMixin", "compile_serializers"]
+
+Serialize = Callable[[Model, bool], Dict[str, Dict[str, Any]]]
+Load = Callable[[Model, Dict[str, Dict[str, Any]]], None]
+
+
+class _Source:
+    """
+    Lines of a generated function and the constants they refer to
+    """
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+        self.namespace: Dict[str, Any] = {
+            "MapAttribute": MapAttribute,
+            "AttributeNullError": AttributeNullError,
+            "AttributeDeserializationError": AttributeDeserializationError,
+        }
+
+    def constant(self, value: Any, prefix: str = "c") -> str:
+        name = f"{prefix}{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def add(self, indent: int, *lines: str) -> None:
+        self.lines.extend("    " * indent + line for line in lines)
+
+    def build(self, name: str) -> Callable[..., Any]:
+        code = compile("\n".join(self.lines), f"<compiled {name}>", "exec")
+        exec(code, self.namespace)
+        return self.namespace[name]
+
+
+def _overrides(attr: Attribute, name: str, base: type) -> bool:
+    return getattr(type(attr), name) is not getattr(base, name)
+
+
+def _inlined(
+    source: _Source, attr: Attribute, method: str, value: str, result: str
+) -> List[str]:
+    """
+    Statements setting `result` to `attr.<method>(value)`, inlined where known
+    """
+    from pynamodb_templates.attributes._datetime import UnicodeUTCDatetimeAttribute
+    from pynamodb_templates.attributes._datetime import _UTC, _fromisoformat, _to_utc
+    from pynamodb_templates.attributes._enum import EnumAttributeBase
+
+    implementation = getattr(type(attr), method)
+    serialize = method == "serialize"
+    if implementation is getattr(Attribute, method):
+        return [] if result == value else [f"{result} = {value}"]
+    if implementation is getattr(NumberAttribute, method):
+        function = json.dumps if serialize else json.loads
+        return [f"{result} = {source.constant(function)}({value})"]
+    if implementation is getattr(BooleanAttribute, method):
+        if serialize:
+            # only given values that are not None
+            return [f"{result} = True if {value} else False"]
+        return [f"{result} = bool({value})"]
+    if implementation is getattr(BinaryAttribute, method):
+        if serialize:
+            encode = source.constant(b64encode)
+            return [f"{result} = {encode}({value}).decode({DEFAULT_ENCODING!r})"]
+        return [f"{result} = {source.constant(b64decode)}({value})"]
+    if implementation is getattr(UnicodeUTCDatetimeAttribute, method):
+        if serialize:
+            utc, to_utc = source.constant(_UTC), source.constant(_to_utc)
+            return [
+                f"if {value}.tzinfo is not {utc}:",
+                f"    {value} = {to_utc}({value})",
+                f"{result} = {value}.isoformat()",
+            ]
+        return [f"{result} = {source.constant(_fromisoformat)}({value})"]
+    bound = source.constant(getattr(attr, method), "m")
+    if implementation is getattr(EnumAttributeBase, method):
+        # the lookup table, the method is only called again for its errors
+        table = attr._serialized if serialize else attr._deserialized
+        return [
+            "try:",
+            f"    {result} = {source.constant(table)}[{value}]",
+            "except (KeyError, TypeError):",
+            f"    {result} = {bound}({value})",
+        ]
+    return [f"{result} = {bound}({value})"]
+
+
+def _compile_serialize(model: Type[Model]) -> Serialize:
+    source = _Source()
+    source.add(0, "def serialize(self, null_check=True):")
+    source.add(1, "values = self.attribute_values", "data = {}")
+    for name, attr in model.get_attributes().items():
+        key = model._dynamo_to_python_attrs.get(attr.attr_name, attr.attr_name)
+        container = isinstance(attr, (ListAttribute, MapAttribute))
+        if container or _overrides(attr, "__get__", Attribute):
+            source.add(1, f"value = self.{name}")
+        else:
+            source.add(1, f"value = values.get({key!r})")
+        if container:
+            message = f"Attribute '{name}' is not correctly typed"
+            source.add(
+                1,
+                "try:",
+                "    if isinstance(value, MapAttribute) and not value.validate(",
+                "        null_check=null_check",
+                "    ):",
+                f"        raise ValueError({message!r})",
+                "except AttributeNullError as e:",
+                f"    e.prepend_path({name!r})",
+                "    raise",
+                "if value is not None:",
+                f"    value = {source.constant(attr.serialize, 'm')}("
+                "value, null_check=null_check)",
+            )
+        else:
+            lines = _inlined(source, attr, "serialize", "value", "value")
+            if lines:
+                source.add(1, "if value is not None:")
+                source.add(2, *lines)
+        source.add(1, "if value is not None:")
+        source.add(2, f"data[{attr.attr_name!r}] = {{{attr.attr_type!r}: value}}")
+        if not attr.null:
+            source.add(1, "elif null_check:")
+            source.add(2, f"raise AttributeNullError({name!r})")
+    source.add(1, "return data")
+    return source.build("serialize")
+
+
+def _compile_load(model: Type[Model]) -> Load:
+    source = _Source()
+    source.add(0, "def load(self, data):")
+    source.add(1, "values = self.attribute_values")
+    for name, attr in model.get_attributes().items():
+        key = model._dynamo_to_python_attrs.get(attr.attr_name, attr.attr_name)
+        source.add(1, f"value = data.get({attr.attr_name!r})")
+        source.add(1, f"if value and {NULL!r} not in value:")
+        if _overrides(attr, "get_value", Attribute):
+            get_value = source.constant(attr.get_value, "m")
+            source.add(2, f"value = {get_value}(value)")
+        else:
+            source.add(
+                2,
+                f"if {attr.attr_type!r} not in value:",
+                "    raise AttributeDeserializationError("
+                f"{attr.attr_name!r}, {attr.attr_type!r})",
+                f"value = value[{attr.attr_type!r}]",
+            )
+        source.add(2, *_inlined(source, attr, "deserialize", "value", "value"))
+        if _overrides(attr, "__set__", Attribute):
+            source.add(2, f"{source.constant(attr.__set__, 'm')}(self, value)")
+        else:
+            source.add(2, f"values[{key!r}] = value")
+    return source.build("load")
+
+
+def compile_serializers(model: Type[Model]) -> Tuple[Serialize, Load]:
+    """
+    Generated `serialize` of `model` items, and `load` setting raw item values
+
+    Attributes are unrolled in the order `Model.serialize` walks them, with the
+    codecs of common attributes inlined, the output is the same.
+    """
+    return _compile_serialize(model), _compile_load(model)
+
+
+class CompiledModelMixin(Model):
+    """
+    Set `compiled` to serialize and deserialize items with generated functions
+
+    The functions are generated from the attributes of the model on first use,
+    instead of walking the attributes and dispatching to each of them per item.
+    """
+
+    compiled: bool = False
+
+    @classmethod
+    def _compiled_serializers(cls) -> Tuple[Serialize, Load]:
+        # looked up on the class itself, subclasses have attributes of their own
+        serializers = cls.__dict__.get("_serializers")
+        if serializers is None:
+            serializers = compile_serializers(cls)
+            cls._serializers = serializers  # type: ignore[attr-defined]
+        return serializers
+
+    @classmethod
+    def from_raw_data(cls: Type[_T], data: Dict[str, Any]) -> _T:
+        if not cls.compiled:  # type: ignore[attr-defined]
+            return super().from_raw_data(data)  # type: ignore[misc]
+        if data is None:
+            raise ValueError("Received no data to construct object")
+        stored_cls = cls._get_discriminator_class(data)
+        if stored_cls and not issubclass(stored_cls, cls):
+            raise ValueError(
+                f"Cannot instantiate a {cls.__name__} "
+                f"from the returned class: {stored_cls.__name__}"
+            )
+        # instantiated with its discriminator and defaults set, as `deserialize`
+        # would set them again
+        instance = (stored_cls or cls)(_user_instantiated=False)
+        instance._compiled_serializers()[1](instance, data)
+        return instance
+
+    def serialize(self, null_check: bool = True) -> Dict[str, Dict[str, Any]]:
+        if not self.compiled:
+            return super().serialize(null_check=null_check)
+        return self._compiled_serializers()[0](self, null_check)
+
+    def deserialize(self, attribute_values: Dict[str, Dict[str, Any]]) -> None:
+        if not self.compiled:
+            return super().deserialize(attribute_values)
+        self.attribute_values = {}
+        self._set_discriminator()
+        self._set_defaults(_user_instantiated=False)
+        self._compiled_serializers()[1](self, attribute_values)
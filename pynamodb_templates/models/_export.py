@@ -0,0 +1,177 @@
+import gzip
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Event, Lock
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+
+from pynamodb.constants import ITEM, ITEMS
+from pynamodb.pagination import ResultIterator
+
+from pynamodb_templates.models._parallel import ScanCheckpoint, SharedRateLimiter
+
+__all__ = ["ExportCheckpoint"]
+
+CHECKPOINT_FILE = "checkpoint.json"
+PART_SUFFIX = ".ndjson.gz"
+
+
+def _json_default(value: Any) -> Any:
+    # pynamodb writes binary values as their base64 text, which reads back
+    # as bytes at the top level of items, the JSON line keeps the text
+    if isinstance(value, bytes):
+        return value.decode()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"`{type(value).__name__}` is not JSON serializable")
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), default=_json_default)
+
+
+class ExportCheckpoint(ScanCheckpoint):
+    """
+    Per segment progress of an export
+
+    Besides the scan position of every segment, `parts` holds the number of part
+    files a segment has completed. Parts are only counted once written in full, a
+    resumed segment rewrites its unfinished part from the recorded position.
+    """
+
+    def __init__(
+        self,
+        total_segments: int,
+        last_evaluated_keys: Optional[Dict[int, Dict[str, Any]]] = None,
+        finished: Optional[Iterable[int]] = None,
+        parts: Optional[Dict[int, int]] = None,
+    ) -> None:
+        super().__init__(total_segments, last_evaluated_keys, finished)
+        self.parts: Dict[int, int] = dict(parts or {})
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = super().to_dict()
+        data["parts"] = {str(segment): part for segment, part in self.parts.items()}
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ExportCheckpoint":
+        checkpoint = super().from_dict(data)
+        checkpoint.parts = {
+            int(segment): part for segment, part in data.get("parts", {}).items()
+        }
+        return checkpoint
+
+
+def part_path(directory: Path, segment: int, part: int) -> Path:
+    return directory / f"{segment:04d}-{part:06d}{PART_SUFFIX}"
+
+
+def export_segments(
+    scan: Callable[..., ResultIterator],
+    directory: Union[str, Path],
+    workers: int,
+    total_segments: Optional[int] = None,
+    part_items: int = 100_000,
+    rate_limit: Optional[float] = None,
+    compresslevel: int = 6,
+) -> ExportCheckpoint:
+    """
+    Write the segments of `scan` to gzipped NDJSON part files in `directory`
+
+    `scan` is called as in `parallel_scan`. Every segment writes its own parts of
+    about `part_items` items, a page at a time, and saves the checkpoint to
+    `directory` whenever a part is complete. An existing checkpoint is resumed.
+    """
+    if workers < 1:
+        raise ValueError("workers must be greater than zero")
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    checkpoint_path = directory / CHECKPOINT_FILE
+    if checkpoint_path.exists():
+        checkpoint = ExportCheckpoint.from_dict(json.loads(checkpoint_path.read_text()))
+        if total_segments is not None and total_segments != checkpoint.total_segments:
+            raise ValueError(
+                f"total_segments {total_segments} does not match "
+                f"the checkpoint of {checkpoint.total_segments} segments"
+            )
+    else:
+        checkpoint = ExportCheckpoint(total_segments or workers)
+    total_segments = checkpoint.total_segments
+    limiter = SharedRateLimiter(rate_limit) if rate_limit else None
+    lock = Lock()
+    stop = Event()
+
+    def save(segment: int, part: int, last_evaluated_key) -> None:
+        with lock:
+            checkpoint.update(segment, last_evaluated_key)
+            checkpoint.parts[segment] = part
+            temporary = checkpoint_path.with_suffix(".tmp")
+            temporary.write_text(_dumps(checkpoint.to_dict()))
+            os.replace(temporary, checkpoint_path)
+
+    def run(segment: int) -> None:
+        part = checkpoint.parts.get(segment, 0)
+        results = scan(
+            segment=segment,
+            total_segments=total_segments,
+            last_evaluated_key=checkpoint.last_evaluated_keys.get(segment),
+            rate_limit=rate_limit,
+        )
+        page_iter = results.page_iter
+        if limiter is not None:
+            page_iter._rate_limiter = limiter
+        file = None
+        count = 0
+        try:
+            for page in page_iter:
+                if stop.is_set():
+                    return
+                for item in page.get(ITEMS, ()):
+                    if file is None:
+                        path = part_path(directory, segment, part)
+                        file = gzip.open(path, "wt", compresslevel=compresslevel)
+                    file.write(_dumps({ITEM: item}))
+                    file.write("\n")
+                    count += 1
+                last_evaluated_key = page_iter.last_evaluated_key
+                if count >= part_items or (last_evaluated_key is None and file):
+                    file.close()
+                    file = None
+                    count = 0
+                    part += 1
+                    save(segment, part, last_evaluated_key)
+            if segment not in checkpoint.finished:
+                save(segment, part, None)
+        except BaseException:
+            stop.set()
+            raise
+        finally:
+            if file is not None:
+                file.close()
+
+    segments = [s for s in range(total_segments) if s not in checkpoint.finished]
+    if segments:
+        with ThreadPoolExecutor(
+            max_workers=min(workers, len(segments)), thread_name_prefix="export"
+        ) as executor:
+            futures = [executor.submit(run, segment) for segment in segments]
+            for future in futures:
+                future.result()
+    return checkpoint
+
+
+def import_parts(
+    save: Callable[[Dict[str, Dict[str, Any]]], None], directory: Union[str, Path]
+) -> int:
+    """
+    Pass every item of the part files in `directory` to `save`, returns the count
+    """
+    count = 0
+    for path in sorted(Path(directory).glob(f"*{PART_SUFFIX}")):
+        with gzip.open(path, "rt") as file:
+            for line in file:
+                save(json.loads(line)[ITEM])
+                count += 1
+    return count
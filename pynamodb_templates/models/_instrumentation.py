@@ -0,0 +1,538 @@
+import logging
+import threading
+import weakref
+from bisect import bisect_left
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, NamedTuple
+from typing import Optional, Sequence, Tuple, Type, TypeVar
+
+from pynamodb.constants import CONSUMED_CAPACITY, CAPACITY_UNITS, ITEM, ITEMS
+from pynamodb.constants import ATTRIBUTES, CAMEL_COUNT, SCANNED_COUNT
+from pynamodb.models import Model
+from pynamodb.pagination import ResultIterator
+
+from pynamodb_templates._size import item_size
+
+_T = TypeVar("_T", bound=Model)
+
+__all__ = [
+    "Instrumentation",
+    "InstrumentedModelMixin",
+    "OperationEvent",
+    "OperationStats",
+    "MetricsAggregator",
+    "LoggingSink",
+]
+
+log = logging.getLogger(__name__)
+
+Hook = Callable[["OperationEvent"], None]
+
+_active = threading.local()
+
+
+class OperationEvent(NamedTuple):
+    """
+    Measures of a model operation, or of a page of a query or scan
+
+    `latency` and `serialize_time` are in seconds, `serialize_time` is the part
+    spent serializing and deserializing items. `item_size` is the size in bytes
+    of the items written or read. `retries` are the retries of throttled and
+    unprocessed requests made by this package, not those within a request.
+    """
+
+    table_name: str
+    operation: str
+    latency: float
+    serialize_time: float
+    requests: int
+    consumed_capacity: float
+    scanned_count: int
+    count: int
+    retries: int
+    item_size: int
+    error: Optional[str] = None
+
+    @property
+    def discarded(self) -> int:
+        return self.scanned_count - self.count
+
+
+class _Recorder:
+    __slots__ = (
+        "serialize_time",
+        "requests",
+        "consumed_capacity",
+        "scanned_count",
+        "count",
+        "retries",
+        "item_size",
+    )
+
+    def __init__(self) -> None:
+        self.serialize_time = 0.0
+        self.requests = 0
+        self.consumed_capacity = 0.0
+        self.scanned_count = 0
+        self.count = 0
+        self.retries = 0
+        self.item_size = 0
+
+    def response(self, data: Optional[Dict[str, Any]]) -> None:
+        self.requests += 1
+        if not data:
+            return
+        capacity = data.get(CONSUMED_CAPACITY)
+        if isinstance(capacity, dict):
+            capacity = [capacity]
+        for table_capacity in capacity or ():
+            self.consumed_capacity += table_capacity.get(CAPACITY_UNITS, 0)
+        if ITEMS in data:
+            self.scanned_count += data.get(SCANNED_COUNT, 0)
+            self.count += data.get(CAMEL_COUNT, 0)
+            self.item_size += sum(item_size(item) for item in data[ITEMS])
+        for key in (ITEM, ATTRIBUTES):
+            if key in data:
+                self.count += 1
+                self.item_size += item_size(data[key])
+
+    def event(
+        self, table_name: str, operation: str, latency: float, error: Optional[str]
+    ) -> OperationEvent:
+        return OperationEvent(
+            table_name,
+            operation,
+            latency,
+            self.serialize_time,
+            self.requests,
+            self.consumed_capacity,
+            self.scanned_count,
+            self.count,
+            self.retries,
+            self.item_size,
+            error,
+        )
+
+
+def _recorder() -> Optional[_Recorder]:
+    return getattr(_active, "recorder", None)
+
+
+def record_response(data: Optional[Dict[str, Any]]) -> None:
+    """
+    Adds a response to the operation recorded in the current thread, if any
+    """
+    recorder = _recorder()
+    if recorder is not None:
+        recorder.response(data)
+
+
+def record_retry() -> None:
+    recorder = _recorder()
+    if recorder is not None:
+        recorder.retries += 1
+
+
+class Instrumentation:
+    """
+    Reports model operations to hooks, callables taking an `OperationEvent`
+
+    Hooks are called in the thread of the operation, and must be quick and
+    thread safe. Errors of hooks are logged, never raised to the operation.
+
+    >>> metrics = MetricsAggregator()
+    >>> Model.instrumentation = Instrumentation(metrics, LoggingSink(slow=0.5))
+    >>> metrics.render()
+    """
+
+    def __init__(self, *hooks: Hook) -> None:
+        self.hooks: List[Hook] = list(hooks)
+
+    def add(self, hook: Hook) -> None:
+        self.hooks.append(hook)
+
+    def remove(self, hook: Hook) -> None:
+        self.hooks.remove(hook)
+
+    def emit(self, event: OperationEvent) -> None:
+        for hook in self.hooks:
+            try:
+                hook(event)
+            except Exception:
+                log.exception("instrumentation hook %r failed", hook)
+
+    @contextmanager
+    def operation(self, table_name: str, operation: str) -> Iterator[_Recorder]:
+        """
+        Records the responses, retries and serialization in the block, in this thread
+        """
+        previous = _recorder()
+        _active.recorder = recorder = _Recorder()
+        error = None
+        start = perf_counter()
+        try:
+            yield recorder
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            latency = perf_counter() - start
+            _active.recorder = previous
+            self.emit(recorder.event(table_name, operation, latency, error))
+
+
+def instrumented(model: Type[Model], operation: str) -> ContextManager:
+    """
+    `Instrumentation.operation` of `model`, or a no-op if it is not instrumented
+    """
+    instrumentation = getattr(model, "instrumentation", None)
+    if instrumentation is None:
+        return nullcontext()
+    return instrumentation.operation(model.Meta.table_name, operation)
+
+
+class _PageRecorder:
+    """
+    Emits an event per page of a `ResultIterator`, once its items are deserialized
+    """
+
+    def __init__(
+        self,
+        instrumentation: Instrumentation,
+        table_name: str,
+        operation_name: str,
+        operation: Callable[..., Dict[str, Any]],
+        map_fn: Optional[Callable[[Dict[str, Any]], Any]],
+    ) -> None:
+        self.instrumentation = instrumentation
+        self.table_name = table_name
+        self.operation_name = operation_name
+        self.operation = operation
+        self.map_fn = map_fn
+        # `PageIterator.key_names` reads the table schema through it
+        self.__self__ = getattr(operation, "__self__", None)
+        self._pending: Optional[_Recorder] = None
+        self._latency = 0.0
+        self._remaining = 0
+
+    def __call__(self, *args, **kwargs) -> Dict[str, Any]:
+        self.flush()
+        recorder = _Recorder()
+        start = perf_counter()
+        try:
+            data = self.operation(*args, **kwargs)
+        except BaseException as e:
+            latency = perf_counter() - start
+            event = recorder.event(
+                self.table_name, self.operation_name, latency, type(e).__name__
+            )
+            self.instrumentation.emit(event)
+            raise
+        self._latency = perf_counter() - start
+        recorder.response(data)
+        self._pending = recorder
+        self._remaining = len(data.get(ITEMS, ()))
+        if not self._remaining:
+            self.flush()
+        return data
+
+    def map(self, data: Dict[str, Any]) -> Any:
+        start = perf_counter()
+        item = self.map_fn(data) if self.map_fn is not None else data
+        elapsed = perf_counter() - start
+        recorder = self._pending
+        if recorder is not None:
+            recorder.serialize_time += elapsed
+            self._latency += elapsed
+            self._remaining -= 1
+            if self._remaining <= 0:
+                self.flush()
+        return item
+
+    def flush(self) -> None:
+        recorder, self._pending = self._pending, None
+        if recorder is not None:
+            event = recorder.event(
+                self.table_name, self.operation_name, self._latency, None
+            )
+            self.instrumentation.emit(event)
+
+
+def instrument_results(
+    model: Type[Model], operation: str, results: ResultIterator[_T]
+) -> ResultIterator[_T]:
+    """
+    Reports every page read by `results` as an `operation` event
+    """
+    instrumentation = getattr(model, "instrumentation", None)
+    if instrumentation is None:
+        return results
+    page_iter = results.page_iter
+    recorder = _PageRecorder(
+        instrumentation,
+        model.Meta.table_name,
+        operation,
+        page_iter._operation,
+        results._map_fn,
+    )
+    page_iter._operation = recorder
+    results._map_fn = recorder.map
+    # a page left half read is reported once the iterator is dropped
+    weakref.finalize(results, recorder.flush)
+    return results
+
+
+def map_results(
+    results: ResultIterator[Any], map_fn: Callable[[Dict[str, Any]], _T]
+) -> ResultIterator[_T]:
+    """
+    Replaces the function building the items of `results`, instrumented or not
+    """
+    recorder = getattr(results._map_fn, "__self__", None)
+    if isinstance(recorder, _PageRecorder):
+        recorder.map_fn = map_fn
+    else:
+        results._map_fn = map_fn
+    return results  # type: ignore[return-value]
+
+
+class InstrumentedModelMixin(Model):
+    """
+    Reports model operations to `instrumentation`
+
+    `get`, `save`, `update`, `delete` and bulk operations emit an event each,
+    `query` and `scan` an event per page, batch writers an event per batch.
+    """
+
+    instrumentation: Optional[Instrumentation] = None
+
+    @classmethod
+    def get(cls: Type[_T], *args, **kwargs) -> _T:
+        with instrumented(cls, "get"):
+            return super().get(*args, **kwargs)
+
+    def save(self, *args, **kwargs) -> Dict[str, Any]:
+        with instrumented(self.__class__, "save"):
+            data = super().save(*args, **kwargs)
+            record_response(data)
+            return data
+
+    def update(self, *args, **kwargs) -> Any:
+        with instrumented(self.__class__, "update"):
+            data = super().update(*args, **kwargs)
+            record_response(data)
+            return data
+
+    def delete(self, *args, **kwargs) -> Any:
+        with instrumented(self.__class__, "delete"):
+            data = super().delete(*args, **kwargs)
+            record_response(data)
+            return data
+
+    @classmethod
+    def query(cls: Type[_T], *args, **kwargs) -> ResultIterator[_T]:
+        return instrument_results(cls, "query", super().query(*args, **kwargs))
+
+    @classmethod
+    def scan(cls: Type[_T], *args, **kwargs) -> ResultIterator[_T]:
+        return instrument_results(cls, "scan", super().scan(*args, **kwargs))
+
+    @classmethod
+    def from_raw_data(cls: Type[_T], data: Dict[str, Any]) -> _T:
+        recorder = _recorder()
+        if recorder is None:
+            return super().from_raw_data(data)
+        start = perf_counter()
+        item = super().from_raw_data(data)
+        recorder.serialize_time += perf_counter() - start
+        return item
+
+    def serialize(self, null_check: bool = True) -> Dict[str, Dict[str, Any]]:
+        recorder = _recorder()
+        if recorder is None:
+            return super().serialize(null_check=null_check)
+        start = perf_counter()
+        data = super().serialize(null_check=null_check)
+        recorder.serialize_time += perf_counter() - start
+        if not recorder.item_size:
+            # the first serialization is the written item, later ones fill caches
+            recorder.item_size = item_size(data)
+        return data
+
+    def deserialize(self, attribute_values: Dict[str, Dict[str, Any]]) -> None:
+        recorder = _recorder()
+        if recorder is None:
+            return super().deserialize(attribute_values)
+        start = perf_counter()
+        super().deserialize(attribute_values)
+        recorder.serialize_time += perf_counter() - start
+
+
+class OperationStats(NamedTuple):
+    operations: int
+    errors: int
+    requests: int
+    latency: float
+    latency_buckets: Tuple[int, ...]
+    serialize_time: float
+    consumed_capacity: float
+    scanned_count: int
+    count: int
+    retries: int
+    item_size: int
+
+    @property
+    def discard_ratio(self) -> float:
+        """
+        Share of the items read (and billed) that filters discarded
+        """
+        if not self.scanned_count:
+            return 0.0
+        return (self.scanned_count - self.count) / self.scanned_count
+
+
+# summed as they are
+_EVENT_TOTALS = (
+    "requests",
+    "latency",
+    "serialize_time",
+    "consumed_capacity",
+    "scanned_count",
+    "count",
+    "retries",
+    "item_size",
+)
+_COUNTERS = (
+    ("operations", "operations_total", "Model operations"),
+    ("errors", "errors_total", "Model operations that raised"),
+    ("requests", "requests_total", "DynamoDB requests"),
+    ("serialize_time", "serialize_seconds_total", "Serialization time"),
+    ("consumed_capacity", "consumed_capacity_total", "Consumed capacity units"),
+    ("scanned_count", "scanned_items_total", "Items read by queries and scans"),
+    ("count", "returned_items_total", "Items returned after filters"),
+    ("retries", "retries_total", "Retried requests"),
+    ("item_size", "item_bytes_total", "Bytes of items written or read"),
+)
+
+
+class MetricsAggregator:
+    """
+    Prometheus style in-memory aggregation of `OperationEvent`s, by table and operation
+
+    `render` gives the text exposition format, `snapshot` the `OperationStats`
+    of each `(table_name, operation)`, e.g. to find the most consuming tables
+    or the filters discarding most of what they read.
+    """
+
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(
+        self, prefix: str = "pynamodb", buckets: Sequence[float] = BUCKETS
+    ) -> None:
+        self.prefix = prefix
+        self.buckets = tuple(sorted(buckets))
+        self._totals: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: OperationEvent) -> None:
+        key = (event.table_name, event.operation)
+        bucket = bisect_left(self.buckets, event.latency)
+        with self._lock:
+            totals = self._totals.get(key)
+            if totals is None:
+                totals = self._totals[key] = dict.fromkeys(OperationStats._fields, 0)
+                totals["latency_buckets"] = [0] * (len(self.buckets) + 1)
+            totals["operations"] += 1
+            totals["errors"] += event.error is not None
+            totals["latency_buckets"][bucket] += 1
+            for field in _EVENT_TOTALS:
+                totals[field] += getattr(event, field)
+
+    def snapshot(self) -> Dict[Tuple[str, str], OperationStats]:
+        with self._lock:
+            return {
+                key: OperationStats(
+                    **{**totals, "latency_buckets": tuple(totals["latency_buckets"])}
+                )
+                for key, totals in self._totals.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._totals.clear()
+
+    def render(self) -> str:
+        snapshot = sorted(self.snapshot().items())
+        lines = []
+        for field, name, description in _COUNTERS:
+            metric = f"{self.prefix}_{name}"
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} counter")
+            for (table_name, operation), stats in snapshot:
+                labels = f'table="{table_name}",operation="{operation}"'
+                lines.append(f"{metric}{{{labels}}} {getattr(stats, field)}")
+
+        metric = f"{self.prefix}_latency_seconds"
+        lines.append(f"# HELP {metric} Model operation latency")
+        lines.append(f"# TYPE {metric} histogram")
+        for (table_name, operation), stats in snapshot:
+            labels = f'table="{table_name}",operation="{operation}"'
+            cumulative = 0
+            for bound, count in zip(self.buckets + (None,), stats.latency_buckets):
+                cumulative += count
+                le = "+Inf" if bound is None else repr(bound)
+                lines.append(f'{metric}_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f"{metric}_sum{{{labels}}} {stats.latency}")
+            lines.append(f"{metric}_count{{{labels}}} {stats.operations}")
+        return "\n".join(lines) + "\n"
+
+
+class LoggingSink:
+    """
+    Logs every event at `level`, and at warning level those slower than `slow`
+    seconds or whose filters discarded at least `discard_ratio` of what they read
+    """
+
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        level: int = logging.DEBUG,
+        slow: Optional[float] = None,
+        discard_ratio: Optional[float] = None,
+    ) -> None:
+        self.logger = logger or log
+        self.level = level
+        self.slow = slow
+        self.discard_ratio = discard_ratio
+
+    def __call__(self, event: OperationEvent) -> None:
+        level = self.level
+        if self.slow is not None and event.latency >= self.slow:
+            level = max(level, logging.WARNING)
+        if (
+            self.discard_ratio is not None
+            and event.scanned_count
+            and event.discarded / event.scanned_count >= self.discard_ratio
+        ):
+            level = max(level, logging.WARNING)
+        if event.error is not None:
+            level = max(level, logging.WARNING)
+        if not self.logger.isEnabledFor(level):
+            return
+        self.logger.log(
+            level,
+            "%s %s %.1fms (serialize %.1fms) requests=%d capacity=%s"
+            " scanned=%d count=%d retries=%d bytes=%d error=%s",
+            event.table_name,
+            event.operation,
+            event.latency * 1000,
+            event.serialize_time * 1000,
+            event.requests,
+            event.consumed_capacity,
+            event.scanned_count,
+            event.count,
+            event.retries,
+            event.item_size,
+            event.error,
+        )
@@ -0,0 +1,134 @@
+from typing import Any, Callable, Dict, Set, Type, TypeVar
+
+from pynamodb.constants import NULL
+from pynamodb.models import Model
+
+_T = TypeVar("_T", bound=Model)
+
+__all__ = ["LazyModelMixin", "LazyAttributeValues"]
+
+
+def _loading(method: Callable[..., Any]) -> Callable[..., Any]:
+    def wrapper(self, *args, **kwargs):
+        self.load_all()
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = method.__name__
+    return wrapper
+
+
+class LazyAttributeValues(Dict[str, Any]):
+    """
+    `attribute_values` of an item read lazily, keeping the raw item
+
+    An attribute is deserialized from the raw item the first time its value is
+    read, set or tested. Whole dictionary operations deserialize every attribute
+    first, so the mapping behaves as the eagerly built one.
+    """
+
+    __slots__ = ("_instance", "_data", "_loaded")
+
+    def __init__(self, instance: Model, data: Dict[str, Dict[str, Any]]) -> None:
+        # values set at instantiation, defaults the raw item may override
+        super().__init__(instance.attribute_values)
+        self._instance = instance
+        self._data = data
+        self._loaded: Set[str] = set()
+
+    def _load(self, name: str) -> None:
+        self._loaded.add(name)
+        attr = self._instance.get_attributes().get(name)
+        if attr is None:
+            return
+        value = self._data.get(attr.attr_name)
+        if value and NULL not in value:
+            try:
+                setattr(self._instance, name, attr.deserialize(attr.get_value(value)))
+            except BaseException:
+                self._loaded.discard(name)
+                raise
+
+    def load_all(self) -> None:
+        """
+        Deserialize the attributes not read yet
+        """
+        for name in self._instance.get_attributes():
+            if name not in self._loaded:
+                self._load(name)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self._loaded:
+            self._load(key)
+        return dict.get(self, key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        # loaded first, the default set at instantiation may be overridden
+        if key not in self._loaded:
+            self._load(key)
+        return dict.__getitem__(self, key)
+
+    def __contains__(self, key: Any) -> bool:
+        if key not in self._loaded:
+            self._load(key)
+        return dict.__contains__(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._loaded.add(key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self._loaded:
+            self._load(key)
+        dict.__delitem__(self, key)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key not in self._loaded:
+            self._load(key)
+        return dict.pop(self, key, *default)
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # copied and pickled as the plain dictionary of all values
+        self.load_all()
+        return dict, (dict(self),)
+
+    __iter__ = _loading(dict.__iter__)
+    __len__ = _loading(dict.__len__)
+    __eq__ = _loading(dict.__eq__)
+    __ne__ = _loading(dict.__ne__)
+    __repr__ = _loading(dict.__repr__)
+    keys = _loading(dict.keys)
+    values = _loading(dict.values)
+    items = _loading(dict.items)
+    copy = _loading(dict.copy)
+    update = _loading(dict.update)
+    setdefault = _loading(dict.setdefault)
+    popitem = _loading(dict.popitem)
+    clear = _loading(dict.clear)
+
+
+class LazyModelMixin(Model):
+    """
+    Set `lazy` to deserialize the attributes of read items on first access
+
+    Items returned by `get`, `batch_get`, `query` and `scan` keep their raw
+    DynamoDB attributes, an attribute costs nothing until it is read. Deserializing
+    errors are raised on access instead of when the item is read.
+    """
+
+    lazy: bool = False
+
+    @classmethod
+    def from_raw_data(cls: Type[_T], data: Dict[str, Any]) -> _T:
+        if not cls.lazy:  # type: ignore[attr-defined]
+            return super().from_raw_data(data)  # type: ignore[misc]
+        if data is None:
+            raise ValueError("Received no data to construct object")
+        stored_cls = cls._get_discriminator_class(data)
+        if stored_cls and not issubclass(stored_cls, cls):
+            raise ValueError(
+                f"Cannot instantiate a {cls.__name__} "
+                f"from the returned class: {stored_cls.__name__}"
+            )
+        instance = (stored_cls or cls)(_user_instantiated=False)
+        instance.attribute_values = LazyAttributeValues(instance, data)
+        return instance
@@ -0,0 +1,211 @@
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue, Full
+from threading import Event, Lock
+from typing import Optional, Any, Dict, Iterator, Callable, TypeVar, Iterable, Tuple
+
+from pynamodb.pagination import RateLimiter, ResultIterator
+
+_T = TypeVar("_T")
+
+__all__ = ["ScanCheckpoint", "SharedRateLimiter"]
+
+_DONE = object()
+_ERROR = object()
+_PUT_TIMEOUT = 0.1
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    Thread safe `RateLimiter` shared by every segment of a parallel scan
+    """
+
+    def __init__(self, rate_limit: float, time_module: Optional[Any] = None) -> None:
+        super().__init__(rate_limit, time_module=time_module)
+        self._lock = Lock()
+
+    def consume(self, units: int) -> None:
+        with self._lock:
+            super().consume(units)
+
+    def acquire(self) -> None:
+        # sleeping with the lock held holds back every other segment as well
+        with self._lock:
+            super().acquire()
+
+
+class ScanCheckpoint:
+    """
+    Per segment progress of a parallel scan
+
+    Segments resume from their `last_evaluated_key`, finished segments are skipped.
+    `to_dict`/`from_dict` round-trip through JSON for persistence.
+    """
+
+    def __init__(
+        self,
+        total_segments: int,
+        last_evaluated_keys: Optional[Dict[int, Dict[str, Any]]] = None,
+        finished: Optional[Iterable[int]] = None,
+    ) -> None:
+        self.total_segments = total_segments
+        self.last_evaluated_keys: Dict[int, Dict[str, Any]] = dict(
+            last_evaluated_keys or {}
+        )
+        self.finished = set(finished or ())
+
+    def update(self, segment: int, last_evaluated_key: Optional[Dict[str, Any]]):
+        if last_evaluated_key is None:
+            self.finish(segment)
+        else:
+            self.last_evaluated_keys[segment] = last_evaluated_key
+
+    def finish(self, segment: int) -> None:
+        self.last_evaluated_keys.pop(segment, None)
+        self.finished.add(segment)
+
+    @property
+    def done(self) -> bool:
+        return len(self.finished) == self.total_segments
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_segments": self.total_segments,
+            "last_evaluated_keys": {
+                str(segment): key for segment, key in self.last_evaluated_keys.items()
+            },
+            "finished": sorted(self.finished),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ScanCheckpoint":
+        return cls(
+            total_segments=data["total_segments"],
+            last_evaluated_keys={
+                int(segment): key
+                for segment, key in data.get("last_evaluated_keys", {}).items()
+            },
+            finished=data.get("finished"),
+        )
+
+
+def resolve_checkpoint(
+    checkpoint: Optional[ScanCheckpoint], total_segments: Optional[int], workers: int
+) -> ScanCheckpoint:
+    """
+    `checkpoint`, or a new one of `total_segments` (defaulting to `workers`)
+    """
+    if checkpoint is None:
+        return ScanCheckpoint(total_segments or workers)
+    if total_segments is not None and total_segments != checkpoint.total_segments:
+        raise ValueError(
+            f"total_segments {total_segments} does not match "
+            f"the checkpoint of {checkpoint.total_segments} segments"
+        )
+    return checkpoint
+
+
+def scan_segments(
+    scan: Callable[..., ResultIterator[_T]],
+    workers: int,
+    checkpoint: ScanCheckpoint,
+    rate_limit: Optional[float] = None,
+    max_queued: int = 1000,
+) -> Iterator[Tuple[int, Optional[_T], Optional[Dict[str, Any]]]]:
+    """
+    `(segment, item, last_evaluated_key)` of the segments of `scan` left to read
+
+    The last evaluated key is the one right after the item, a finished segment is
+    yielded once with no item. Segments resume from `checkpoint`, which is left
+    for the caller to update once it is done with the items.
+    """
+    if workers < 1:
+        raise ValueError("workers must be greater than zero")
+    total_segments = checkpoint.total_segments
+    limiter = SharedRateLimiter(rate_limit) if rate_limit else None
+
+    queue: Queue = Queue(maxsize=max_queued)
+    stop = Event()
+
+    def put(message) -> bool:
+        while not stop.is_set():
+            try:
+                queue.put(message, timeout=_PUT_TIMEOUT)
+                return True
+            except Full:
+                continue
+        return False
+
+    def run(segment: int) -> None:
+        try:
+            results = scan(
+                segment=segment,
+                total_segments=total_segments,
+                last_evaluated_key=checkpoint.last_evaluated_keys.get(segment),
+                rate_limit=rate_limit,
+            )
+            if limiter is not None:
+                # every segment draws from the same capacity budget
+                results.page_iter._rate_limiter = limiter
+            for item in results:
+                if not put((segment, item, results.last_evaluated_key)):
+                    return
+            put((segment, _DONE, None))
+        except Exception as e:
+            put((segment, _ERROR, e))
+
+    segments = [s for s in range(total_segments) if s not in checkpoint.finished]
+    if not segments:
+        return
+    executor = ThreadPoolExecutor(
+        max_workers=min(workers, len(segments)), thread_name_prefix="parallel_scan"
+    )
+    futures = [executor.submit(run, segment) for segment in segments]
+    remaining = len(segments)
+    try:
+        while remaining:
+            segment, item, payload = queue.get()
+            if item is _DONE:
+                remaining -= 1
+                yield segment, None, None
+            elif item is _ERROR:
+                raise payload
+            else:
+                yield segment, item, payload
+    finally:
+        stop.set()
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def parallel_scan(
+    scan: Callable[..., ResultIterator[_T]],
+    workers: int,
+    total_segments: Optional[int] = None,
+    rate_limit: Optional[float] = None,
+    checkpoint: Optional[ScanCheckpoint] = None,
+    max_queued: int = 1000,
+) -> Iterator[_T]:
+    """
+    Run the segments of `scan` on a thread pool and merge their items
+
+    `scan` is called with `segment`, `total_segments`, `last_evaluated_key` and
+    `rate_limit` keywords. Items go through a queue of at most `max_queued` items,
+    so memory stays flat whatever the table size. `checkpoint` is updated in place
+    once the caller is done with an item, resuming from it repeats no more than
+    the items in flight.
+    """
+    checkpoint = resolve_checkpoint(checkpoint, total_segments, workers)
+    segments = scan_segments(
+        scan, workers, checkpoint, rate_limit=rate_limit, max_queued=max_queued
+    )
+    try:
+        for segment, item, last_evaluated_key in segments:
+            if item is None:
+                checkpoint.finish(segment)
+            else:
+                yield item
+                checkpoint.update(segment, last_evaluated_key)
+    finally:
+        # stops the workers as soon as the caller does
+        segments.close()
@@ -0,0 +1,79 @@
+from collections import namedtuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Type
+
+from pynamodb.attributes import Attribute, DiscriminatorAttribute
+from pynamodb.constants import NULL
+from pynamodb.models import Model
+
+__all__ = ["row_type", "row_reader"]
+
+
+class _Holder:
+    """
+    Stand-in instance for attributes deserializing through their descriptors
+    """
+
+    __slots__ = ("attribute_values", "_dynamo_to_python_attrs")
+
+    def __init__(self, model: Type[Model]) -> None:
+        self.attribute_values: Dict[str, Any] = {}
+        self._dynamo_to_python_attrs = model._dynamo_to_python_attrs
+
+
+def _decoder(
+    model: Type[Model], attr: Attribute
+) -> Callable[[Optional[Dict[str, Any]]], Any]:
+    default = attr.default
+    # attributes converting values on `__set__` or `__get__` (lazy payloads,
+    # normalized datetimes) go through them, as on a model instance
+    plain = isinstance(attr, DiscriminatorAttribute) or (
+        type(attr).__get__ is Attribute.__get__
+        and type(attr).__set__ is Attribute.__set__
+    )
+    # a reader builds its rows one at a time, its decoders share a holder
+    holder = _Holder(model)
+
+    def decode(value: Optional[Dict[str, Any]]) -> Any:
+        if value and NULL not in value:
+            value = attr.deserialize(attr.get_value(value))
+        else:
+            value = default() if callable(default) else default
+        if plain or value is None:
+            return value
+        attr.__set__(holder, value)
+        return attr.__get__(holder, model)
+
+    return decode
+
+
+@lru_cache(maxsize=None)
+def row_type(model: Type[Model], names: Tuple[str, ...]) -> Type[tuple]:
+    """
+    Named tuple of the `names` attributes of `model`
+    """
+    attributes = model.get_attributes()
+    unknown = [name for name in names if name not in attributes]
+    if unknown:
+        raise ValueError(f"{model.__name__} has no attributes {unknown}")
+    return namedtuple(f"{model.__name__}Row", names)  # type: ignore[misc]
+
+
+def row_reader(
+    model: Type[Model], names: Sequence[str]
+) -> Callable[[Dict[str, Dict[str, Any]]], tuple]:
+    """
+    Function building the `row_type` of a raw item, as a model would read it
+    """
+    names = tuple(names)
+    make = row_type(model, names)._make
+    attributes = model.get_attributes()
+    decoders = [
+        (attributes[name].attr_name, _decoder(model, attributes[name]))
+        for name in names
+    ]
+
+    def read(data: Dict[str, Dict[str, Any]]) -> tuple:
+        return make([decode(data.get(attr_name)) for attr_name, decode in decoders])
+
+    return read
@@ -0,0 +1,225 @@
+import time
+from functools import partial
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Dict, Generic, List, Optional, Tuple, Type, TypeVar
+
+from pynamodb.constants import UNPROCESSED_ITEMS, PUT_REQUEST, ITEM
+from pynamodb.exceptions import PutError, PynamoDBException
+from pynamodb.models import Model
+from pynamodb.settings import OperationSettings
+
+from pynamodb_templates.models._bulk import backoff, call_with_retry
+from pynamodb_templates._size import item_size
+from pynamodb_templates.models._instrumentation import instrumented
+from pynamodb_templates.models._instrumentation import record_response, record_retry
+
+_T = TypeVar("_T", bound=Model)
+
+__all__ = ["BufferedWriter"]
+
+BATCH_WRITE_LIMIT = 25
+
+
+class BufferedWriter(Generic[_T]):
+    """
+    Write-behind `BatchWriteItem` writer
+
+    Items are serialized as they are saved and flushed in chunks of 25 once
+    `max_items` are buffered or the oldest buffered item is `max_age` seconds old.
+    Up to `workers` chunks are written concurrently, unprocessed items are resent
+    with jittered backoff. Saving a key again before it is flushed only writes
+    the latest item, and a key is never written by two chunks at once.
+
+    Items that could not be written are kept in `failed_operations`,
+    `PutError` is raised when the writer is closed if there are any. `written` is
+    called with the key of every item once its write is over, written or failed.
+    """
+
+    def __init__(
+        self,
+        model: Type[_T],
+        prepare: Optional[Callable[[_T], None]] = None,
+        written: Optional[Callable[[Tuple[Any, Any]], None]] = None,
+        max_items: int = BATCH_WRITE_LIMIT,
+        max_age: Optional[float] = 1.0,
+        workers: int = 4,
+        max_retries: Optional[int] = None,
+        settings: OperationSettings = OperationSettings.default,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be greater than zero")
+        self.model = model
+        self.prepare = prepare
+        self.written = written
+        self.max_items = max(max_items, 1)
+        self.max_age = max_age
+        self.max_retries = (
+            model.Meta.max_retry_attempts if max_retries is None else max_retries
+        )
+        self.base_delay = model.Meta.base_backoff_ms / 1000
+        self.settings = settings
+        self.failed_operations: List[Tuple[Dict[str, Any], Exception]] = []
+
+        self._connection = model._get_connection()
+        self._buffer: Dict[Tuple[Any, Any], Dict[str, Any]] = {}
+        self._buffered_at: Optional[float] = None
+        self._inflight: Dict[Tuple[Any, Any], Future] = {}
+        self._lock = Lock()
+        # writer threads never take `_lock`, `_flush_locked` may wait on them holding it
+        self._inflight_lock = Lock()
+        self._failed_lock = Lock()
+        self._pool = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="buffered_writer"
+        )
+        # at most `workers` chunks are waiting or running, `save` blocks beyond that
+        self._pending: List[Future] = []
+        self._workers = workers
+        self._closed = Event()
+        self._timer: Optional[Thread] = None
+        if max_age:
+            self._timer = Thread(target=self._flush_aged, daemon=True)
+            self._timer.start()
+
+    def __enter__(self) -> "BufferedWriter[_T]":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close(raise_failed=exc_type is None)
+
+    def _key(self, attributes: Dict[str, Any]) -> Tuple[Any, Any]:
+        hash_key = self.model._hash_key_attribute()
+        range_key = self.model._range_key_attribute()
+        if range_key is None:
+            return attributes[hash_key.attr_name][hash_key.attr_type], None
+        return (
+            attributes[hash_key.attr_name][hash_key.attr_type],
+            attributes[range_key.attr_name][range_key.attr_type],
+        )
+
+    def save(self, item: _T) -> None:
+        """
+        Buffer `item`, flushing chunks as thresholds are reached
+        """
+        if self._closed.is_set():
+            raise ValueError("writer is closed")
+        if self.prepare is not None:
+            self.prepare(item)
+        self.save_serialized(item.serialize())
+
+    def save_serialized(self, attributes: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Buffer already serialized item `attributes` as they are, skipping `prepare`
+        """
+        if self._closed.is_set():
+            raise ValueError("writer is closed")
+        with self._lock:
+            if not self._buffer:
+                self._buffered_at = time.monotonic()
+            self._buffer[self._key(attributes)] = attributes
+            if len(self._buffer) >= self.max_items:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """
+        Write every buffered item and wait for all writes to finish
+        """
+        with self._lock:
+            self._flush_locked()
+            pending = list(self._pending)
+        wait(pending)
+
+    def close(self, raise_failed: bool = True) -> None:
+        self._closed.set()
+        try:
+            self.flush()
+        finally:
+            if self._timer is not None:
+                self._timer.join()
+            self._pool.shutdown(wait=True)
+        if raise_failed and self.failed_operations:
+            raise PutError(
+                f"Failed to batch write {len(self.failed_operations)} items",
+                self.failed_operations[0][1],
+            )
+
+    def _flush_aged(self) -> None:
+        while not self._closed.wait(self.max_age / 2):
+            with self._lock:
+                if (
+                    self._buffer
+                    and time.monotonic() - self._buffered_at >= self.max_age
+                ):
+                    self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        items = list(self._buffer.items())
+        self._buffer.clear()
+        self._buffered_at = None
+        for i in range(0, len(items), BATCH_WRITE_LIMIT):
+            chunk = dict(items[i : i + BATCH_WRITE_LIMIT])
+            self._pending = [f for f in self._pending if not f.done()]
+            if len(self._pending) >= self._workers:
+                # backpressure, keeps memory bounded when writes fall behind
+                wait(self._pending[: len(self._pending) - self._workers + 1])
+            with self._inflight_lock:
+                # a key still being written by another chunk is written after it
+                previous = {self._inflight[k] for k in chunk if k in self._inflight}
+                future = self._pool.submit(self._write, chunk, previous)
+                for key in chunk:
+                    self._inflight[key] = future
+            self._pending.append(future)
+            future.add_done_callback(partial(self._done, keys=list(chunk)))
+
+    def _done(self, future: Future, keys: List[Tuple[Any, Any]]) -> None:
+        with self._inflight_lock:
+            for key in keys:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+
+    def _write(self, chunk: Dict[Tuple[Any, Any], Dict[str, Any]], previous) -> None:
+        if previous:
+            wait(previous)
+        try:
+            with instrumented(self.model, "batch_write") as recorder:
+                if recorder is not None:
+                    recorder.item_size = sum(map(item_size, chunk.values()))
+                self._write_items(list(chunk.values()))
+        finally:
+            if self.written is not None:
+                for key in chunk:
+                    self.written(key)
+
+    def _write_items(self, put_items: List[Dict[str, Any]]) -> None:
+        attempt = 0
+        while put_items:
+            try:
+                data = call_with_retry(
+                    lambda: self._connection.batch_write_item(
+                        put_items=put_items, settings=self.settings
+                    ),
+                    max_retries=self.max_retries,
+                    base_delay=self.base_delay,
+                )
+            except PynamoDBException as e:
+                self._failed(put_items, e)
+                return
+            record_response(data)
+            unprocessed = data.get(UNPROCESSED_ITEMS, {}).get(
+                self.model.Meta.table_name, []
+            )
+            put_items = [request[PUT_REQUEST][ITEM] for request in unprocessed]
+            if put_items:
+                if attempt >= self.max_retries:
+                    error = PutError(
+                        "Failed to batch write items: max_retry_attempts exceeded"
+                    )
+                    self._failed(put_items, error)
+                    return
+                record_retry()
+                time.sleep(backoff(attempt, self.base_delay))
+                attempt += 1
+
+    def _failed(self, items: List[Dict[str, Any]], error: Exception) -> None:
+        with self._failed_lock:
+            self.failed_operations.extend((item, error) for item in items)
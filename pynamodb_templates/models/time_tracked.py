@@ -1,9 +1,37 @@
-from datetime import datetime, timezone
+import threading
+import time
+from functools import partial
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+from datetime import datetime, timezone, timedelta
 from typing import Optional, Any, List, Dict, TypeVar, Type, Iterable, Sequence
+from typing import NamedTuple, Tuple, Iterator, Callable, Union, Set
 
+from pynamodb.constants import UNPROCESSED_ITEMS, DELETE_REQUEST, KEY, ITEM, STRING
+from pynamodb.exceptions import PynamoDBException, DeleteError
+from pynamodb.attributes import TTLAttribute
+from pynamodb.indexes import GlobalSecondaryIndex
 from pynamodb.models import Model, Condition, OperationSettings, Action, ResultIterator
+from pynamodb.pagination import RateLimiter
 
-from pynamodb_templates.attributes import UnicodeDatetimeAttribute
+from pynamodb_templates.attributes import UnicodeUTCDatetimeAttribute
+from pynamodb_templates.models._async import AsyncModelMixin
+from pynamodb_templates.models._bulk import BulkReport, backoff, call_with_retry
+from pynamodb_templates.models._bulk import run_bulk
+from pynamodb_templates.models._cache import ModelCache
+from pynamodb_templates.models._compiled import CompiledModelMixin
+from pynamodb_templates.models._changes import ChangeCheckpoint, bucket_start
+from pynamodb_templates.models._export import ExportCheckpoint, export_segments
+from pynamodb_templates.models._export import import_parts
+from pynamodb_templates.models._instrumentation import InstrumentedModelMixin
+from pynamodb_templates.models._instrumentation import instrumented, map_results
+from pynamodb_templates.models._instrumentation import record_response, record_retry
+from pynamodb_templates.models._lazy import LazyModelMixin
+from pynamodb_templates.models._parallel import ScanCheckpoint, parallel_scan
+from pynamodb_templates.models._parallel import resolve_checkpoint, scan_segments
+from pynamodb_templates.models._rows import row_reader
+from pynamodb_templates.models._writer import BufferedWriter, BATCH_WRITE_LIMIT
 
 _T = TypeVar("_T", bound="Model")
 _KeyType = Any
@@ -13,19 +41,177 @@ __all__ = [
     "CreatedAtTimeMixin",
     "ModifiedAtTimeMixin",
     "DeletedAtTimeMixin",
+    "ReadCounts",
+    "read_counts",
 ]
 
 
+_frozen_now = threading.local()
+
+
 def utcnow():
-    return datetime.now(tz=timezone.utc)
+    now = getattr(_frozen_now, "value", None)
+    return datetime.now(tz=timezone.utc) if now is None else now
+
+
+@contextmanager
+def _frozen_utcnow() -> Iterator[datetime]:
+    """
+    `utcnow` returns the same instant within the block, in the current thread
+    """
+    if getattr(_frozen_now, "value", None) is not None:
+        yield _frozen_now.value
+        return
+    _frozen_now.value = now = datetime.now(tz=timezone.utc)
+    try:
+        yield now
+    finally:
+        _frozen_now.value = None
+
+
+class ReadCounts(NamedTuple):
+    scanned: int
+    returned: int
+
+    @property
+    def discarded(self) -> int:
+        return self.scanned - self.returned
+
+
+def read_counts(results: ResultIterator) -> ReadCounts:
+    """
+    Items read (and billed) by DynamoDB against items returned by filters so far
+    """
+    return ReadCounts(results.page_iter.total_scanned_count, results.total_count)
+
+
+def _cache_put(item: Model) -> None:
+    cache = getattr(item, "cache", None)
+    if cache is not None:
+        data = item.serialize()
+        modified_at = data.get(item.__class__.modified_at.attr_name, {}).get(STRING)
+        cache.put(item._get_hash_range_key_serialized_values(), data, modified_at)
+
+
+def _cache_discard(model: Type[Model], key: Tuple[Any, Any]) -> None:
+    cache = getattr(model, "cache", None)
+    if cache is not None:
+        cache.invalidate(key)
+
+
+def _modified_actions(model: Type[Model], modified_at: datetime) -> List[Action]:
+    # soft deletes and restores are changes as well, when `modified_at` is tracked
+    if issubclass(model, ModifiedAtTimeMixin):
+        return model._modified_actions(modified_at)
+    return []
 
 
 class CreatedAtTimeMixin(Model):
-    created_at = UnicodeDatetimeAttribute(default_for_new=utcnow, force_utc=True)
+    created_at = UnicodeUTCDatetimeAttribute(default_for_new=utcnow)
 
 
 class ModifiedAtTimeMixin(Model):
-    modified_at = UnicodeDatetimeAttribute(default_for_new=utcnow, force_utc=True)
+    """
+    `modified_at` stamped on every `save` and `update`
+
+    Set `cache` to a `ModelCache` to serve `get` from memory. Writes through the
+    model refresh their entry, failed writes drop it, and a revalidating cache
+    compares `modified_at` with the table before serving a stale entry.
+
+    Set `change_index` to a global secondary index keyed by an attribute holding
+    the `change_bucket` long time bucket of `modified_at`, with `modified_at` as
+    range key, to read changes in order with `TimeTrackedModel.changes`.
+
+    >>> class Thing(TimeTrackedModel):
+    >>>     class ChangeIndex(GlobalSecondaryIndex):
+    >>>         class Meta:
+    >>>             index_name = "changes"
+    >>>             projection = AllProjection()
+    >>>         modified_bucket = UnicodeAttribute(hash_key=True)
+    >>>         modified_at = UnicodeUTCDatetimeAttribute(range_key=True)
+    >>>
+    >>>     id = UnicodeAttribute(hash_key=True)
+    >>>     modified_bucket = UnicodeAttribute(null=True)
+    >>>     change_index = ChangeIndex()
+    >>>     cache = ModelCache(max_items=10000, ttl=30, revalidate=True)
+    """
+
+    modified_at = UnicodeUTCDatetimeAttribute(default_for_new=utcnow)
+    cache: Optional[ModelCache] = None
+    change_index: Optional[GlobalSecondaryIndex] = None
+    change_bucket: timedelta = timedelta(hours=1)
+
+    @classmethod
+    def _change_bucket_name(cls) -> Optional[str]:
+        if cls.change_index is None:
+            return None
+        attr_name = cls.change_index._hash_key_attribute().attr_name
+        return cls._dynamo_to_python_attr(attr_name)
+
+    @classmethod
+    def _serialize_change_bucket(cls, modified_at: datetime) -> str:
+        return cls.modified_at.serialize(bucket_start(modified_at, cls.change_bucket))
+
+    @classmethod
+    def _modified_actions(cls, modified_at: datetime) -> List[Action]:
+        actions = [cls.modified_at.set(modified_at)]
+        change_bucket_name = cls._change_bucket_name()
+        if change_bucket_name:
+            bucket = cls._serialize_change_bucket(modified_at)
+            actions.append(getattr(cls, change_bucket_name).set(bucket))
+        return actions
+
+    def _update_change_bucket(self) -> None:
+        change_bucket_name = self._change_bucket_name()
+        if change_bucket_name and self.modified_at is not None:
+            bucket = self._serialize_change_bucket(self.modified_at)
+            setattr(self, change_bucket_name, bucket)
+
+    @classmethod
+    def get(
+        cls: Type[_T],
+        hash_key: _KeyType,
+        range_key: Optional[_KeyType] = None,
+        consistent_read: bool = False,
+        attributes_to_get: Optional[Sequence[str]] = None,
+        settings: OperationSettings = OperationSettings.default,
+    ) -> _T:
+        key = cls._serialize_keys(hash_key, range_key)
+        connection = cls._get_connection()
+
+        def read(consistent_read=False, attributes_to_get=None):
+            data = connection.get_item(
+                key[0],
+                range_key=key[1],
+                consistent_read=consistent_read,
+                attributes_to_get=attributes_to_get,
+                settings=settings,
+            )
+            record_response(data)
+            return data.get(ITEM) if data else None
+
+        cache = cls.cache
+        if cache is None or attributes_to_get is not None:
+            item_data = read(consistent_read, attributes_to_get)
+            if not item_data:
+                raise cls.DoesNotExist()
+            return cls.from_raw_data(item_data)
+
+        modified_at_name = cls.modified_at.attr_name
+
+        def modified_at():
+            item_data = read(attributes_to_get=[modified_at_name]) or {}
+            return item_data.get(modified_at_name, {}).get(STRING)
+
+        # consistent reads skip the cache, but still refresh it
+        item_data = None if consistent_read else cache.get(key, modified_at)
+        if item_data is None:
+            item_data = read(consistent_read)
+            if not item_data:
+                cache.invalidate(key)
+                raise cls.DoesNotExist()
+            cache.put(key, item_data, item_data.get(modified_at_name, {}).get(STRING))
+        return cls.from_raw_data(item_data)
 
     def update(
         self,
@@ -35,8 +221,17 @@ class ModifiedAtTimeMixin(Model):
         update_timestamp: bool = True,
     ) -> Any:
         if update_timestamp:
-            actions.append(self.__class__.modified_at.set(utcnow()))
-        return super().update(actions=actions, condition=condition, settings=settings)
+            actions.extend(self._modified_actions(utcnow()))
+        try:
+            data = super().update(
+                actions=actions, condition=condition, settings=settings
+            )
+        except Exception:
+            key = self._get_hash_range_key_serialized_values()
+            _cache_discard(self.__class__, key)
+            raise
+        _cache_put(self)
+        return data
 
     def save(
         self,
@@ -46,11 +241,94 @@ class ModifiedAtTimeMixin(Model):
     ) -> Dict[str, Any]:
         if update_timestamp:
             self.modified_at = utcnow()
-        return super().save(condition=condition, settings=settings)
+        self._update_change_bucket()
+        try:
+            data = super().save(condition=condition, settings=settings)
+        except Exception:
+            key = self._get_hash_range_key_serialized_values()
+            _cache_discard(self.__class__, key)
+            raise
+        _cache_put(self)
+        return data
 
 
 class DeletedAtTimeMixin(Model):
-    deleted_at = UnicodeDatetimeAttribute(null=True, force_utc=True)
+    """
+    Soft delete with `deleted_at`
+
+    Set `live_index` to a sparse global secondary index keyed by an attribute holding
+    a copy of the hash key, kept on live items only. `ignore_deleted` reads are then
+    routed to that index, instead of reading tombstones and filtering them out.
+    Being a global index, it is eventually consistent, consistent reads keep the filter.
+
+    >>> class Thing(TimeTrackedModel):
+    >>>     class LiveIndex(GlobalSecondaryIndex):
+    >>>         class Meta:
+    >>>             index_name = "live"
+    >>>             projection = AllProjection()
+    >>>         live_id = UnicodeAttribute(hash_key=True)
+    >>>         sk = UnicodeAttribute(range_key=True)
+    >>>
+    >>>     id = UnicodeAttribute(hash_key=True)
+    >>>     sk = UnicodeAttribute(range_key=True)
+    >>>     live_id = UnicodeAttribute(null=True)
+    >>>     live_index = LiveIndex()
+
+    Set `retention` to keep tombstones for that long only. With a `TTLAttribute` on
+    the model, soft deletes set it to `deleted_at + retention` (and live items
+    clear it), so DynamoDB expires them at no cost. Tables without TTL purge them
+    with `purge_deleted`.
+
+    >>> class Thing(TimeTrackedModel):
+    >>>     retention = timedelta(days=30)
+    >>>     expires_at = TTLAttribute(null=True)
+    """
+
+    deleted_at = UnicodeUTCDatetimeAttribute(null=True)
+    live_index: Optional[GlobalSecondaryIndex] = None
+    retention: Optional[timedelta] = None
+
+    @classmethod
+    def _live_attribute_name(cls) -> Optional[str]:
+        if cls.live_index is None:
+            return None
+        attr_name = cls.live_index._hash_key_attribute().attr_name
+        return cls._dynamo_to_python_attr(attr_name)
+
+    @classmethod
+    def _expires_at_attribute(cls) -> Optional[TTLAttribute]:
+        if cls.retention is None:
+            return None
+        return cls._ttl_attribute()
+
+    @classmethod
+    def _deleted_actions(cls, now: datetime) -> List[Action]:
+        actions = [cls.deleted_at.set(now), *_modified_actions(cls, now)]
+        live_attribute_name = cls._live_attribute_name()
+        if live_attribute_name:
+            actions.append(getattr(cls, live_attribute_name).remove())
+        expires_at = cls._expires_at_attribute()
+        if expires_at is not None:
+            actions.append(expires_at.set(now + cls.retention))
+        return actions
+
+    @classmethod
+    def _ignore_deleted(
+        cls,
+        index_name: Optional[str],
+        filter_condition: Optional[Condition],
+        consistent_read: Optional[bool],
+    ) -> Tuple[Optional[str], Optional[Condition]]:
+        live_index_name = cls.live_index.Meta.index_name if cls.live_index else None
+        if index_name is None and live_index_name and not consistent_read:
+            index_name = live_index_name
+        if index_name is not None and index_name == live_index_name:
+            return index_name, filter_condition
+        if filter_condition is None:
+            filter_condition = cls.deleted_at.does_not_exist()
+        else:
+            filter_condition = filter_condition & cls.deleted_at.does_not_exist()
+        return index_name, filter_condition
 
     @classmethod
     def query(
@@ -70,10 +348,9 @@ class DeletedAtTimeMixin(Model):
         settings: OperationSettings = OperationSettings.default,
     ) -> ResultIterator[_T]:
         if ignore_deleted:
-            if filter_condition is None:
-                filter_condition = cls.deleted_at.does_not_exist()
-            else:
-                filter_condition = filter_condition & cls.deleted_at.does_not_exist()
+            index_name, filter_condition = cls._ignore_deleted(
+                index_name, filter_condition, consistent_read
+            )
         return super().query(
             hash_key=hash_key,
             range_key_condition=range_key_condition,
@@ -106,10 +383,9 @@ class DeletedAtTimeMixin(Model):
         settings: OperationSettings = OperationSettings.default,
     ) -> ResultIterator[_T]:
         if ignore_deleted:
-            if filter_condition is None:
-                filter_condition = cls.deleted_at.does_not_exist()
-            else:
-                filter_condition = filter_condition & cls.deleted_at.does_not_exist()
+            index_name, filter_condition = cls._ignore_deleted(
+                index_name, filter_condition, consistent_read
+            )
         return super().scan(
             filter_condition=filter_condition,
             segment=segment,
@@ -124,6 +400,344 @@ class DeletedAtTimeMixin(Model):
             settings=settings,
         )
 
+    @classmethod
+    def parallel_scan(
+        cls: Type[_T],
+        workers: int = 4,
+        filter_condition: Optional[Condition] = None,
+        ignore_deleted: bool = True,
+        total_segments: Optional[int] = None,
+        page_size: Optional[int] = None,
+        consistent_read: Optional[bool] = None,
+        index_name: Optional[str] = None,
+        rate_limit: Optional[float] = None,
+        attributes_to_get: Optional[Sequence[str]] = None,
+        checkpoint: Optional[ScanCheckpoint] = None,
+        max_queued: int = 1000,
+        settings: OperationSettings = OperationSettings.default,
+    ) -> Iterator[_T]:
+        """
+        Segmented `scan` on a pool of `workers` threads, yielding items as they come
+
+        `total_segments` defaults to `workers`, `rate_limit` is shared by all segments.
+        Pass a `ScanCheckpoint` to resume a previous scan, it is updated in place.
+        """
+        scan = cls._segment_scan(
+            filter_condition=filter_condition,
+            ignore_deleted=ignore_deleted,
+            page_size=page_size,
+            consistent_read=consistent_read,
+            index_name=index_name,
+            attributes_to_get=attributes_to_get,
+            settings=settings,
+        )
+        return parallel_scan(
+            scan,
+            workers=workers,
+            total_segments=total_segments,
+            rate_limit=rate_limit,
+            checkpoint=checkpoint,
+            max_queued=max_queued,
+        )
+
+    @classmethod
+    def _segment_scan(cls, **kwargs) -> Callable[..., ResultIterator]:
+        # build the connection once, before the worker threads race for it
+        cls._get_connection()
+
+        def scan(segment, total_segments, last_evaluated_key, rate_limit):
+            return cls.scan(
+                segment=segment,
+                total_segments=total_segments,
+                last_evaluated_key=last_evaluated_key,
+                rate_limit=rate_limit,
+                **kwargs,
+            )
+
+        return scan
+
+    @classmethod
+    def _serialize_bulk_key(cls, key: Any) -> Tuple[Any, Any]:
+        if cls._range_keyname:
+            hash_key, range_key = key
+        else:
+            hash_key, range_key = key, None
+        return cls._serialize_keys(hash_key, range_key)
+
+    @classmethod
+    def _bulk_update(
+        cls,
+        operation: str,
+        keys: Iterable[Any],
+        actions: Callable[[Any], List[Action]],
+        workers: int,
+        max_retries: Optional[int],
+        settings: OperationSettings,
+    ) -> BulkReport:
+        connection = cls._get_connection()
+        if max_retries is None:
+            max_retries = cls.Meta.max_retry_attempts
+        base_delay = cls.Meta.base_backoff_ms / 1000
+        # never create items from keys that do not exist
+        condition = cls._hash_key_attribute().exists()
+
+        def update(chunk):
+            outcomes = []
+            for key in chunk:
+                try:
+                    hash_key, range_key = cls._serialize_bulk_key(key)
+                    _cache_discard(cls, (hash_key, range_key))
+                    with instrumented(cls, operation):
+                        data = call_with_retry(
+                            lambda: connection.update_item(
+                                hash_key,
+                                range_key=range_key,
+                                actions=actions(key),
+                                condition=condition,
+                                settings=settings,
+                            ),
+                            max_retries=max_retries,
+                            base_delay=base_delay,
+                        )
+                        record_response(data)
+                except Exception as e:
+                    outcomes.append((key, e))
+                else:
+                    outcomes.append((key, None))
+            return outcomes
+
+        return run_bulk(update, list(keys), workers=workers)
+
+    @classmethod
+    def bulk_soft_delete(
+        cls,
+        keys: Iterable[Any],
+        workers: int = 8,
+        max_retries: Optional[int] = None,
+        settings: OperationSettings = OperationSettings.default,
+    ) -> BulkReport:
+        """
+        Soft delete items by keys, with the same `deleted_at` for all of them
+
+        Keys are hash keys, or `(hash_key, range_key)` tuples for tables with range key.
+        Missing items are reported as failed instead of being created.
+        """
+        actions = cls._deleted_actions(utcnow())
+        return cls._bulk_update(
+            "bulk_soft_delete",
+            keys,
+            lambda key: actions,
+            workers,
+            max_retries,
+            settings,
+        )
+
+    @classmethod
+    def bulk_restore(
+        cls,
+        keys: Iterable[Any],
+        workers: int = 8,
+        max_retries: Optional[int] = None,
+        settings: OperationSettings = OperationSettings.default,
+    ) -> BulkReport:
+        """
+        Undo soft deletes of items by keys
+        """
+        live_attribute_name = cls._live_attribute_name()
+        expires_at = cls._expires_at_attribute()
+        now = utcnow()
+
+        def actions(key):
+            restore = [cls.deleted_at.remove(), *_modified_actions(cls, now)]
+            if live_attribute_name:
+                hash_key = key[0] if cls._range_keyname else key
+                restore.append(getattr(cls, live_attribute_name).set(hash_key))
+            if expires_at is not None:
+                restore.append(expires_at.remove())
+            return restore
+
+        return cls._bulk_update(
+            "bulk_restore", keys, actions, workers, max_retries, settings
+        )
+
+    @classmethod
+    def bulk_hard_delete(
+        cls,
+        keys: Iterable[Any],
+        workers: int = 8,
+        max_retries: Optional[int] = None,
+        settings: OperationSettings = OperationSettings.default,
+    ) -> BulkReport:
+        """
+        Delete items by keys for good, through `BatchWriteItem` requests of 25 keys
+        """
+        connection = cls._get_connection()
+        if max_retries is None:
+            max_retries = cls.Meta.max_retry_attempts
+        base_delay = cls.Meta.base_backoff_ms / 1000
+        hash_key_name = cls._hash_key_attribute().attr_name
+        range_key_name = cls._range_keyname and cls._range_key_attribute().attr_name
+
+        def unprocessed_key(request) -> Tuple[Any, Any]:
+            item = request[DELETE_REQUEST][KEY]
+            hash_key = next(iter(item[hash_key_name].values()))
+            if range_key_name:
+                return hash_key, next(iter(item[range_key_name].values()))
+            return hash_key, None
+
+        def delete(chunk):
+            with instrumented(cls, "bulk_hard_delete"):
+                return delete_chunk(chunk)
+
+        def delete_chunk(chunk):
+            outcomes = []
+            serialized = {}
+            for key in chunk:
+                try:
+                    serialized[id(key)] = cls._serialize_bulk_key(key)
+                except Exception as e:
+                    outcomes.append((key, e))
+
+            # a set also drops duplicated keys, which BatchWriteItem rejects
+            pending = set(serialized.values())
+            for serialized_key in pending:
+                _cache_discard(cls, serialized_key)
+            error = None
+            attempt = 0
+            while pending:
+                delete_items = []
+                for hash_key, range_key in pending:
+                    item = {hash_key_name: hash_key}
+                    if range_key_name:
+                        item[range_key_name] = range_key
+                    delete_items.append(item)
+                try:
+                    data = call_with_retry(
+                        lambda: connection.batch_write_item(
+                            delete_items=delete_items, settings=settings
+                        ),
+                        max_retries=max_retries,
+                        base_delay=base_delay,
+                    )
+                except PynamoDBException as e:
+                    error = e
+                    break
+                record_response(data)
+                unprocessed = data.get(UNPROCESSED_ITEMS, {})
+                pending = {
+                    unprocessed_key(request)
+                    for request in unprocessed.get(cls.Meta.table_name, [])
+                }
+                if pending:
+                    if attempt >= max_retries:
+                        error = DeleteError(
+                            "Failed to batch delete items: max_retry_attempts exceeded"
+                        )
+                        break
+                    record_retry()
+                    time.sleep(backoff(attempt, base_delay))
+                    attempt += 1
+
+            for key in chunk:
+                if id(key) in serialized:
+                    failed = serialized[id(key)] in pending
+                    outcomes.append((key, error if failed else None))
+            return outcomes
+
+        return run_bulk(
+            delete, list(keys), workers=workers, chunk_size=BATCH_WRITE_LIMIT
+        )
+
+    @classmethod
+    def purge_deleted(
+        cls,
+        retention: Optional[timedelta] = None,
+        workers: int = 4,
+        total_segments: Optional[int] = None,
+        page_size: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+        delete_rate_limit: Optional[float] = None,
+        checkpoint: Optional[ScanCheckpoint] = None,
+        max_retries: Optional[int] = None,
+        settings: OperationSettings = OperationSettings.default,
+    ) -> BulkReport:
+        """
+        Delete for good the items soft deleted more than `retention` ago
+
+        For tables that cannot use TTL. Tombstones are found by a parallel scan of
+        at most `rate_limit` read units per second, and deleted through
+        `bulk_hard_delete` at most `delete_rate_limit` items per second.
+        `retention` defaults to the model's. An item restored while it is being
+        purged may still be deleted. `checkpoint` is updated in place once keys
+        are deleted, a segment is resumed from before its first failed key.
+        """
+        if retention is None:
+            retention = cls.retention
+        if retention is None:
+            raise ValueError(f"{cls.__name__}.retention is not set")
+        key_names = [cls._hash_key_attribute().attr_name]
+        if cls._range_keyname:
+            key_names.append(cls._range_key_attribute().attr_name)
+
+        scan = cls._segment_scan(
+            filter_condition=cls.deleted_at <= utcnow() - retention,
+            ignore_deleted=False,
+            page_size=page_size,
+            attributes_to_get=key_names,
+            settings=settings,
+        )
+        checkpoint = resolve_checkpoint(checkpoint, total_segments, workers)
+        tombstones = scan_segments(scan, workers, checkpoint, rate_limit=rate_limit)
+
+        def key_of(item):
+            hash_key = getattr(item, cls._hash_keyname)
+            if cls._range_keyname:
+                return hash_key, getattr(item, cls._range_keyname)
+            return hash_key
+
+        limiter = RateLimiter(delete_rate_limit) if delete_rate_limit else None
+        report = BulkReport()
+        # segments with a key that could not be deleted resume from before it
+        stopped: Set[int] = set()
+        try:
+            # a batch of keys per worker at a time, deleted while the scan goes on
+            while True:
+                chunk = [
+                    (segment, None if item is None else key_of(item), after)
+                    for segment, item, after in islice(
+                        tombstones, BATCH_WRITE_LIMIT * workers
+                    )
+                ]
+                if not chunk:
+                    return report
+                keys = [key for _, key, _ in chunk if key is not None]
+                failed = set()
+                if keys:
+                    if limiter is not None:
+                        limiter.acquire()
+                        limiter.consume(len(keys))
+                    chunk_report = cls.bulk_hard_delete(
+                        keys,
+                        workers=workers,
+                        max_retries=max_retries,
+                        settings=settings,
+                    )
+                    report.succeeded.extend(chunk_report.succeeded)
+                    report.failed.extend(chunk_report.failed)
+                    failed = {key for key, _ in chunk_report.failed}
+                # the checkpoint only moves past deleted keys
+                for segment, key, after in chunk:
+                    if segment in stopped:
+                        continue
+                    if key is None:
+                        checkpoint.finish(segment)
+                    elif key in failed:
+                        stopped.add(segment)
+                    else:
+                        checkpoint.update(segment, after)
+        finally:
+            tombstones.close()
+
     def delete(
         self,
         force: bool = False,
@@ -131,20 +745,325 @@ class DeletedAtTimeMixin(Model):
         settings: OperationSettings = OperationSettings.default,
     ) -> Any:
         if force:
-            return super().delete(condition=condition, settings=settings)
+            try:
+                return super().delete(condition=condition, settings=settings)
+            finally:
+                key = self._get_hash_range_key_serialized_values()
+                _cache_discard(self.__class__, key)
         else:
-            actions = [self.__class__.deleted_at.set(utcnow())]
-            return super().update(
-                actions=actions, condition=condition, settings=settings
-            )
+            actions = self._deleted_actions(utcnow())
+            try:
+                data = super().update(
+                    actions=actions, condition=condition, settings=settings
+                )
+            except Exception:
+                key = self._get_hash_range_key_serialized_values()
+                _cache_discard(self.__class__, key)
+                raise
+            _cache_put(self)
+            return data
+
+    def save(
+        self,
+        condition: Optional[Condition] = None,
+        settings: OperationSettings = OperationSettings.default,
+    ) -> Dict[str, Any]:
+        self._update_live_attribute()
+        self._update_expires_at()
+        return super().save(condition=condition, settings=settings)
+
+    def _update_live_attribute(self) -> None:
+        live_attribute_name = self._live_attribute_name()
+        if live_attribute_name:
+            live = None if self.is_deleted else getattr(self, self._hash_keyname)
+            setattr(self, live_attribute_name, live)
+
+    def _update_expires_at(self) -> None:
+        expires_at = self._expires_at_attribute()
+        if expires_at is not None:
+            deleted_at = self.deleted_at
+            expires = None if deleted_at is None else deleted_at + self.retention
+            setattr(self, self._dynamo_to_python_attr(expires_at.attr_name), expires)
 
     @property
     def is_deleted(self):
         return self.deleted_at is not None
 
 
-class TimeTrackedModel(CreatedAtTimeMixin, ModifiedAtTimeMixin, DeletedAtTimeMixin):
+class TimeTrackedModel(
+    InstrumentedModelMixin,
+    CreatedAtTimeMixin,
+    ModifiedAtTimeMixin,
+    DeletedAtTimeMixin,
+    AsyncModelMixin,
+    LazyModelMixin,
+    CompiledModelMixin,
+):
     tz = timezone.utc
+    # the instant the timestamps of a new item were defaulted at, until it is saved
+    _new_at: Optional[datetime] = None
+
+    def _set_defaults(self, _user_instantiated: bool = True) -> None:
+        if not _user_instantiated:
+            return super()._set_defaults(_user_instantiated)
+        # a new item is created and modified at the same instant, read once
+        with _frozen_utcnow() as now:
+            super()._set_defaults(_user_instantiated)
+        self._new_at = now
+
+    def _stamp_new(self, now: datetime) -> None:
+        # timestamps defaulted when a new item was built are those of its first write
+        new_at = self._new_at
+        if new_at is None:
+            return
+        for name, attr in self.get_attributes().items():
+            if attr.default_for_new is utcnow and getattr(self, name) is new_at:
+                setattr(self, name, now)
+        self._new_at = None
+
+    def save(
+        self,
+        condition: Optional[Condition] = None,
+        settings: OperationSettings = OperationSettings.default,
+        update_timestamp: bool = True,
+    ) -> Dict[str, Any]:
+        # one instant for `created_at` of new items and `modified_at`
+        with _frozen_utcnow() as now:
+            new = self._new_at is not None
+            self._stamp_new(now)
+            try:
+                return super().save(
+                    condition=condition,
+                    settings=settings,
+                    update_timestamp=update_timestamp,
+                )
+            except Exception:
+                # still new, stamped again by the next write
+                if new:
+                    self._new_at = now
+                raise
+
+    @classmethod
+    def buffered_writer(
+        cls: Type[_T],
+        max_items: int = BATCH_WRITE_LIMIT,
+        max_age: Optional[float] = 1.0,
+        workers: int = 4,
+        max_retries: Optional[int] = None,
+        update_timestamp: bool = True,
+        settings: OperationSettings = OperationSettings.default,
+    ) -> BufferedWriter[_T]:
+        """
+        Write-behind `BatchWriteItem` writer stamping items like `save` does
+
+        >>> with Model.buffered_writer() as writer:
+        >>>     for item in items:
+        >>>         writer.save(item)
+        """
+
+        def prepare(item):
+            with _frozen_utcnow() as now:
+                item._stamp_new(now)
+                if update_timestamp:
+                    item.modified_at = now
+            item._update_change_bucket()
+            item._update_live_attribute()
+            item._update_expires_at()
+
+        def written(key):
+            # written behind, entries read before the write landed are stale
+            _cache_discard(cls, key)
+
+        return BufferedWriter(
+            cls,
+            prepare=prepare,
+            written=written,
+            max_items=max_items,
+            max_age=max_age,
+            workers=workers,
+            max_retries=max_retries,
+            settings=settings,
+        )
+
+    @classmethod
+    def export_to(
+        cls,
+        directory: Union[str, Path],
+        workers: int = 4,
+        total_segments: Optional[int] = None,
+        part_items: int = 100_000,
+        ignore_deleted: bool = False,
+        page_size: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+        settings: OperationSettings = OperationSettings.default,
+    ) -> ExportCheckpoint:
+        """
+        Export the table to gzipped NDJSON part files in `directory`
+
+        Lines are `{"Item": ...}` in DynamoDB JSON, as in DynamoDB exports to S3.
+        Segments are scanned in parallel and written a page at a time, so memory
+        does not grow with the table. Running it again on the same `directory`
+        resumes an interrupted export from its `checkpoint.json`.
+        """
+        # build the connection once, before the worker threads race for it
+        cls._get_connection()
+
+        def scan(segment, total_segments, last_evaluated_key, rate_limit):
+            return cls.scan(
+                ignore_deleted=ignore_deleted,
+                segment=segment,
+                total_segments=total_segments,
+                last_evaluated_key=last_evaluated_key,
+                page_size=page_size,
+                rate_limit=rate_limit,
+                settings=settings,
+            )
+
+        return export_segments(
+            scan,
+            directory,
+            workers=workers,
+            total_segments=total_segments,
+            part_items=part_items,
+            rate_limit=rate_limit,
+        )
+
+    @classmethod
+    def import_from(
+        cls,
+        directory: Union[str, Path],
+        workers: int = 4,
+        max_retries: Optional[int] = None,
+        settings: OperationSettings = OperationSettings.default,
+    ) -> int:
+        """
+        Load the items of an `export_to` directory through `BatchWriteItem`
+
+        Items are written as exported, `created_at` and `modified_at` included.
+        Returns the number of items written.
+        """
+        writer = BufferedWriter(
+            cls,
+            written=partial(_cache_discard, cls),
+            max_items=BATCH_WRITE_LIMIT * workers,
+            max_age=None,
+            workers=workers,
+            max_retries=max_retries,
+            settings=settings,
+        )
+
+        with writer:
+            return import_parts(writer.save_serialized, directory)
+
+    @classmethod
+    def rows(
+        cls,
+        attributes: Sequence[str],
+        hash_key: Optional[_KeyType] = None,
+        range_key_condition: Optional[Condition] = None,
+        filter_condition: Optional[Condition] = None,
+        ignore_deleted: bool = True,
+        consistent_read: bool = False,
+        index_name: Optional[str] = None,
+        scan_index_forward: Optional[bool] = None,
+        limit: Optional[int] = None,
+        last_evaluated_key: Optional[Dict[str, Dict[str, Any]]] = None,
+        page_size: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+        settings: OperationSettings = OperationSettings.default,
+    ) -> ResultIterator[tuple]:
+        """
+        Named tuples of `attributes` read by `query`, or by `scan` without `hash_key`
+
+        Only `attributes` are read from the table, and rows hold their values as
+        items of the model would. Rows are far smaller and quicker to build than
+        model instances, for reading many items.
+
+        >>> for row in Thing.rows(["id", "modified_at"]):
+        >>>     report(row.id, row.modified_at)
+        """
+        read = row_reader(cls, attributes)
+        attributes_to_get = [cls.get_attributes()[name] for name in attributes]
+        if hash_key is None:
+            if range_key_condition is not None or scan_index_forward is not None:
+                raise ValueError("scanned rows take no range key condition or order")
+            results = cls.scan(
+                filter_condition=filter_condition,
+                ignore_deleted=ignore_deleted,
+                limit=limit,
+                last_evaluated_key=last_evaluated_key,
+                page_size=page_size,
+                consistent_read=consistent_read,
+                index_name=index_name,
+                rate_limit=rate_limit,
+                attributes_to_get=attributes_to_get,
+                settings=settings,
+            )
+        else:
+            results = cls.query(
+                hash_key,
+                range_key_condition=range_key_condition,
+                filter_condition=filter_condition,
+                ignore_deleted=ignore_deleted,
+                consistent_read=consistent_read,
+                index_name=index_name,
+                scan_index_forward=scan_index_forward,
+                limit=limit,
+                last_evaluated_key=last_evaluated_key,
+                attributes_to_get=attributes_to_get,
+                page_size=page_size,
+                rate_limit=rate_limit,
+                settings=settings,
+            )
+        return map_results(results, read)
+
+    @classmethod
+    def changes(
+        cls: Type[_T],
+        checkpoint: ChangeCheckpoint,
+        until: Optional[datetime] = None,
+        page_size: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+        settings: OperationSettings = OperationSettings.default,
+    ) -> Iterator[_T]:
+        """
+        Items modified from `checkpoint.since` to `until`, in `modified_at` order
+
+        Soft deleted items are included, check `is_deleted`. `checkpoint` is updated
+        in place once the caller is done with an item, save it to resume later.
+        `until` defaults to a second ago, as the index is updated asynchronously.
+
+        >>> checkpoint = ChangeCheckpoint(since=last_sync)
+        >>> for item in Model.changes(checkpoint):
+        >>>     sync(item)
+        """
+        if cls.change_index is None:
+            raise ValueError(f"{cls.__name__}.change_index is not set")
+        index_name = cls.change_index.Meta.index_name
+        if until is None:
+            until = utcnow() - timedelta(seconds=1)
+        step = timedelta(microseconds=1)
+
+        while checkpoint.since <= until:
+            bucket = bucket_start(checkpoint.since, cls.change_bucket)
+            upper = min(until, bucket + cls.change_bucket - step)
+            results = cls.query(
+                cls.modified_at.serialize(bucket),
+                range_key_condition=cls.modified_at.between(checkpoint.since, upper),
+                ignore_deleted=False,
+                index_name=index_name,
+                last_evaluated_key=checkpoint.last_evaluated_key,
+                page_size=page_size,
+                rate_limit=rate_limit,
+                settings=settings,
+            )
+            for item in results:
+                yield item
+                last_evaluated_key = results.last_evaluated_key
+                if last_evaluated_key is None:
+                    break
+                checkpoint.update(item.modified_at, last_evaluated_key)
+            checkpoint.advance(upper)
 
 
 if __name__ == "__main__":
@@ -1,28 +1,46 @@
 import logging
+import os
 import time
 import unittest
 from typing import Optional, Union, Iterable
 from uuid import uuid4
 
-import docker
-import requests
-from docker.errors import NotFound
 from pynamodb.models import Model
 
+from pynamodb_templates.memory import MemoryDynamoDB
+
 """
 Wrapper script to run container using
 
 docker run -p 8000:8000 amazon/dynamodb-local -jar DynamoDBLocal.jar -inMemory -sharedDb
+
+DynamodbLocalTest runs on the in-memory backend, set DYNAMODB_LOCAL=docker
+to run it on the container instead.
 """
 
 __all__ = ["run_local_dynamodb", "stop_local_dynamodb", "DynamodbLocalTest"]
 
 IMAGE = "amazon/dynamodb-local"
 
-client = docker.DockerClient()
+USE_DOCKER = os.environ.get("DYNAMODB_LOCAL", "memory") == "docker"
+
+_client = None
+
+
+def _docker_client():
+    global _client
+    if _client is None:
+        import docker
+
+        _client = docker.DockerClient()
+    return _client
 
 
 def run_local_dynamodb(name=None, port=None):
+    import requests
+    from docker.errors import NotFound
+
+    client = _docker_client()
     if name is None:
         name = str(uuid4())
 
@@ -60,7 +78,7 @@ def run_local_dynamodb(name=None, port=None):
 
 def stop_local_dynamodb(name: Optional[str]):
     try:
-        container = client.containers.get(container_id=name)
+        container = _docker_client().containers.get(container_id=name)
         container.stop()
     except Exception as e:
         logging.error(e, exc_info=True)
@@ -73,18 +91,29 @@ class DynamodbLocalTest(unittest.TestCase):
 
     host: Optional[str] = None
 
-    def setUp(self) -> None:
-        self.host = run_local_dynamodb(name=self.container_name)
+    dynamodb: Optional[MemoryDynamoDB] = None
 
-        if isinstance(self.PYNAMODB_MODEL, Model):
+    def _models(self):
+        if isinstance(self.PYNAMODB_MODEL, Iterable):
+            return list(self.PYNAMODB_MODEL)
+        return [self.PYNAMODB_MODEL] if self.PYNAMODB_MODEL else []
+
+    def setUp(self) -> None:
+        models = self._models()
+        if USE_DOCKER:
+            self.host = run_local_dynamodb(name=self.container_name)
+        else:
+            self.dynamodb = MemoryDynamoDB()
+            self.dynamodb.bind(*models)
+
+        for m in models:  # type: Model
             if self.host:
-                self.PYNAMODB_MODEL.Meta.host = self.host
-            self.PYNAMODB_MODEL.create_table()
-        elif isinstance(self.PYNAMODB_MODEL, Iterable):
-            for m in self.PYNAMODB_MODEL:  # type: Model
-                if self.host:
-                    m.Meta.host = self.host
-                m.create_table()
+                m.Meta.host = self.host
+            m.create_table()
 
     def doCleanups(self) -> None:
-        stop_local_dynamodb(name=self.container_name)
+        if USE_DOCKER:
+            stop_local_dynamodb(name=self.container_name)
+        else:
+            self.dynamodb.unbind(*self._models())
+        return super().doCleanups()
@@ -0,0 +1,111 @@
+import asyncio
+import threading
+
+import pytest
+from pynamodb.attributes import UnicodeAttribute, NumberAttribute
+
+from pynamodb_templates.memory import MemoryDynamoDB
+from pynamodb_templates.models import TimeTrackedModel, gather_limited
+
+
+class AsyncModel(TimeTrackedModel):
+    class Meta:
+        table_name = "async"
+
+    group = UnicodeAttribute(hash_key=True)
+    id = UnicodeAttribute(range_key=True)
+    value = NumberAttribute(null=True)
+
+
+@pytest.fixture
+def dynamodb():
+    dynamodb = MemoryDynamoDB()
+    with dynamodb.connect(AsyncModel):
+        AsyncModel.create_table(billing_mode="PAY_PER_REQUEST")
+        yield dynamodb
+
+
+@pytest.fixture
+def threads(dynamodb):
+    threads = set()
+
+    def recorded(operation):
+        def record(kwargs):
+            threads.add(threading.get_ident())
+            return operation(kwargs)
+
+        return record
+
+    for name, operation in list(dynamodb._operations.items()):
+        dynamodb._operations[name] = recorded(operation)
+    return threads
+
+
+class TestAsyncModel:
+    def test_save_get_update_delete(self, threads):
+        async def run():
+            item = AsyncModel("g", "a", value=1)
+            await item.async_save()
+            got = await AsyncModel.async_get("g", "a")
+            assert got.value == 1 and got.modified_at is not None
+            modified_at = got.modified_at
+            await got.async_update(actions=[AsyncModel.value.set(2)])
+            assert got.value == 2 and got.modified_at > modified_at
+            await got.async_delete()
+            assert (await AsyncModel.async_get("g", "a")).is_deleted
+
+        asyncio.run(run())
+        assert threads and threading.get_ident() not in threads
+
+    def test_query_pages(self, dynamodb):
+        for i in range(5):
+            AsyncModel("g", str(i)).save()
+        AsyncModel("g", "9").save()
+        AsyncModel.get("g", "9").delete()
+
+        async def run():
+            results = AsyncModel.async_query("g", page_size=2)
+            assert (await results.__anext__()).id == "0"
+            assert dynamodb.requests["Query"] == 1
+            ids = ["0"] + [item.id async for item in results]
+            assert ids == ["0", "1", "2", "3", "4"]
+            assert results.results.total_count == 5
+            assert dynamodb.requests["Query"] > 1
+            everything = await AsyncModel.async_scan(
+                ignore_deleted=False, page_size=2
+            ).all()
+            assert len(everything) == 6
+
+        asyncio.run(run())
+
+
+class TestGatherLimited:
+    def test_limit(self):
+        running = 0
+        peak = 0
+
+        async def task(i):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return i
+
+        results = asyncio.run(gather_limited(*(task(i) for i in range(20)), limit=3))
+        assert results == list(range(20))
+        assert peak == 3
+
+    def test_exceptions(self):
+        async def fail():
+            raise ValueError
+
+        async def run():
+            results = await gather_limited(
+                fail(), asyncio.sleep(0, 1), return_exceptions=True
+            )
+            assert isinstance(results[0], ValueError) and results[1] == 1
+            with pytest.raises(ValueError):
+                await gather_limited(fail(), limit=1)
+
+        asyncio.run(run())
@@ -1,9 +1,17 @@
-from base64 import b64encode
-from enum import Enum
+import subprocess
+import sys
+from base64 import b64decode, b64encode
+from copy import deepcopy
+from datetime import datetime, timedelta, timezone
+from enum import Enum, IntFlag
+from typing import NamedTuple
 
 import pytest
 from pynamodb.attributes import DEFAULT_ENCODING
+from pynamodb.attributes import ListAttribute, UnicodeAttribute
 from pynamodb.constants import STRING, NUMBER, BINARY
+from pynamodb.indexes import GlobalSecondaryIndex, KeysOnlyProjection
+from pynamodb.models import Model
 from ulid import ULID
 
 from pynamodb_templates.attributes import (
@@ -11,10 +19,25 @@ from pynamodb_templates.attributes import (
     EnumNameAttribute,
     InteagerEnumAttribute,
     UnicodeEnumAttribute,
+    EnumFlagsAttribute,
     UnicodeULIDAttribute,
     NumberULIDAttribute,
     BinaryULIDAttribute,
+    UnicodeDatetimeAttribute,
+    UnicodeUTCDatetimeAttribute,
+    UnicodeDelimitedTupleAttribute,
+    CompressedJSONAttribute,
+    ClaimCheckAttribute,
+    BlobStore,
+    LocalBlobStore,
+    S3BlobStore,
+    DatetimeCodec,
+    FieldCodec,
+    IntCodec,
+    ULIDCodec,
 )
+from pynamodb_templates.memory import MemoryDynamoDB
+from pynamodb_templates.models import TimeTrackedModel
 
 
 # from ulid import ULID
@@ -76,6 +99,66 @@ class TestIndexableBooleanAttribute:
         assert attr.deserialize("1") is True
         assert attr.deserialize("0") is False
 
+    def test_sparse(self):
+        attr = IndexableBooleanAttribute(sparse=True)
+        assert attr.null and attr.default is False
+        assert attr.serialize(True) == "1"
+        assert attr.serialize(False) is None
+        assert attr.deserialize("0") is False
+
+    def test_sparse_index(self):
+        with MemoryDynamoDB().connect(SparseModel):
+            SparseModel.create_table(billing_mode="PAY_PER_REQUEST")
+            for i in range(4):
+                SparseModel(str(i), flag=i % 2 == 1, updated=i == 2).save()
+            # written before the attribute was sparse
+            legacy = {"flag": {NUMBER: "0"}, "updated": {NUMBER: "0"}}
+            SparseModel._get_connection().put_item("4", attributes=legacy)
+            assert SparseModel.get("0").flag is False
+            assert SparseModel.get("4").flag is False
+            assert "flag" not in SparseModel.get("0").serialize()
+
+            flagged = SparseModel.flag.flagged(SparseModel.by_flag)
+            assert sorted(item.id for item in flagged) == ["1", "3"]
+            assert SparseModel.by_flag.count(1) == 2
+
+            item = SparseModel.get("1")
+            item.update(actions=[SparseModel.flag.set(False)])
+            assert item.flag is False
+            item.update(actions=[SparseModel.flag.set(True)])
+            assert SparseModel.by_flag.count(1) == 2
+
+            flagged = SparseModel.updated.flagged(SparseModel.by_updated)
+            assert [item.id for item in flagged] == ["2"]
+
+
+class ByFlag(GlobalSecondaryIndex):
+    class Meta:
+        index_name = "by_flag"
+        projection = KeysOnlyProjection()
+
+    flag = IndexableBooleanAttribute(hash_key=True)
+
+
+class ByUpdated(GlobalSecondaryIndex):
+    class Meta:
+        index_name = "by_updated"
+        projection = KeysOnlyProjection()
+
+    id = UnicodeAttribute(hash_key=True)
+    updated = IndexableBooleanAttribute(range_key=True)
+
+
+class SparseModel(Model):
+    class Meta:
+        table_name = "sparse"
+
+    id = UnicodeAttribute(hash_key=True)
+    flag = IndexableBooleanAttribute(sparse=True)
+    updated = IndexableBooleanAttribute(sparse=True)
+    by_flag = ByFlag()
+    by_updated = ByUpdated()
+
 
 class TestEnumNameAttribute:
     """
@@ -102,6 +185,33 @@ class TestEnumNameAttribute:
         assert attr.deserialize("one") == MutualEnum.one
         assert attr.deserialize("phi") == MutualEnum.phi
 
+    def test_enum_name_unknown(self):
+        attr = EnumNameAttribute(enum_type=MutualEnum)
+        with pytest.raises(ValueError):
+            attr.deserialize("three")
+        with pytest.raises(ValueError):
+            attr.serialize(StrEnum.a)
+
+    def test_enum_name_fallback(self):
+        attr = EnumNameAttribute(enum_type=MutualEnum, fallback=MutualEnum.one)
+        assert attr.deserialize("three") == MutualEnum.one
+        assert attr.deserialize("two") == MutualEnum.two
+        with pytest.raises(TypeError):
+            EnumNameAttribute(enum_type=MutualEnum, fallback=StrEnum.a)
+
+    def test_enum_name_members(self):
+        attr = EnumNameAttribute(enum_type=MutualEnum)
+        assert attr.one == MutualEnum.one
+        assert attr.enum_names == ["one", "two", "phi"]
+        assert attr.enum_values == [1, "2", 3.14159]
+        with pytest.raises(AttributeError):
+            attr.three
+
+    def test_enum_name_deepcopy(self):
+        attr = EnumNameAttribute(enum_type=MutualEnum)
+        clone = deepcopy(attr)
+        assert clone.deserialize("two") == MutualEnum.two
+
 
 class TestInteagerEnumAttribute:
     """
@@ -125,6 +235,17 @@ class TestInteagerEnumAttribute:
         assert attr.deserialize("1") == IntEnum.one
         assert attr.deserialize("0") == IntEnum.zero
 
+    def test_inteager_enum_non_canonical(self):
+        attr = InteagerEnumAttribute(enum_type=IntEnum)
+        assert attr.deserialize("2.0") == IntEnum.two
+
+    def test_inteager_enum_unknown(self):
+        attr = InteagerEnumAttribute(enum_type=IntEnum)
+        with pytest.raises(ValueError):
+            attr.deserialize("3")
+        attr = InteagerEnumAttribute(enum_type=IntEnum, fallback=IntEnum.zero)
+        assert attr.deserialize("3") == IntEnum.zero
+
     def test_inteager_enum_type_error(self):
         with pytest.raises(TypeError):
             attr = InteagerEnumAttribute(enum_type=FloatEnum)
@@ -161,6 +282,67 @@ class TestUnicodeEnumAttribute:
             attr = InteagerEnumAttribute(enum_type=StrIntEnum)
 
 
+class Permission(IntFlag):
+    read = 1
+    write = 2
+    admin = 8
+
+
+class FlagsModel(Model):
+    class Meta:
+        table_name = "flags"
+
+    hash = UnicodeAttribute(hash_key=True)
+    colors = EnumFlagsAttribute(StrEnum, null=True)
+    permissions = EnumFlagsAttribute(Permission, null=True)
+
+
+class TestEnumFlagsAttribute:
+    def test_set(self):
+        attr = EnumFlagsAttribute(StrEnum)
+        assert attr.serialize(set()) == "0"
+        assert attr.serialize({StrEnum.b}) == "2"
+        assert attr.serialize([StrEnum.a, StrEnum.b]) == "3"
+        assert attr.deserialize("2") == frozenset({StrEnum.b})
+        with pytest.raises(ValueError):
+            attr.serialize({StrIntEnum.zero})
+        with pytest.raises(ValueError):
+            attr.deserialize("4")
+
+    def test_int_flag(self):
+        attr = EnumFlagsAttribute(Permission)
+        assert attr.serialize(Permission.read | Permission.admin) == "9"
+        assert attr.serialize([Permission.write]) == "2"
+        assert attr.deserialize("10") == Permission.write | Permission.admin
+        with pytest.raises(ValueError):
+            attr.serialize(4)
+
+    def test_capacity(self):
+        EnumFlagsAttribute(Enum("Wide", [f"m{i}" for i in range(126)]))
+        with pytest.raises(ValueError):
+            EnumFlagsAttribute(Enum("Wider", [f"m{i}" for i in range(127)]))
+        with pytest.raises(ValueError):
+            EnumFlagsAttribute(Enum("Wide", [f"m{i}" for i in range(16)])).has_all([])
+
+    def test_conditions(self):
+        with MemoryDynamoDB().connect(FlagsModel):
+            FlagsModel.create_table(billing_mode="PAY_PER_REQUEST")
+            FlagsModel("a", colors={StrEnum.a}, permissions=Permission.read).save()
+            FlagsModel("b", colors={StrEnum.b}, permissions=Permission.write).save()
+            FlagsModel("ab", colors=set(StrEnum), permissions=Permission(11)).save()
+
+            def scan(condition):
+                return sorted(item.hash for item in FlagsModel.scan(condition))
+
+            assert scan(FlagsModel.colors.has_all({StrEnum.a})) == ["a", "ab"]
+            assert scan(FlagsModel.colors.has_all(set(StrEnum))) == ["ab"]
+            assert scan(FlagsModel.colors.has_any(set(StrEnum))) == ["a", "ab", "b"]
+            permissions = FlagsModel.permissions
+            condition = permissions.has_any(Permission.write | Permission.admin)
+            assert scan(condition) == ["ab", "b"]
+            assert scan(FlagsModel.permissions.has_all(Permission.admin)) == ["ab"]
+
+
 class TestUnicodeULIDAttribute:
     ULID_ZERO = ULID.from_str("0000000000FYFV2P0FWPC65H57")
 
@@ -271,3 +453,449 @@ class TestBinaryULIDAttribute:
         attr = BinaryULIDAttribute()
         assert attr.deserialize(attr.serialize(_rand_uild)) == _rand_uild
         assert attr.deserialize(attr.serialize(self.ULID_ZERO)) == self.ULID_ZERO
+
+
+class TestULIDBatch:
+    ULIDS = [ULID() for _ in range(8)] + [
+        ULID.from_str("0000000000FYFV2P0FWPC65H57"),
+        ULID.from_int(0),
+        ULID.from_int((1 << 128) - 1),
+    ]
+
+    @pytest.mark.parametrize(
+        "attr", [UnicodeULIDAttribute(), NumberULIDAttribute(), BinaryULIDAttribute()]
+    )
+    def test_matches_single(self, attr):
+        serialized = attr.serialize_many(self.ULIDS)
+        assert serialized == [attr.serialize(u) for u in self.ULIDS]
+        assert attr.deserialize_many(serialized) == self.ULIDS
+
+    def test_raw(self):
+        attr = NumberULIDAttribute()
+        ints = [int(u) for u in self.ULIDS]
+        serialized = attr.serialize_many(ints, raw=True)
+        assert serialized == attr.serialize_many(self.ULIDS)
+        assert attr.deserialize_many(serialized, raw=True) == ints
+
+        for attr in (UnicodeULIDAttribute(), BinaryULIDAttribute()):
+            raw = [u.bytes for u in self.ULIDS]
+            serialized = attr.serialize_many(raw, raw=True)
+            assert serialized == attr.serialize_many(self.ULIDS)
+            assert attr.deserialize_many(serialized, raw=True) == raw
+
+    def test_lowercase(self):
+        attr = UnicodeULIDAttribute()
+        assert attr.deserialize_many([str(u).lower() for u in self.ULIDS]) == self.ULIDS
+
+    @pytest.mark.parametrize(
+        "attr, value",
+        [
+            (UnicodeULIDAttribute(), "0000000000FYFV2P0FWPC65H5U"),
+            (UnicodeULIDAttribute(), "8ZZZZZZZZZZZZZZZZZZZZZZZZZ"),
+            (UnicodeULIDAttribute(), "0000000000_YFV2P0FWPC65H57"),
+            (UnicodeULIDAttribute(), "0000000000FYFV2P0FWPC65H5"),
+            (NumberULIDAttribute(), str(1 << 128)),
+            (NumberULIDAttribute(), "-1"),
+            (BinaryULIDAttribute(), b64encode(b"\x00" * 15).decode()),
+        ],
+    )
+    def test_invalid(self, attr, value):
+        with pytest.raises(ValueError):
+            attr.deserialize_many([value])
+
+
+class TestULIDTimeRange:
+    START = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    END = datetime(2023, 1, 2, tzinfo=timezone.utc)
+
+    def test_bounds(self):
+        attr = UnicodeULIDAttribute()
+        lower, upper = attr.min_ulid(self.START), attr.max_ulid(self.START)
+        assert lower.datetime == upper.datetime == self.START
+        assert lower < ULID.from_datetime(self.START) <= upper
+        assert attr.min_ulid(self.START.replace(tzinfo=None)) == lower
+        with pytest.raises(ValueError):
+            attr.min_ulid(datetime(1969, 12, 31, tzinfo=timezone.utc))
+
+    @pytest.mark.parametrize(
+        "attr", [UnicodeULIDAttribute(), NumberULIDAttribute(), BinaryULIDAttribute()]
+    )
+    def test_time_bounds(self, attr):
+        lower, upper = attr.time_bounds(self.START, self.END)
+        assert lower == attr.serialize(attr.min_ulid(self.START))
+        assert upper == attr.serialize(attr.max_ulid(self.END))
+        inside = ULID.from_datetime(self.START + timedelta(hours=1))
+        if isinstance(attr, NumberULIDAttribute):
+            assert int(lower) < int(attr.serialize(inside)) < int(upper)
+        elif isinstance(attr, UnicodeULIDAttribute):
+            assert lower < attr.serialize(inside) < upper
+
+    def test_conditions(self):
+        attr = NumberULIDAttribute(range_key=True, attr_name="sk")
+        names, values = {}, {}
+        expression = attr.created_between(self.START, self.END).serialize(names, values)
+        assert expression == "#0 BETWEEN :0 AND :1"
+        assert values[":0"] == {NUMBER: str(int(attr.min_ulid(self.START)))}
+        assert values[":1"] == {NUMBER: str(int(attr.max_ulid(self.END)))}
+
+        names, values = {}, {}
+        assert attr.created_since(self.START).serialize(names, values) == "#0 >= :0"
+        names, values = {}, {}
+        assert attr.created_before(self.END).serialize(names, values) == "#0 < :0"
+        assert values[":0"] == {NUMBER: str(int(attr.min_ulid(self.END)))}
+
+
+class TestUnicodeUTCDatetimeAttribute:
+    KST = timezone(timedelta(hours=9))
+    VALUES = [
+        datetime(2023, 1, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+        datetime(2023, 1, 1, 12, 30, 15, tzinfo=timezone.utc),
+        datetime(2023, 1, 1, 21, 30, 15, 5, tzinfo=KST),
+        datetime(2023, 1, 1, 12, 30, 15, 5, tzinfo=timezone(timedelta(0))),
+        datetime(2023, 1, 1, 12, 30, 15, 5),
+    ]
+
+    @pytest.mark.parametrize("value", VALUES)
+    def test_wire_compatible(self, value):
+        attr = UnicodeUTCDatetimeAttribute()
+        legacy = UnicodeDatetimeAttribute(force_utc=True)
+        assert attr.serialize(value) == legacy.serialize(value)
+        serialized = legacy.serialize(value)
+        assert attr.deserialize(serialized) == legacy.deserialize(serialized)
+        assert attr.deserialize(serialized).tzinfo is timezone.utc
+
+    def test_other_offsets(self):
+        attr = UnicodeUTCDatetimeAttribute()
+        value = datetime(2023, 1, 1, 21, 30, 15, tzinfo=self.KST)
+        assert attr.deserialize(value.isoformat()) == value
+
+    def test_many(self):
+        attr = UnicodeUTCDatetimeAttribute()
+        serialized = attr.serialize_many(self.VALUES)
+        assert serialized == [attr.serialize(v) for v in self.VALUES]
+        assert attr.deserialize_many(serialized) == [
+            attr.deserialize(v) for v in serialized
+        ]
+
+
+class EventKey(NamedTuple):
+    tenant: str
+    created: datetime
+    sequence: int = 0
+
+
+class EventModel(Model):
+    class Meta:
+        table_name = "events"
+
+    hash = UnicodeAttribute(hash_key=True)
+    key = UnicodeDelimitedTupleAttribute(
+        tuple_type=EventKey,
+        codecs={"created": DatetimeCodec(), "sequence": IntCodec(4)},
+        range_key=True,
+    )
+
+
+class TestUnicodeDelimitedTupleAttribute:
+    def test_codecs(self):
+        attr = EventModel.key
+        key = EventKey("a", datetime(2020, 1, 2, 3, 4, 5), 7)
+        serialized = attr.serialize(key)
+        assert serialized == "a::2020-01-02T03:04:05.000000+00:00::0007"
+        assert attr.deserialize(serialized) == key._replace(
+            created=key.created.replace(tzinfo=timezone.utc)
+        )
+        with pytest.raises(ValueError):
+            attr.serialize(key._replace(sequence=10000))
+        with pytest.raises(ValueError):
+            UnicodeDelimitedTupleAttribute(tuple_type=EventKey, codecs={"x": None})
+
+    def test_order(self):
+        start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        keys = [
+            EventKey("a", start + timedelta(seconds=s, microseconds=m), n)
+            for s in (0, 1, 10)
+            for m in (0, 1)
+            for n in (2, 10)
+        ]
+        serialized = [EventModel.key.serialize(key) for key in keys]
+        assert sorted(serialized) == serialized
+
+    def test_without_codecs(self):
+        class Pair(NamedTuple):
+            name: str
+            count: int
+
+        attr = UnicodeDelimitedTupleAttribute(tuple_type=Pair)
+        assert attr.serialize(Pair("a", 10)) == "a::10"
+        assert attr.deserialize("a::10") == Pair("a", 10)
+        assert attr.serialize_prefix(("a",)) == "a::"
+        assert attr.serialize_prefix(("a", 10)) == "a::10"
+
+    def test_ulid(self):
+        codec = ULIDCodec()
+        ulid = ULID()
+        assert codec.decode(codec.encode(ulid)) == ulid
+
+    def test_incomplete_codec(self):
+        class EncodeOnly(FieldCodec[str]):
+            def encode(self, value):
+                return value
+
+        with pytest.raises(TypeError):
+            EncodeOnly()
+
+    def test_prefix(self):
+        attr = EventModel.key
+        assert attr.serialize_prefix(("a", None)) == "a::"
+        with pytest.raises(ValueError):
+            attr.serialize_prefix(("a", None, 1))
+        with pytest.raises(ValueError):
+            attr.serialize_prefix(())
+
+    def test_query(self):
+        start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        with MemoryDynamoDB().connect(EventModel):
+            EventModel.create_table(billing_mode="PAY_PER_REQUEST")
+            for tenant in ("a", "ab", "b"):
+                for day in range(3):
+                    for sequence in range(2):
+                        created = start + timedelta(days=day)
+                        EventModel("h", EventKey(tenant, created, sequence)).save()
+
+            def query(condition):
+                return [item.key for item in EventModel.query("h", condition)]
+
+            keys = query(EventModel.key.begins_with(("a",)))
+            assert len(keys) == 6 and {k.tenant for k in keys} == {"a"}
+            keys = query(EventModel.key.begins_with(("a", start)))
+            assert [k.sequence for k in keys] == [0, 1]
+            keys = query(EventModel.key.begins_with(("a", start, 1)))
+            assert keys == [EventKey("a", start, 1)]
+
+            day = timedelta(days=1)
+            condition = EventModel.key.prefix_between(("a", start + day), ("ab", start))
+            keys = query(condition)
+            assert [(k.tenant, k.created - start) for k in keys] == [
+                ("a", day),
+                ("a", day),
+                ("a", 2 * day),
+                ("a", 2 * day),
+                ("ab", 0 * day),
+                ("ab", 0 * day),
+            ]
+            keys = query(EventModel.key.prefix_after(("b", start + 2 * day)))
+            assert len(keys) == 2
+            keys = query(EventModel.key.prefix_before(("a", start + day)))
+            assert len(keys) == 2
+
+
+class CompressedModel(Model):
+    class Meta:
+        table_name = "compressed"
+
+    id = UnicodeAttribute(hash_key=True)
+    payload = CompressedJSONAttribute(threshold=64, null=True)
+
+
+class TestCompressedJSONAttribute:
+    value = {"records": [{"id": i, "tags": ["a", "b"]} for i in range(50)]}
+
+    def test_threshold(self):
+        attr = CompressedJSONAttribute(threshold=64)
+        small = b64decode(attr.serialize({"a": 1}))
+        assert small == b'\x00{"a":1}'
+        large = b64decode(attr.serialize(self.value))
+        assert large[0] == 1 and len(large) < len(str(self.value)) / 4
+
+    def test_codecs(self):
+        for codec in ("zlib", "lzma"):
+            attr = CompressedJSONAttribute(codec=codec, threshold=0)
+            assert attr._load(attr.serialize(self.value)) == self.value
+        # values written with another codec still read
+        lzma = CompressedJSONAttribute(codec="lzma", threshold=0).serialize([1] * 100)
+        assert CompressedJSONAttribute()._load(lzma) == [1] * 100
+        with pytest.raises(ValueError):
+            CompressedJSONAttribute(codec="snappy")
+        with pytest.raises(ValueError):
+            CompressedJSONAttribute()._load(b64encode(b"\x09{}"))
+
+    def test_incompressible(self):
+        attr = CompressedJSONAttribute(threshold=0)
+        assert b64decode(attr.serialize("x"))[0] == 0
+
+    def test_lazy(self):
+        with MemoryDynamoDB().connect(CompressedModel):
+            CompressedModel.create_table(billing_mode="PAY_PER_REQUEST")
+            CompressedModel("a", payload=self.value).save()
+            item = CompressedModel.get("a")
+            assert type(item.attribute_values["payload"]).__name__ == "_Packed"
+            assert item.payload == self.value
+            assert item.attribute_values["payload"] == self.value
+            item.save()
+            assert CompressedModel.get("a").payload == self.value
+
+
+class DictBlobStore(BlobStore):
+    def __init__(self):
+        self.blobs = {}
+        self.gets = 0
+        self.puts = 0
+
+    def get(self, key):
+        self.gets += 1
+        return self.blobs[key]
+
+    def put(self, key, data):
+        self.puts += 1
+        self.blobs[key] = data
+
+    def exists(self, key):
+        return key in self.blobs
+
+
+class ClaimCheckModel(TimeTrackedModel):
+    class Meta:
+        table_name = "claim_check"
+
+    id = UnicodeAttribute(hash_key=True)
+    name = UnicodeAttribute(null=True)
+    document = ClaimCheckAttribute(
+        CompressedJSONAttribute(threshold=0), DictBlobStore(), threshold=256, null=True
+    )
+
+
+class TestClaimCheckAttribute:
+    value = {"records": [{"id": i, "name": f"record {i}"} for i in range(500)]}
+
+    @pytest.fixture
+    def store(self):
+        store = ClaimCheckModel.document.store = DictBlobStore()
+        ClaimCheckModel.document._cache.clear()
+        ClaimCheckModel.document._cached = 0
+        with MemoryDynamoDB().connect(ClaimCheckModel):
+            ClaimCheckModel.create_table(billing_mode="PAY_PER_REQUEST")
+            yield store
+
+    def test_threshold(self):
+        attr = ClaimCheckAttribute(UnicodeAttribute(), DictBlobStore(), threshold=8)
+        assert b64decode(attr.serialize("small")) == b"\x00small"
+        pointer = b64decode(attr.serialize("x" * 8))
+        assert pointer[0] == 1 and len(pointer) == 33
+        assert attr.store.blobs == {pointer[1:].hex(): b"x" * 8}
+        assert attr._load(attr.serialize("x" * 8)) == "x" * 8
+        with pytest.raises(ValueError):
+            ClaimCheckAttribute(ListAttribute(), attr.store)
+
+    def test_lazy(self, store):
+        ClaimCheckModel("a", name="a", document=self.value).save()
+        assert store.puts == 1
+        ClaimCheckModel.document._cache.clear()
+        item = ClaimCheckModel.get("a")
+        # small fields are read without fetching the blob
+        assert item.name == "a" and store.gets == 0
+        assert item.document == self.value
+        assert store.gets == 1
+        assert ClaimCheckModel.get("a").document == self.value
+        assert store.gets == 1
+
+    def test_dedupe(self, store):
+        ClaimCheckModel("a", document=self.value).save()
+        ClaimCheckModel("b", document=self.value).save()
+        assert store.puts == 1 and len(store.blobs) == 1
+        item = ClaimCheckModel.get("a")
+        item.name = "renamed"
+        item.save()
+        assert store.puts == 1 and store.gets == 0
+        item = ClaimCheckModel.get("a")
+        assert item.name == "renamed" and item.document == self.value
+        # known to the store, not only the cache
+        ClaimCheckModel.document._cache.clear()
+        ClaimCheckModel("c", document=self.value).save()
+        assert store.puts == 1
+
+    def test_cache_bound(self):
+        attr = ClaimCheckAttribute(
+            UnicodeAttribute(), DictBlobStore(), threshold=0, cache_size=20
+        )
+        for value in ("a" * 8, "b" * 8, "c" * 8, "d" * 30):
+            attr.serialize(value)
+        assert list(attr._cache.values()) == [b"b" * 8, b"c" * 8]
+
+    def test_incomplete_store(self):
+        class ReadOnlyStore(BlobStore):
+            def get(self, key):
+                raise KeyError(key)
+
+        with pytest.raises(TypeError):
+            ReadOnlyStore()
+
+    def test_local_store(self, tmp_path):
+        store = LocalBlobStore(tmp_path)
+        key = "ab" + "0" * 62
+        assert not store.exists(key)
+        with pytest.raises(KeyError):
+            store.get(key)
+        store.put(key, b"data")
+        assert store.exists(key) and store.get(key) == b"data"
+        assert (tmp_path / "ab" / key).is_file()
+
+    def test_s3_store(self):
+        from botocore.exceptions import ClientError
+
+        class Body:
+            def __init__(self, data):
+                self.data = data
+
+            def read(self):
+                return self.data
+
+        class Client:
+            objects = {}
+
+            def missing(self, key):
+                if key not in self.objects:
+                    error = {"Error": {"Code": "404"}}
+                    raise ClientError(error, "HeadObject")
+
+            def get_object(self, Bucket, Key):
+                self.missing((Bucket, Key))
+                return {"Body": Body(self.objects[Bucket, Key])}
+
+            def head_object(self, Bucket, Key):
+                self.missing((Bucket, Key))
+
+            def put_object(self, Bucket, Key, Body):
+                self.objects[Bucket, Key] = Body
+
+        store = S3BlobStore("bucket", prefix="blobs/", client=Client())
+        assert not store.exists("key")
+        with pytest.raises(KeyError):
+            store.get("key")
+        store.put("key", b"data")
+        assert Client.objects == {("bucket", "blobs/key"): b"data"}
+        assert store.exists("key") and store.get("key") == b"data"
+
+
+class TestLazyImport:
+    def test_deferred(self):
+        code = (
+            "import sys, pynamodb_templates.attributes as a;"
+            "lyft = 'pynamodb_attributes';"
+            "assert 'ulid' not in sys.modules and lyft not in sys.modules;"
+            "a.UnicodeUTCDatetimeAttribute;"
+            "assert 'ulid' not in sys.modules;"
+            "a.UnicodeULIDAttribute;"
+            "assert 'ulid' in sys.modules and lyft not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_public_names(self):
+        import pynamodb_templates.attributes as attributes
+
+        namespace = {}
+        exec("from pynamodb_templates.attributes import *", namespace)
+        assert set(attributes.__all__) <= set(namespace)
+        assert set(attributes.__all__) <= set(dir(attributes))
+        with pytest.raises(AttributeError):
+            attributes.MissingAttribute
@@ -0,0 +1,65 @@
+from unittest.mock import patch
+
+import pytest
+from botocore.exceptions import ClientError
+from pynamodb.exceptions import UpdateError
+
+from pynamodb_templates.models import BulkReport
+from pynamodb_templates.models._bulk import call_with_retry, run_bulk, is_throttled
+
+
+def _error(code):
+    return UpdateError(code, cause=ClientError({"Error": {"Code": code}}, "UpdateItem"))
+
+
+class TestCallWithRetry:
+    def test_retries_throttled(self):
+        calls = []
+
+        def fn():
+            calls.append(1)
+            if len(calls) < 3:
+                raise _error("ProvisionedThroughputExceededException")
+            return "done"
+
+        with patch("pynamodb_templates.models._bulk.time.sleep") as sleep:
+            assert call_with_retry(fn, max_retries=5, base_delay=0.01) == "done"
+        assert len(calls) == 3
+        assert sleep.call_count == 2
+
+    def test_gives_up(self):
+        def fn():
+            raise _error("ThrottlingException")
+
+        with patch("pynamodb_templates.models._bulk.time.sleep"):
+            with pytest.raises(UpdateError):
+                call_with_retry(fn, max_retries=2, base_delay=0.01)
+
+    def test_does_not_retry_other_errors(self):
+        calls = []
+
+        def fn():
+            calls.append(1)
+            raise _error("ConditionalCheckFailedException")
+
+        with pytest.raises(UpdateError):
+            call_with_retry(fn, max_retries=5, base_delay=0.01)
+        assert len(calls) == 1
+
+    def test_is_throttled(self):
+        assert is_throttled(_error("RequestLimitExceeded"))
+        assert not is_throttled(_error("ValidationException"))
+        assert not is_throttled(ValueError())
+
+
+class TestRunBulk:
+    def test_report(self):
+        def operation(chunk):
+            assert len(chunk) <= 3
+            return [(key, ValueError(key) if key % 4 == 0 else None) for key in chunk]
+
+        report = run_bulk(operation, list(range(10)), workers=3, chunk_size=3)
+        assert isinstance(report, BulkReport)
+        assert not report.ok
+        assert sorted(report.succeeded) == [1, 2, 3, 5, 6, 7, 9]
+        assert sorted(key for key, _ in report.failed) == [0, 4, 8]
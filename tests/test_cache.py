@@ -0,0 +1,181 @@
+import pytest
+from pynamodb.attributes import UnicodeAttribute, NumberAttribute
+
+from pynamodb_templates.memory import MemoryDynamoDB
+from pynamodb_templates.models import ModelCache, TimeTrackedModel, item_size
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CachedModel(TimeTrackedModel):
+    class Meta:
+        table_name = "cache"
+
+    id = UnicodeAttribute(hash_key=True)
+    value = NumberAttribute(null=True)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def dynamodb(clock):
+    dynamodb = MemoryDynamoDB()
+    with dynamodb.connect(CachedModel):
+        CachedModel.create_table(billing_mode="PAY_PER_REQUEST")
+        CachedModel.cache = ModelCache(max_items=10, ttl=10, clock=clock)
+        try:
+            yield dynamodb
+        finally:
+            CachedModel.cache = None
+
+
+@pytest.fixture
+def reads(dynamodb):
+    """
+    Attributes projected by each `GetItem`, `None` for whole items
+    """
+    reads = []
+    get_item = dynamodb._operations["GetItem"]
+
+    def recorded(kwargs):
+        if "ProjectionExpression" in kwargs:
+            reads.append(sorted(kwargs["ExpressionAttributeNames"].values()))
+        else:
+            reads.append(None)
+        return get_item(kwargs)
+
+    dynamodb._operations["GetItem"] = recorded
+    return reads
+
+
+def write(dynamodb, **values):
+    # written behind the back of the model, its cache is not refreshed
+    item = CachedModel(**values)
+    dynamodb("PutItem", {"TableName": "cache", "Item": item.serialize()})
+    return item
+
+
+class TestModelCache:
+    def test_lru(self, clock):
+        cache = ModelCache(max_items=2, clock=clock)
+        cache.put("a", {"v": {"S": "a"}})
+        cache.put("b", {"v": {"S": "b"}})
+        assert cache.get("a") == {"v": {"S": "a"}}
+        cache.put("c", {"v": {"S": "c"}})
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.evictions) == (3, 1, 1)
+
+    def test_max_size(self, clock):
+        data = {"v": {"S": "x" * 99}}
+        assert item_size(data) == 100
+        cache = ModelCache(max_size=250, clock=clock)
+        for key in "abc":
+            cache.put(key, data)
+        assert len(cache) == 2 and cache.stats().size == 200
+        cache.put("d", {"v": {"S": "x" * 300}})
+        assert cache.get("d") is None
+
+    def test_ttl(self, clock):
+        cache = ModelCache(ttl=5, clock=clock)
+        cache.put("a", {"v": {"S": "a"}})
+        clock.now = 5
+        assert cache.get("a") is None
+        assert cache.stats().expirations == 1 and len(cache) == 0
+
+    def test_revalidate(self, clock):
+        cache = ModelCache(ttl=5, revalidate=True, clock=clock)
+        cache.put("a", {"v": {"S": "a"}}, modified_at="1")
+        clock.now = 5
+        assert cache.get("a", lambda: "1") == {"v": {"S": "a"}}
+        assert cache.get("a", lambda: pytest.fail("fresh again")) is not None
+        clock.now = 10
+        assert cache.get("a", lambda: "2") is None
+        stats = cache.stats()
+        assert (stats.revalidations, stats.expirations) == (1, 1)
+
+    def test_item_size(self):
+        assert item_size({"ab": {"N": "-12.5"}}) == 2 + 2
+        assert item_size({"a": {"L": [{"BOOL": True}, {"S": "xy"}]}}) == 1 + 3 + 2 + 3
+        assert item_size({"a": {"M": {"b": {"NULL": True}}}}) == 1 + 3 + 1 + 1 + 1
+        assert item_size({"a": {"B": "AAAA"}}) == 1 + 3
+
+
+class TestModelReadThrough:
+    def test_get_reads_once(self, dynamodb, reads):
+        write(dynamodb, id="a", value=1)
+        assert CachedModel.get("a").value == 1
+        assert CachedModel.get("a").value == 1
+        assert len(reads) == 1
+        assert CachedModel.get("a") is not CachedModel.get("a")
+
+    def test_missing(self, dynamodb):
+        with pytest.raises(CachedModel.DoesNotExist):
+            CachedModel.get("a")
+        assert len(CachedModel.cache) == 0
+
+    def test_bypass(self, dynamodb, reads):
+        write(dynamodb, id="a", value=1)
+        CachedModel.get("a", attributes_to_get=["value"])
+        assert len(CachedModel.cache) == 0
+        CachedModel.get("a", consistent_read=True)
+        CachedModel.get("a", consistent_read=True)
+        assert len(reads) == 3
+        CachedModel.get("a")
+        assert len(reads) == 3
+
+    def test_save_refreshes(self, reads):
+        CachedModel(id="a", value=1).save()
+        assert CachedModel.get("a").value == 1
+        item = CachedModel.get("a")
+        item.value = 2
+        item.save()
+        assert CachedModel.get("a").value == 2
+        assert reads == []
+
+    def test_update_refreshes(self, dynamodb, reads):
+        write(dynamodb, id="a", value=1)
+        item = CachedModel.get("a")
+        item.update(actions=[CachedModel.value.set(2)])
+        assert CachedModel.get("a").value == 2
+        assert len(reads) == 1
+
+    def test_delete(self, dynamodb):
+        write(dynamodb, id="a", value=1)
+        CachedModel.get("a").delete()
+        assert CachedModel.get("a").is_deleted
+        CachedModel.get("a").delete(force=True)
+        with pytest.raises(CachedModel.DoesNotExist):
+            CachedModel.get("a")
+
+    def test_revalidate(self, dynamodb, reads, clock):
+        CachedModel.cache.revalidate = True
+        write(dynamodb, id="a", value=1)
+        CachedModel.get("a")
+        clock.now = 10
+        assert CachedModel.get("a").value == 1
+        assert reads == [None, ["modified_at"]]
+
+        write(dynamodb, id="a", value=2)
+        clock.now = 20
+        assert CachedModel.get("a").value == 2
+        assert reads[2:] == [["modified_at"], None]
+
+    def test_buffered_writes(self, dynamodb):
+        CachedModel(id="a", value=1).save()
+        with CachedModel.buffered_writer(max_age=None) as writer:
+            writer.save(CachedModel(id="a", value=2))
+            # read before the write lands, cached again
+            assert CachedModel.get("a").value == 1
+            writer.flush()
+            assert CachedModel.get("a").value == 2
@@ -0,0 +1,108 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pynamodb.attributes import UnicodeAttribute
+from pynamodb.indexes import GlobalSecondaryIndex, AllProjection
+
+from pynamodb_templates.attributes import UnicodeUTCDatetimeAttribute
+from pynamodb_templates.memory import MemoryDynamoDB
+from pynamodb_templates.models import ChangeCheckpoint, TimeTrackedModel
+from pynamodb_templates.models._changes import bucket_start
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class ChangeIndex(GlobalSecondaryIndex):
+    class Meta:
+        index_name = "changes"
+        projection = AllProjection()
+
+    modified_bucket = UnicodeAttribute(hash_key=True)
+    modified_at = UnicodeUTCDatetimeAttribute(range_key=True)
+
+
+class ChangeModel(TimeTrackedModel):
+    class Meta:
+        table_name = "changes"
+
+    id = UnicodeAttribute(hash_key=True)
+    modified_bucket = UnicodeAttribute(null=True)
+    change_index = ChangeIndex()
+
+
+@pytest.fixture
+def dynamodb():
+    dynamodb = MemoryDynamoDB()
+    with dynamodb.connect(ChangeModel):
+        ChangeModel.create_table(billing_mode="PAY_PER_REQUEST")
+        yield dynamodb
+
+
+def write(key, modified_at):
+    item = ChangeModel(id=key, modified_at=modified_at)
+    item.save(update_timestamp=False)
+    return item
+
+
+class TestBucketStart:
+    def test_bucket_start(self):
+        value = datetime(2024, 1, 1, 13, 45, 10, 5, tzinfo=timezone.utc)
+        assert bucket_start(value, timedelta(hours=1)) == T0.replace(hour=13)
+        assert bucket_start(value, timedelta(days=1)) == T0
+        kst = timezone(timedelta(hours=9))
+        assert bucket_start(value.astimezone(kst), timedelta(hours=1)) == (
+            T0.replace(hour=13)
+        )
+        assert bucket_start(value.replace(tzinfo=None), timedelta(hours=1)) == (
+            T0.replace(hour=13)
+        )
+
+
+class TestChangeFeed:
+    def test_stamps_bucket(self, dynamodb):
+        item = write("a", T0 + timedelta(minutes=90))
+        assert item.modified_bucket == "2024-01-01T01:00:00+00:00"
+
+    def test_modified_order_across_buckets(self, dynamodb):
+        write("c", T0 + timedelta(hours=2, minutes=1))
+        write("a", T0 + timedelta(minutes=1))
+        write("b", T0 + timedelta(minutes=59))
+        write("old", T0 - timedelta(minutes=1))
+        checkpoint = ChangeCheckpoint(since=T0)
+        until = T0 + timedelta(hours=3)
+        items = list(ChangeModel.changes(checkpoint, until=until))
+        assert [item.id for item in items] == ["a", "b", "c"]
+        assert dynamodb.requests["Query"] == 4
+        assert checkpoint.since == until + timedelta(microseconds=1)
+        assert list(ChangeModel.changes(checkpoint, until=until)) == []
+
+    def test_resume(self, dynamodb):
+        for i in range(5):
+            write(str(i), T0 + timedelta(seconds=i))
+        checkpoint = ChangeCheckpoint(since=T0)
+        until = T0 + timedelta(minutes=1)
+        read = []
+        for item in ChangeModel.changes(checkpoint, until=until, page_size=2):
+            read.append(item.id)
+            if len(read) == 3:
+                break
+        saved = json.loads(json.dumps(checkpoint.to_dict()))
+        checkpoint = ChangeCheckpoint.from_dict(saved)
+        items = ChangeModel.changes(checkpoint, until=until, page_size=2)
+        read.extend(item.id for item in items)
+        # the item being processed when the feed stopped is read again
+        assert read == ["0", "1", "2", "2", "3", "4"]
+
+    def test_soft_deletes(self, dynamodb):
+        write("a", T0).delete()
+        item = ChangeModel.get("a")
+        assert item.is_deleted and item.modified_at == item.deleted_at
+        assert item.modified_bucket == ChangeModel._serialize_change_bucket(
+            item.modified_at
+        )
+        assert item.modified_bucket != ChangeModel._serialize_change_bucket(T0)
+
+    def test_requires_index(self):
+        with pytest.raises(ValueError):
+            next(TimeTrackedModel.changes(ChangeCheckpoint(since=T0)))
@@ -0,0 +1,109 @@
+import gzip
+import json
+from datetime import datetime, timezone
+
+import pytest
+from pynamodb.attributes import BinaryAttribute, NumberAttribute, UnicodeAttribute
+
+from pynamodb_templates.memory import MemoryDynamoDB
+from pynamodb_templates.models import ExportCheckpoint, TimeTrackedModel
+from pynamodb_templates.models._export import CHECKPOINT_FILE
+
+
+class ExportModel(TimeTrackedModel):
+    class Meta:
+        table_name = "export"
+
+    hash = UnicodeAttribute(hash_key=True)
+    range = NumberAttribute(range_key=True)
+    data = BinaryAttribute(null=True)
+
+
+class ImportModel(ExportModel):
+    class Meta:
+        table_name = "import"
+
+
+@pytest.fixture
+def dynamodb():
+    dynamodb = MemoryDynamoDB()
+    with dynamodb.connect(ExportModel, ImportModel):
+        ExportModel.create_table(billing_mode="PAY_PER_REQUEST")
+        ImportModel.create_table(billing_mode="PAY_PER_REQUEST")
+        yield dynamodb
+
+
+def fill(count):
+    for i in range(count):
+        ExportModel(str(i % 7), i, data=bytes([i % 256, 0])).save()
+
+
+def snapshot(model):
+    return {
+        (item.hash, item.range): item.serialize()
+        for item in model.scan(ignore_deleted=False)
+    }
+
+
+class TestExport:
+    def test_round_trip(self, dynamodb, tmp_path):
+        fill(100)
+        ExportModel.get("1", 1).delete()
+        checkpoint = ExportModel.export_to(
+            tmp_path, workers=3, part_items=10, page_size=7
+        )
+        assert checkpoint.done
+        lines = []
+        for path in sorted(tmp_path.glob("*.ndjson.gz")):
+            with gzip.open(path, "rt") as file:
+                part = [json.loads(line) for line in file]
+            # parts are cut at the first page boundary after 10 items
+            assert 0 < len(part) < 10 + 7
+            lines.extend(part)
+        assert len(lines) == 100
+        assert all(set(line) == {"Item"} for line in lines)
+
+        assert ImportModel.import_from(tmp_path, workers=2) == 100
+        # timestamps and tombstones are kept as they are
+        assert snapshot(ImportModel) == snapshot(ExportModel)
+        assert ImportModel.get("1", 1).is_deleted
+        assert ImportModel.get("3", 3).data == bytes([3, 0])
+
+    def test_resume(self, dynamodb, tmp_path):
+        fill(50)
+        scan = dynamodb._operations["Scan"]
+
+        def interrupted(kwargs):
+            if kwargs["Segment"] == 1 and "ExclusiveStartKey" in kwargs:
+                raise RuntimeError("interrupted")
+            return scan(kwargs)
+
+        dynamodb._operations["Scan"] = interrupted
+        with pytest.raises(RuntimeError):
+            ExportModel.export_to(tmp_path, workers=2, part_items=5, page_size=5)
+        dynamodb._operations["Scan"] = scan
+        data = json.loads((tmp_path / CHECKPOINT_FILE).read_text())
+        checkpoint = ExportCheckpoint.from_dict(data)
+        assert not checkpoint.done and checkpoint.parts
+
+        with pytest.raises(ValueError):
+            ExportModel.export_to(tmp_path, total_segments=3)
+        assert ExportModel.export_to(tmp_path, part_items=5, page_size=5).done
+        assert ImportModel.import_from(tmp_path) == 50
+        assert snapshot(ImportModel) == snapshot(ExportModel)
+
+    def test_empty_table(self, dynamodb, tmp_path):
+        checkpoint = ExportModel.export_to(tmp_path, workers=2)
+        assert checkpoint.done
+        assert not list(tmp_path.glob("*.ndjson.gz"))
+        assert ImportModel.import_from(tmp_path) == 0
+
+    def test_keeps_timestamps(self, dynamodb, tmp_path):
+        created = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        item = ExportModel("a", 1)
+        item.created_at = item.modified_at = created
+        item.save(update_timestamp=False)
+        ExportModel.export_to(tmp_path)
+        ImportModel.import_from(tmp_path)
+        imported = ImportModel.get("a", 1)
+        assert imported.created_at == imported.modified_at == created
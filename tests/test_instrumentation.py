@@ -0,0 +1,149 @@
+import gc
+import logging
+
+import pytest
+from botocore.exceptions import ClientError
+from pynamodb.attributes import NumberAttribute, UnicodeAttribute
+from pynamodb.exceptions import PutError
+
+from pynamodb_templates.memory import MemoryDynamoDB
+from pynamodb_templates.models import (
+    Instrumentation,
+    LoggingSink,
+    MetricsAggregator,
+    TimeTrackedModel,
+)
+from pynamodb_templates.models._bulk import call_with_retry
+
+
+class InstrumentedModel(TimeTrackedModel):
+    class Meta:
+        table_name = "instrumented"
+
+    hash = UnicodeAttribute(hash_key=True)
+    range = NumberAttribute(range_key=True)
+    value = NumberAttribute(null=True)
+
+
+@pytest.fixture
+def events():
+    events = []
+    InstrumentedModel.instrumentation = Instrumentation(events.append)
+    dynamodb = MemoryDynamoDB()
+    with dynamodb.connect(InstrumentedModel):
+        InstrumentedModel.create_table(billing_mode="PAY_PER_REQUEST")
+        yield events
+    InstrumentedModel.instrumentation = None
+
+
+class TestInstrumentation:
+    def test_item_operations(self, events):
+        item = InstrumentedModel("a", 1)
+        item.save()
+        InstrumentedModel.get("a", 1)
+        item.update(actions=[InstrumentedModel.value.set(1)])
+        item.delete()
+        with pytest.raises(InstrumentedModel.DoesNotExist):
+            InstrumentedModel.get("a", 2)
+
+        assert [e.operation for e in events] == [
+            "save",
+            "get",
+            "update",
+            "delete",
+            "get",
+        ]
+        save, get, update, delete, missing = events
+        assert save.requests == 1 and save.consumed_capacity == 1
+        assert save.item_size > 0 and save.serialize_time > 0
+        assert get.count == 1 and get.consumed_capacity == 0.5
+        assert get.item_size == save.item_size
+        assert update.error is None and delete.error is None
+        assert missing.error == "DoesNotExist" and missing.count == 0
+        assert all(e.latency >= e.serialize_time for e in events)
+
+    def test_query_pages(self, events):
+        for i in range(5):
+            InstrumentedModel("a", i).save()
+        InstrumentedModel("a", 0).delete()
+        del events[:]
+
+        items = list(InstrumentedModel.query("a", page_size=2))
+        assert len(items) == 4
+        assert [(e.operation, e.scanned_count, e.count) for e in events] == [
+            ("query", 2, 1),
+            ("query", 2, 2),
+            ("query", 1, 1),
+        ]
+        # the filter of soft deleted items read an item for nothing
+        assert sum(e.discarded for e in events) == 1
+
+    def test_half_read_page(self, events):
+        for i in range(3):
+            InstrumentedModel("a", i).save()
+        del events[:]
+
+        results = InstrumentedModel.scan()
+        next(results)
+        assert events == []
+        del results
+        gc.collect()
+        assert [(e.operation, e.count) for e in events] == [("scan", 3)]
+
+    def test_retries(self, events):
+        attempts = []
+
+        def throttled():
+            attempts.append(1)
+            if len(attempts) < 3:
+                error = {"Error": {"Code": "ThrottlingException"}}
+                raise PutError("throttled", ClientError(error, "PutItem"))
+
+        with InstrumentedModel.instrumentation.operation("t", "op"):
+            call_with_retry(throttled, max_retries=5, base_delay=0)
+        assert events[-1].retries == 2
+
+    def test_failing_hook(self, events, caplog):
+        def fail(event):
+            raise RuntimeError()
+
+        InstrumentedModel.instrumentation.add(fail)
+        InstrumentedModel("a", 1).save()
+        assert len(events) == 1
+        assert "instrumentation hook" in caplog.text
+
+
+class TestMetricsAggregator:
+    def test_aggregate(self, events):
+        metrics = MetricsAggregator()
+        InstrumentedModel.instrumentation.add(metrics)
+        for i in range(4):
+            InstrumentedModel("a", i).save()
+        InstrumentedModel("a", 0).delete()
+        list(InstrumentedModel.query("a"))
+
+        stats = metrics.snapshot()
+        assert stats[("instrumented", "save")].operations == 4
+        assert stats[("instrumented", "save")].consumed_capacity == 4
+        assert stats[("instrumented", "query")].discard_ratio == 0.25
+        assert sum(stats[("instrumented", "save")].latency_buckets) == 4
+
+        text = metrics.render()
+        labels = 'table="instrumented",operation="save"'
+        assert f"pynamodb_operations_total{{{labels}}} 4" in text
+        assert f'pynamodb_latency_seconds_bucket{{{labels},le="+Inf"}} 4' in text
+        metrics.reset()
+        assert metrics.snapshot() == {}
+
+
+class TestLoggingSink:
+    def test_wasteful_filter(self, events, caplog):
+        sink = LoggingSink(level=logging.DEBUG, discard_ratio=0.5)
+        InstrumentedModel.instrumentation.add(sink)
+        InstrumentedModel("a", 1).save()
+        InstrumentedModel("a", 1).delete()
+        with caplog.at_level(logging.DEBUG):
+            list(InstrumentedModel.query("a"))
+        record = caplog.records[-1]
+        assert record.levelno == logging.WARNING
+        assert "instrumented query" in record.getMessage()
@@ -0,0 +1,151 @@
+import pickle
+from copy import deepcopy
+from datetime import datetime, timezone
+from enum import Enum, IntFlag
+from typing import NamedTuple
+
+import pytest
+from pynamodb.attributes import NumberAttribute, UnicodeAttribute
+from ulid import ULID
+
+from pynamodb_templates.attributes import (
+    CompressedJSONAttribute,
+    EnumFlagsAttribute,
+    IndexableBooleanAttribute,
+    IntCodec,
+    UnicodeDelimitedTupleAttribute,
+    UnicodeEnumAttribute,
+    UnicodeULIDAttribute,
+    UnicodeUTCDatetimeAttribute,
+)
+from pynamodb_templates.memory import MemoryDynamoDB
+from pynamodb_templates.models import LazyAttributeValues, TimeTrackedModel
+
+
+class Color(Enum):
+    red = "red"
+    blue = "blue"
+
+
+class Permission(IntFlag):
+    read = 1
+    write = 2
+
+
+class Path(NamedTuple):
+    name: str
+    count: int
+
+
+class EagerModel(TimeTrackedModel):
+    class Meta:
+        table_name = "wide"
+
+    hash = UnicodeAttribute(hash_key=True)
+    range = NumberAttribute(range_key=True)
+    ulid = UnicodeULIDAttribute(null=True)
+    color = UnicodeEnumAttribute(Color, null=True)
+    permissions = EnumFlagsAttribute(Permission, null=True)
+    flagged = IndexableBooleanAttribute(sparse=True)
+    seen_at = UnicodeUTCDatetimeAttribute(null=True)
+    path = UnicodeDelimitedTupleAttribute(
+        tuple_type=Path, codecs={"count": IntCodec(4)}, null=True
+    )
+    payload = CompressedJSONAttribute(threshold=16, null=True)
+
+
+class LazyModel(EagerModel):
+    lazy = True
+
+
+class DefaultsModel(TimeTrackedModel):
+    class Meta:
+        table_name = "defaults"
+
+    hash = UnicodeAttribute(hash_key=True)
+    count = NumberAttribute(default=5)
+    lazy = True
+
+
+@pytest.fixture
+def items():
+    with MemoryDynamoDB().connect(EagerModel, LazyModel):
+        EagerModel.create_table(billing_mode="PAY_PER_REQUEST")
+        for i in range(5):
+            EagerModel(
+                "a",
+                i,
+                ulid=ULID(),
+                color=Color.blue,
+                permissions=Permission.read | Permission.write,
+                flagged=i % 2 == 0,
+                seen_at=datetime(2021, 1, i + 1, tzinfo=timezone.utc),
+                path=Path("x", i),
+                payload={"values": list(range(i * 10))},
+            ).save()
+        EagerModel("a", 5).save()
+        yield
+
+
+class TestLazyModel:
+    def test_same_values(self, items):
+        eager = list(EagerModel.query("a"))
+        lazy = list(LazyModel.query("a"))
+        assert all(type(item.attribute_values) is dict for item in eager)
+        assert all(type(item.attribute_values) is LazyAttributeValues for item in lazy)
+        for eager_item, lazy_item in zip(eager, lazy):
+            for name in EagerModel.get_attributes():
+                assert getattr(lazy_item, name) == getattr(eager_item, name)
+            assert lazy_item.serialize() == eager_item.serialize()
+
+    def test_first_access(self, items):
+        item = LazyModel.get("a", 1)
+        assert dict(dict.items(item.attribute_values)) == {"flagged": False}
+        assert item.color is Color.blue
+        assert item.flagged is False
+        assert set(dict.keys(item.attribute_values)) == {"color", "flagged"}
+        eager = EagerModel.get("a", 1).attribute_values
+        assert item.attribute_values.keys() == eager.keys()
+
+    def test_sparse_defaults(self, items):
+        assert LazyModel.get("a", 0).flagged is True
+        item = LazyModel.get("a", 5)
+        assert item.flagged is False
+        assert item.color is None and item.payload is None
+        assert "color" not in item.attribute_values
+
+    def test_stored_over_defaults(self):
+        item = DefaultsModel.from_raw_data({"hash": {"S": "a"}, "count": {"N": "7"}})
+        assert item.attribute_values["count"] == 7
+        assert item.count == 7
+        item = DefaultsModel.from_raw_data({"hash": {"S": "a"}})
+        assert item.attribute_values["count"] == 5
+        with pytest.raises(KeyError):
+            item.attribute_values["missing"]
+
+    def test_writes(self, items):
+        item = LazyModel.get("a", 2)
+        item.color = Color.red
+        item.save()
+        assert EagerModel.get("a", 2).color is Color.red
+        assert EagerModel.get("a", 2).payload == {"values": list(range(20))}
+        item = LazyModel.get("a", 3)
+        item.delete()
+        assert LazyModel.get("a", 3).is_deleted
+        assert [i.range for i in LazyModel.query("a")] == [0, 1, 2, 4, 5]
+
+    def test_copies(self, items):
+        item = LazyModel.get("a", 4)
+        for copy in (deepcopy(item), pickle.loads(pickle.dumps(item))):
+            assert type(copy.attribute_values) is dict
+            assert copy.serialize() == item.serialize()
+
+    def test_errors_on_access(self, items):
+        item = LazyModel.from_raw_data(
+            {"hash": {"S": "a"}, "range": {"N": "9"}, "color": {"S": "green"}}
+        )
+        with pytest.raises(ValueError):
+            item.color
+        with pytest.raises(ValueError):
+            item.color
+        assert item.range == 9
@@ -0,0 +1,185 @@
+import pytest
+from pynamodb.attributes import (
+    BinaryAttribute,
+    ListAttribute,
+    NumberAttribute,
+    NumberSetAttribute,
+    UnicodeAttribute,
+)
+from pynamodb.exceptions import DeleteError, PutError, TableDoesNotExist, UpdateError
+from pynamodb.indexes import GlobalSecondaryIndex, KeysOnlyProjection
+from pynamodb.models import Model
+
+from pynamodb_templates.memory import MemoryDynamoDB
+from pynamodb_templates.memory._backend import MemoryBackendError
+from pynamodb_templates.memory._expressions import (
+    Context,
+    ExpressionError,
+    apply_update,
+    evaluate,
+    parse_condition,
+    parse_update,
+)
+
+
+class ByValue(GlobalSecondaryIndex):
+    class Meta:
+        index_name = "by_value"
+        projection = KeysOnlyProjection()
+
+    value = NumberAttribute(hash_key=True)
+
+
+class MemoryModel(Model):
+    class Meta:
+        table_name = "memory"
+
+    hash = UnicodeAttribute(hash_key=True)
+    range = NumberAttribute(range_key=True)
+    value = NumberAttribute(null=True)
+    tags = NumberSetAttribute(null=True)
+    data = BinaryAttribute(null=True)
+    items = ListAttribute(null=True)
+    by_value = ByValue()
+
+
+@pytest.fixture
+def dynamodb():
+    dynamodb = MemoryDynamoDB()
+    with dynamodb.connect(MemoryModel):
+        MemoryModel.create_table(billing_mode="PAY_PER_REQUEST")
+        yield dynamodb
+
+
+def put(count, hash="a", **attributes):
+    for i in range(count):
+        MemoryModel(hash, i, **attributes).save()
+
+
+class TestExpressions:
+    def test_condition(self):
+        item = {"a": {"N": "3"}, "b": {"S": "xyz"}}
+        item["m"] = {"M": {"c": {"L": [{"N": "1"}]}}}
+        context = Context({"#a": "a"}, {":1": {"N": "1"}, ":p": {"S": "xy"}})
+        expression = "#a BETWEEN :1 AND #a AND begins_with(b, :p) AND m.c[0] = :1"
+        assert evaluate(parse_condition(expression), item, context)
+        assert evaluate(parse_condition("NOT attribute_exists(m.d)"), item, context)
+        condition = parse_condition("size(b) < :1 OR #a IN (:1)")
+        assert not evaluate(condition, item, context)
+
+    def test_invalid(self):
+        with pytest.raises(ExpressionError):
+            parse_condition("a = ")
+        with pytest.raises(ExpressionError):
+            evaluate(parse_condition("a = :missing"), {}, Context())
+
+    def test_update(self):
+        item = {"n": {"N": "1"}, "l": {"L": [{"S": "x"}, {"S": "y"}]}}
+        context = Context(values={":2": {"N": "2.50"}, ":s": {"SS": ["a"]}})
+        actions = parse_update("SET n = n + :2 REMOVE l[0] ADD s :s")
+        updated, names = apply_update(item, actions, context)
+        assert updated["n"] == {"N": "3.5"}
+        assert updated["l"] == {"L": [{"S": "y"}]}
+        assert updated["s"] == {"SS": ["a"]}
+        assert names == ["l", "n", "s"]
+        assert item["n"] == {"N": "1"}
+
+    def test_overlapping_paths(self):
+        with pytest.raises(ExpressionError):
+            apply_update({}, parse_update("SET a = :1 REMOVE a.b"), Context())
+
+
+class TestMemoryDynamoDB:
+    def test_crud(self, dynamodb):
+        MemoryModel("a", 1, value=2, data=b"\x00\xff", items=[1, "x"]).save()
+        item = MemoryModel.get("a", 1)
+        assert (item.value, item.data, item.items) == (2, b"\x00\xff", [1, "x"])
+
+        item.update(actions=[MemoryModel.value.add(3), MemoryModel.tags.add({1, 2})])
+        assert (item.value, item.tags) == (5, {1, 2})
+        item.update(actions=[MemoryModel.tags.delete({1, 2})])
+        assert item.tags is None
+
+        item.delete()
+        assert MemoryModel.count() == 0
+        with pytest.raises(MemoryModel.DoesNotExist):
+            MemoryModel.get("a", 1)
+
+    def test_conditions(self, dynamodb):
+        MemoryModel("a", 1).save()
+        with pytest.raises(PutError) as e:
+            MemoryModel("a", 1).save(condition=MemoryModel.hash.does_not_exist())
+        assert e.value.cause_response_code == "ConditionalCheckFailedException"
+        with pytest.raises(UpdateError):
+            MemoryModel("a", 1).update(
+                actions=[MemoryModel.value.set(1)], condition=MemoryModel.value == 0
+            )
+        with pytest.raises(DeleteError):
+            MemoryModel("a", 2).delete(condition=MemoryModel.hash.exists())
+
+    def test_query(self, dynamodb):
+        put(10)
+        put(2, hash="b")
+        results = MemoryModel.query("a", MemoryModel.range >= 3, limit=3, page_size=2)
+        assert [item.range for item in results] == [3, 4, 5]
+
+        results = MemoryModel.query("a", page_size=3, scan_index_forward=False)
+        assert [item.range for item in results] == list(range(9, -1, -1))
+        assert results.page_iter.total_scanned_count == 10
+
+        results = MemoryModel.query("a", filter_condition=MemoryModel.range < 2)
+        assert [item.range for item in results] == [0, 1]
+        assert MemoryModel.count("a", MemoryModel.range.between(2, 4)) == 3
+
+    def test_index(self, dynamodb):
+        put(3, value=7)
+        put(2, hash="b", value=8)
+        results = list(MemoryModel.by_value.query(7, page_size=1))
+        assert [(item.hash, item.range) for item in results] == [
+            ("a", i) for i in range(3)
+        ]
+        # keys only projection
+        assert results[0].value == 7 and results[0].tags is None
+
+        MemoryModel("a", 0).save()
+        assert MemoryModel.by_value.count(7) == 2
+        assert len(list(MemoryModel.by_value.scan())) == 4
+
+    def test_scan_segments(self, dynamodb):
+        for hash in "abcdefgh":
+            put(3, hash=hash)
+        segments = [
+            {
+                (item.hash, item.range)
+                for item in MemoryModel.scan(segment=i, total_segments=3)
+            }
+            for i in range(3)
+        ]
+        assert sum(map(len, segments)) == 24
+        assert set.union(*segments) == {(h, r) for h in "abcdefgh" for r in range(3)}
+        assert len(list(MemoryModel.scan(page_size=5))) == 24
+
+    def test_batch(self, dynamodb):
+        with MemoryModel.batch_write() as batch:
+            for i in range(60):
+                batch.save(MemoryModel("a", i))
+        assert dynamodb.requests["BatchWriteItem"] == 3
+        keys = [("a", i) for i in range(150)]
+        assert len(list(MemoryModel.batch_get(keys))) == 60
+        assert dynamodb.requests["BatchGetItem"] == 2
+
+    def test_errors(self, dynamodb):
+        with pytest.raises(MemoryBackendError) as e:
+            dynamodb("PutItem", {"TableName": "memory", "Item": {"hash": {"S": "a"}}})
+        assert e.value.code == "ValidationException"
+        with pytest.raises(PutError):
+            MemoryModel("a", 1, data=b"0" * 500 * 1024).save()
+        with pytest.raises(TableDoesNotExist):
+            dynamodb.connection().describe_table("missing")
+
+    def test_expire(self, dynamodb):
+        dynamodb.connection().update_time_to_live("memory", "value")
+        put(2, value=10)
+        put(1, hash="b", value=20)
+        assert dynamodb.expire("memory", now=15) == 2
+        assert [item.hash for item in MemoryModel.scan()] == ["b"]
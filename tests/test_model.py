@@ -1,6 +1,12 @@
-from pynamodb.attributes import UnicodeAttribute
+import time
+from unittest.mock import patch
+
+from pynamodb.attributes import TTLAttribute, UnicodeAttribute
 from pynamodb.constants import PAY_PER_REQUEST_BILLING_MODE
+from pynamodb.exceptions import DeleteError
+from pynamodb.indexes import GlobalSecondaryIndex, AllProjection
 
+from pynamodb_templates.memory import MemoryDynamoDB
 from pynamodb_templates.models import *
 from .setup_dynamodb_local import *
 from .test_attributes import *
@@ -52,3 +58,233 @@ class ModelUnittest(DynamodbLocalTest):
         # check record deleted and filtered properly
         items = [i for i in TimeTrackedTestModel.scan()]
         self.assertTrue(len(items) == 0, msg=str(items))
+
+
+class LiveTestModel(TimeTrackedModel):
+    class Meta:
+        host = "http://localhost:8000"
+        table_name = "live"
+        billing_mode = PAY_PER_REQUEST_BILLING_MODE
+
+    class LiveIndex(GlobalSecondaryIndex):
+        class Meta:
+            index_name = "live"
+            projection = AllProjection()
+            billing_mode = PAY_PER_REQUEST_BILLING_MODE
+
+        live_hash = UnicodeAttribute(hash_key=True)
+        range = UnicodeULIDAttribute(range_key=True)
+
+    hash = UnicodeAttribute(hash_key=True)
+    range = UnicodeULIDAttribute(range_key=True, default=ULID)
+    live_hash = UnicodeAttribute(null=True)
+    live_index = LiveIndex()
+
+
+class TestLiveIndexRouting:
+    def test_routes_to_live_index(self):
+        index_name, condition = LiveTestModel._ignore_deleted(None, None, False)
+        assert index_name == "live"
+        assert condition is None
+
+    def test_consistent_read_keeps_filter(self):
+        index_name, condition = LiveTestModel._ignore_deleted(None, None, True)
+        assert index_name is None
+        assert condition is not None
+
+    def test_other_models_keep_filter(self):
+        index_name, condition = TimeTrackedTestModel._ignore_deleted(None, None, False)
+        assert index_name is None
+        assert condition is not None
+
+
+class TestTimestamps:
+    def test_new_item_single_instant(self):
+        first, second = TimeTrackedTestModel(), TimeTrackedTestModel()
+        assert first.created_at == first.modified_at
+        assert first.created_at.tzinfo is timezone.utc
+        assert first.created_at <= second.created_at
+
+    def test_saved_at_single_instant(self):
+        with MemoryDynamoDB().connect(TimeTrackedTestModel):
+            TimeTrackedTestModel.create_table()
+            item = TimeTrackedTestModel()
+            built_at = item.created_at
+            time.sleep(0.001)
+            item.save()
+            assert item.created_at == item.modified_at > built_at
+            read = TimeTrackedTestModel.get(item.hash)
+            assert read.created_at == read.modified_at == item.created_at
+
+            # saved again, only `modified_at` moves on
+            time.sleep(0.001)
+            read.save()
+            assert read.modified_at > read.created_at == item.created_at
+
+            with TimeTrackedTestModel.buffered_writer() as writer:
+                written = TimeTrackedTestModel()
+                built_at = written.created_at
+                time.sleep(0.001)
+                writer.save(written)
+            read = TimeTrackedTestModel.get(written.hash)
+            assert read.created_at == read.modified_at == written.created_at > built_at
+
+
+class LiveIndexUnittest(DynamodbLocalTest):
+    PYNAMODB_MODEL = [
+        LiveTestModel,
+    ]
+
+    def test_live_index(self):
+        items = [LiveTestModel("a") for _ in range(3)]
+        for item in items:
+            item.save()
+            self.assertEqual(item.live_hash, "a")
+
+        items[0].delete()
+        self.assertIsNone(items[0].live_hash)
+
+        results = LiveTestModel.query("a")
+        self.assertEqual(len(list(results)), 2)
+        self.assertEqual(read_counts(results), (2, 2))
+
+        results = LiveTestModel.query("a", consistent_read=True)
+        self.assertEqual(len(list(results)), 2)
+        self.assertEqual(read_counts(results), (3, 2))
+
+        self.assertEqual(len(list(LiveTestModel.scan())), 2)
+        self.assertEqual(len(list(LiveTestModel.scan(ignore_deleted=False))), 3)
+
+
+class BulkUnittest(DynamodbLocalTest):
+    PYNAMODB_MODEL = [
+        LiveTestModel,
+    ]
+
+    def test_bulk(self):
+        items = [LiveTestModel("bulk") for _ in range(30)]
+        for item in items:
+            item.save()
+        keys = [(item.hash, item.range) for item in items]
+
+        report = LiveTestModel.bulk_soft_delete(keys[:20] + [("bulk", ULID())])
+        self.assertEqual(len(report.succeeded), 20)
+        self.assertEqual(len(report.failed), 1)
+        deleted = [LiveTestModel.get(*key) for key in keys[:20]]
+        self.assertEqual(len({item.deleted_at for item in deleted}), 1)
+        self.assertEqual(len(list(LiveTestModel.query("bulk"))), 10)
+
+        report = LiveTestModel.bulk_restore(keys[:10])
+        self.assertTrue(report.ok)
+        self.assertEqual(len(list(LiveTestModel.query("bulk"))), 20)
+
+        report = LiveTestModel.bulk_hard_delete(keys)
+        self.assertTrue(report.ok)
+        self.assertEqual(len(list(LiveTestModel.scan(ignore_deleted=False))), 0)
+
+
+class RetentionTestModel(TimeTrackedModel):
+    class Meta:
+        host = "http://localhost:8000"
+        table_name = "retention"
+        billing_mode = PAY_PER_REQUEST_BILLING_MODE
+
+    retention = timedelta(days=7)
+
+    hash = UnicodeAttribute(hash_key=True)
+    range = UnicodeULIDAttribute(range_key=True, default=ULID)
+    expires_at = TTLAttribute(null=True)
+
+
+class PurgeTestModel(TimeTrackedModel):
+    class Meta:
+        host = "http://localhost:8000"
+        table_name = "purge"
+        billing_mode = PAY_PER_REQUEST_BILLING_MODE
+
+    retention = timedelta(days=7)
+
+    hash = UnicodeAttribute(hash_key=True)
+
+
+class RetentionUnittest(DynamodbLocalTest):
+    PYNAMODB_MODEL = [
+        RetentionTestModel,
+        PurgeTestModel,
+    ]
+
+    def test_expires_at(self):
+        items = [RetentionTestModel("a") for _ in range(3)]
+        for item in items:
+            item.save()
+            self.assertIsNone(item.expires_at)
+
+        items[0].delete()
+        deleted = RetentionTestModel.get(items[0].hash, items[0].range)
+        expected = deleted.deleted_at.replace(microsecond=0) + timedelta(days=7)
+        self.assertEqual(deleted.expires_at, expected)
+
+        keys = [(item.hash, item.range) for item in items[1:]]
+        RetentionTestModel.bulk_soft_delete(keys)
+        RetentionTestModel.bulk_restore(keys[:1])
+        restored = RetentionTestModel.get(*keys[0])
+        self.assertIsNone(restored.expires_at)
+
+        if self.dynamodb is not None:
+            expired = self.dynamodb.expire("retention", expected.timestamp() + 1)
+            self.assertEqual(expired, 2)
+            items = list(RetentionTestModel.scan(ignore_deleted=False))
+            self.assertEqual(len(items), 1)
+
+    def test_purge_deleted(self):
+        for i in range(60):
+            PurgeTestModel(str(i)).save()
+        PurgeTestModel.bulk_soft_delete([str(i) for i in range(50)])
+
+        report = PurgeTestModel.purge_deleted()
+        self.assertEqual(len(report.succeeded), 0)
+
+        report = PurgeTestModel.purge_deleted(
+            retention=timedelta(0), workers=2, delete_rate_limit=10000
+        )
+        self.assertTrue(report.ok)
+        self.assertEqual(sorted(report.succeeded), sorted(str(i) for i in range(50)))
+        self.assertEqual(len(list(PurgeTestModel.scan(ignore_deleted=False))), 10)
+
+        with self.assertRaises(ValueError):
+            TimeTrackedTestModel.purge_deleted()
+
+    def test_purge_resume(self):
+        keys = [f"{i:03d}" for i in range(300)]
+        for key in keys:
+            PurgeTestModel(key).save()
+        PurgeTestModel.bulk_soft_delete(keys)
+        bulk_hard_delete = PurgeTestModel.bulk_hard_delete
+        checkpoint = ScanCheckpoint(1)
+
+        def purge():
+            return PurgeTestModel.purge_deleted(
+                retention=timedelta(0), workers=1, page_size=10, checkpoint=checkpoint
+            )
+
+        def crash(keys, **kwargs):
+            raise RuntimeError("crashed")
+
+        with patch.object(PurgeTestModel, "bulk_hard_delete", crash):
+            with self.assertRaises(RuntimeError):
+                purge()
+        self.assertEqual(checkpoint.last_evaluated_keys, {})
+
+        def fail_one(keys, **kwargs):
+            report = bulk_hard_delete(keys[:10] + keys[11:], **kwargs)
+            report.add(keys[10], DeleteError("failed"))
+            return report
+
+        with patch.object(PurgeTestModel, "bulk_hard_delete", fail_one):
+            report = purge()
+        self.assertEqual(len(report.failed), 12)
+        self.assertFalse(checkpoint.done)
+
+        report = purge()
+        self.assertTrue(report.ok and checkpoint.done)
+        self.assertEqual(len(list(PurgeTestModel.scan(ignore_deleted=False))), 0)
@@ -0,0 +1,138 @@
+import json
+import threading
+import time
+
+import pytest
+from pynamodb.pagination import ResultIterator
+
+from pynamodb_templates.models import ScanCheckpoint, SharedRateLimiter
+from pynamodb_templates.models._parallel import parallel_scan
+
+
+class FakeMetaTable:
+    def get_key_names(self, index_name=None):
+        return ["id"]
+
+
+class FakeTable:
+    """
+    Pages of `{"id": {"N": ...}}` items split in `segments` by `id % segments`
+    """
+
+    def __init__(self, size, page_size=3, fail_segment=None):
+        self.size = size
+        self.page_size = page_size
+        self.fail_segment = fail_segment
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get_meta_table(self):
+        return FakeMetaTable()
+
+    def scan(self, segment, total_segments, exclusive_start_key=None, **kwargs):
+        with self.lock:
+            self.calls.append((segment, exclusive_start_key, kwargs))
+        if segment == self.fail_segment:
+            raise RuntimeError("segment failed")
+        ids = [i for i in range(self.size) if i % total_segments == segment]
+        if exclusive_start_key is not None:
+            start = int(exclusive_start_key["id"]["N"])
+            ids = [i for i in ids if i > start]
+        page, rest = ids[: self.page_size], ids[self.page_size :]
+        response = {
+            "Items": [{"id": {"N": str(i)}} for i in page],
+            "Count": len(page),
+            "ScannedCount": len(page),
+            "ConsumedCapacity": {"CapacityUnits": 0.5},
+        }
+        if rest:
+            response["LastEvaluatedKey"] = {"id": {"N": str(page[-1])}}
+        return response
+
+    def scanner(self, segment, total_segments, last_evaluated_key, rate_limit):
+        return ResultIterator(
+            self.scan,
+            (),
+            dict(
+                segment=segment,
+                total_segments=total_segments,
+                exclusive_start_key=last_evaluated_key,
+            ),
+            map_fn=lambda item: int(item["id"]["N"]),
+            rate_limit=rate_limit,
+        )
+
+
+class TestParallelScan:
+    def test_all_items(self):
+        table = FakeTable(100)
+        checkpoint = ScanCheckpoint(7)
+        items = list(parallel_scan(table.scanner, workers=3, checkpoint=checkpoint))
+        assert sorted(items) == list(range(100))
+        assert checkpoint.done
+        assert checkpoint.last_evaluated_keys == {}
+
+    def test_resume(self):
+        table = FakeTable(100)
+        checkpoint = ScanCheckpoint(4)
+        seen = []
+        results = parallel_scan(table.scanner, workers=4, checkpoint=checkpoint)
+        for item in results:
+            seen.append(item)
+            if len(seen) == 30:
+                break
+        results.close()
+        assert not checkpoint.done
+
+        saved = json.loads(json.dumps(checkpoint.to_dict()))
+        restored = ScanCheckpoint.from_dict(saved)
+        seen += parallel_scan(table.scanner, workers=2, checkpoint=restored)
+        assert restored.done
+        assert set(seen) == set(range(100))
+        # nothing is repeated but the item in hand when the caller stopped
+        assert len(seen) - len(set(seen)) <= 1
+
+    def test_bounded_queue(self):
+        table = FakeTable(1000, page_size=10)
+        results = parallel_scan(table.scanner, workers=4, max_queued=5)
+        next(results)
+        time.sleep(0.1)
+        # workers are blocked on the full queue instead of reading everything
+        assert len(table.calls) < 4 * 5
+        results.close()
+
+    def test_worker_error(self):
+        table = FakeTable(100, fail_segment=1)
+        with pytest.raises(RuntimeError):
+            list(parallel_scan(table.scanner, workers=2, total_segments=4))
+
+    def test_total_segments_mismatch(self):
+        with pytest.raises(ValueError):
+            list(
+                parallel_scan(
+                    FakeTable(1).scanner,
+                    workers=2,
+                    total_segments=3,
+                    checkpoint=ScanCheckpoint(4),
+                )
+            )
+
+    def test_shared_rate_limit(self):
+        table = FakeTable(40, page_size=2)
+        items = list(parallel_scan(table.scanner, workers=4, rate_limit=1000))
+        assert sorted(items) == list(range(40))
+        assert all(kwargs["return_consumed_capacity"] for _, _, kwargs in table.calls)
+
+
+class TestSharedRateLimiter:
+    def test_consume_from_threads(self):
+        limiter = SharedRateLimiter(10)
+        threads = [
+            threading.Thread(target=lambda: [limiter.consume(1) for _ in range(1000)])
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert limiter._consumed == 4000
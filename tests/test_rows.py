@@ -0,0 +1,102 @@
+from datetime import datetime, timezone
+from enum import Enum
+
+import pytest
+from pynamodb.attributes import NumberAttribute, UnicodeAttribute
+
+from pynamodb_templates.attributes import (
+    CompressedJSONAttribute,
+    IndexableBooleanAttribute,
+    UnicodeEnumAttribute,
+    UnicodeUTCDatetimeAttribute,
+)
+from pynamodb_templates.memory import MemoryDynamoDB
+from pynamodb_templates.models import Instrumentation, TimeTrackedModel, row_type
+
+
+class Color(Enum):
+    red = "red"
+    blue = "blue"
+
+
+class RowModel(TimeTrackedModel):
+    class Meta:
+        table_name = "rows"
+
+    hash = UnicodeAttribute(hash_key=True)
+    range = NumberAttribute(range_key=True)
+    color = UnicodeEnumAttribute(Color, null=True, attr_name="c")
+    flagged = IndexableBooleanAttribute(sparse=True)
+    seen_at = UnicodeUTCDatetimeAttribute(null=True)
+    payload = CompressedJSONAttribute(threshold=16, null=True)
+
+
+@pytest.fixture
+def dynamodb():
+    dynamodb = MemoryDynamoDB()
+    with dynamodb.connect(RowModel):
+        RowModel.create_table(billing_mode="PAY_PER_REQUEST")
+        for i in range(6):
+            RowModel(
+                "ab"[i % 2],
+                i,
+                color=Color.blue if i % 3 else None,
+                flagged=i == 4,
+                seen_at=datetime(2021, 1, i + 1, tzinfo=timezone.utc),
+                payload={"values": list(range(i * 10))},
+            ).save()
+        RowModel.get("a", 2).delete()
+        yield dynamodb
+
+
+class TestRows:
+    def test_same_values(self, dynamodb):
+        names = list(RowModel.get_attributes())
+        rows = list(RowModel.rows(names, ignore_deleted=False))
+        items = list(RowModel.scan(ignore_deleted=False))
+        assert len(rows) == len(items) == 6
+        for row, item in zip(rows, items):
+            assert type(row) is row_type(RowModel, tuple(names))
+            assert row._asdict() == {name: getattr(item, name) for name in names}
+
+    def test_query(self, dynamodb):
+        rows = list(RowModel.rows(["range", "color", "flagged"], "a"))
+        assert rows == [(0, None, False), (4, Color.blue, True)]
+        assert rows[1].color is Color.blue
+        rows = list(
+            RowModel.rows(["range"], "b", RowModel.range > 1, scan_index_forward=False)
+        )
+        assert [row.range for row in rows] == [5, 3]
+        with pytest.raises(AttributeError):
+            rows[0].range = 1
+
+    def test_projection(self, dynamodb):
+        scan = dynamodb._operations["Scan"]
+        requests = []
+
+        def recorded(kwargs):
+            requests.append(kwargs)
+            return scan(kwargs)
+
+        dynamodb._operations["Scan"] = recorded
+        assert len(list(RowModel.rows(["range", "color"]))) == 5
+        names = requests[0]["ExpressionAttributeNames"].values()
+        assert {"range", "c"} <= set(names) and "payload" not in names
+
+    def test_limit_and_errors(self, dynamodb):
+        assert len(list(RowModel.rows(["range"], limit=2))) == 2
+        with pytest.raises(ValueError):
+            RowModel.rows(["missing"])
+        with pytest.raises(ValueError):
+            RowModel.rows(["range"], range_key_condition=RowModel.range > 1)
+
+    def test_instrumented(self, dynamodb):
+        events = []
+        RowModel.instrumentation = Instrumentation(events.append)
+        try:
+            rows = list(RowModel.rows(["range", "seen_at"], "b"))
+        finally:
+            RowModel.instrumentation = None
+        assert [row.range for row in rows] == [1, 3, 5]
+        assert rows[0].seen_at == datetime(2021, 1, 2, tzinfo=timezone.utc)
+        assert [(e.operation, e.count) for e in events] == [("query", 3)]
@@ -0,0 +1,69 @@
+import json
+from decimal import Decimal
+from enum import IntEnum
+
+import pytest
+from ulid import ULID
+
+from pynamodb_templates.attributes.serializer import (
+    serialize_number,
+    deserialize_number,
+)
+
+
+class Level(IntEnum):
+    low = 1
+    high = 2
+
+
+class TestNumberCodec:
+    """
+    Test serialize_number / deserialize_number
+    """
+
+    @pytest.mark.parametrize("value", [0, 1, -1, 2**63, 1.0, 0.5, -1e-7, 1e16])
+    def test_json_compatible(self, value):
+        assert serialize_number(value) == json.dumps(value)
+        assert deserialize_number(json.dumps(value)) == json.loads(json.dumps(value))
+
+    def test_bool(self):
+        assert serialize_number(True) == "1"
+        assert serialize_number(False) == "0"
+
+    def test_int_subclass(self):
+        assert serialize_number(Level.high) == "2"
+
+    def test_decimal(self):
+        value = Decimal("0.12345678901234567890123456789012345678")
+        assert serialize_number(value, strict=True) == str(value)
+
+    def test_ulid_exact(self):
+        for ulid in (ULID(), ULID.from_str("7ZZZZZZZZZZZZZZZZZZZZZZZZZ")):
+            assert deserialize_number(serialize_number(int(ulid))) == int(ulid)
+
+    def test_deserialize_types(self):
+        assert type(deserialize_number("10")) is int
+        assert type(deserialize_number("1.5")) is float
+        assert deserialize_number("1E+2") == 100.0
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            float("nan"),
+            float("inf"),
+            Decimal("NaN"),
+            10**38 + 1,
+            10**126,
+            1e300,
+            Decimal("1E-131"),
+            "1",
+        ],
+    )
+    def test_strict_rejects(self, value):
+        with pytest.raises((ValueError, TypeError)):
+            serialize_number(value, strict=True)
+
+    def test_strict_accepts(self):
+        assert serialize_number(10**40, strict=True) == str(10**40)
+        assert serialize_number(10**38 - 1, strict=True) == str(10**38 - 1)
+        assert serialize_number(Decimal("-9.5E+125"), strict=True) == "-9.5E+125"
@@ -0,0 +1,132 @@
+import threading
+import time
+
+import pytest
+from pynamodb.attributes import UnicodeAttribute, NumberAttribute
+from pynamodb.exceptions import PutError
+
+from pynamodb_templates.memory import MemoryBackendError, MemoryDynamoDB
+from pynamodb_templates.models import TimeTrackedModel
+
+
+class WriterModel(TimeTrackedModel):
+    class Meta:
+        table_name = "writer"
+        base_backoff_ms = 1
+        max_retry_attempts = 3
+
+    id = UnicodeAttribute(hash_key=True)
+    value = NumberAttribute(null=True)
+
+
+class Batches:
+    """
+    Sizes of the `BatchWriteItem` requests, leaving `unprocessed` items
+    unprocessed and throttling the next `throttle` requests
+    """
+
+    def __init__(self, batch_write):
+        self.batch_write = batch_write
+        self.unprocessed = 0
+        self.throttle = 0
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, kwargs):
+        with self.lock:
+            (table_name, requests), = kwargs["RequestItems"].items()
+            self.calls.append(len(requests))
+            if self.throttle:
+                self.throttle -= 1
+                raise MemoryBackendError(
+                    "ProvisionedThroughputExceededException", "throttled"
+                )
+            left = requests[: self.unprocessed]
+            self.unprocessed = max(self.unprocessed - len(left), 0)
+        if len(left) < len(requests):
+            written = {table_name: requests[len(left) :]}
+            self.batch_write({**kwargs, "RequestItems": written})
+        return {"UnprocessedItems": {table_name: left} if left else {}}
+
+
+@pytest.fixture
+def dynamodb():
+    dynamodb = MemoryDynamoDB()
+    with dynamodb.connect(WriterModel):
+        WriterModel.create_table(billing_mode="PAY_PER_REQUEST")
+        yield dynamodb
+
+
+@pytest.fixture
+def batches(dynamodb):
+    batches = Batches(dynamodb._operations["BatchWriteItem"])
+    dynamodb._operations["BatchWriteItem"] = batches
+    return batches
+
+
+def stored():
+    return {item.id: item for item in WriterModel.scan(ignore_deleted=False)}
+
+
+class TestBufferedWriter:
+    def test_chunks_and_timestamps(self, batches):
+        with WriterModel.buffered_writer(max_items=100, max_age=None) as writer:
+            for i in range(130):
+                writer.save(WriterModel(str(i)))
+        items = stored()
+        assert len(items) == 130
+        assert sorted(batches.calls) == [5, 25, 25, 25, 25, 25]
+        for item in items.values():
+            assert item.created_at is not None and item.modified_at is not None
+
+    def test_restamps_modified_at(self, batches):
+        item = WriterModel("a")
+        item.modified_at = item.modified_at.replace(year=2000)
+        with WriterModel.buffered_writer() as writer:
+            writer.save(item)
+        assert WriterModel.get("a").modified_at.year != 2000
+
+        item.modified_at = item.modified_at.replace(year=2000)
+        with WriterModel.buffered_writer(update_timestamp=False) as writer:
+            writer.save(item)
+        assert WriterModel.get("a").modified_at.year == 2000
+
+    def test_latest_item_wins(self, batches):
+        with WriterModel.buffered_writer(max_age=None) as writer:
+            for i in range(10):
+                writer.save(WriterModel("a", value=i))
+        assert WriterModel.get("a").value == 9
+        assert batches.calls == [1]
+
+    def test_same_key_in_flight(self, dynamodb, batches):
+        dynamodb.latency = 0.01
+        with WriterModel.buffered_writer(max_items=1, workers=4) as writer:
+            for i in range(20):
+                writer.save(WriterModel("a", value=i))
+        assert WriterModel.get("a").value == 19
+
+    def test_flush_on_age(self, batches):
+        writer = WriterModel.buffered_writer(max_age=0.05)
+        writer.save(WriterModel("a"))
+        time.sleep(0.2)
+        assert "a" in stored()
+        writer.close()
+
+    def test_unprocessed_retried(self, batches):
+        batches.unprocessed = 10
+        batches.throttle = 1
+        with WriterModel.buffered_writer() as writer:
+            for i in range(25):
+                writer.save(WriterModel(str(i)))
+        assert len(stored()) == 25
+        assert batches.calls == [25, 25, 10]
+
+    def test_failed(self, batches):
+        batches.unprocessed = 1000
+        writer = WriterModel.buffered_writer(max_retries=1)
+        writer.save(WriterModel("a"))
+        with pytest.raises(PutError):
+            writer.close()
+        assert len(writer.failed_operations) == 1
+        with pytest.raises(ValueError):
+            writer.save(WriterModel("b"))